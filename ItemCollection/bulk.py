@@ -0,0 +1,232 @@
+# The bulk file contains the command line tool which imports and exports whole catalogues of items without the GUI
+#
+# Usage:
+#   python -m ItemCollection.bulk import catalogue.csv [--skip-invalid] [--batch-size 10000]
+#   python -m ItemCollection.bulk export catalogue.jsonl
+#
+# Both CSV files (with a header row) and JSON Lines files (one object per line) are supported, chosen by the file
+# extension (.csv, .jsonl or .ndjson) or with --format. Every row has the fields title, item_type, doa, dom and
+# description, with the dates written as YYYY-MM-DD or DD/MM/YYYY. Exported rows also have the id of the item, which
+# is ignored when importing since imported items are always given new ids
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import sys
+import time
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+from ItemCollection import Item
+
+FIELDS: Tuple = ("title", "item_type", "doa", "dom", "description")
+DATE_FORMATS: Tuple = ("%Y-%m-%d", "%d/%m/%Y")
+
+
+# The BulkImportError class is raised when an import is stopped because of invalid rows, without anything being saved
+class BulkImportError(Exception):
+    pass
+
+
+# The file_format function returns the format of a file, "csv" or "jsonl", from its extension
+def file_format(path: str) -> str:
+    if path.lower().endswith(".csv"):
+        return "csv"
+    if path.lower().endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the format of {path}, use --format csv or --format jsonl")
+
+
+# The read_rows function yields the rows of the file one at a time together with their line number, so that a file of
+# any size can be imported without reading all of it first
+def read_rows(infile: TextIO, fmt: str) -> Iterator[Tuple[int, dict]]:
+    if fmt == "csv":
+        reader = csv.DictReader(infile)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(infile, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as error:
+            yield line_number, {"error": f"not valid JSON ({error})"}
+            continue
+        yield line_number, row if isinstance(row, dict) else {"error": "not a JSON object"}
+
+
+# The parse_date function reads a date written in one of the DATE_FORMATS
+def parse_date(text: str) -> Optional[datetime.date]:
+    text = text.strip()
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        pass
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, date_format).date()
+        except ValueError:
+            pass
+    return None
+
+
+# The to_record function checks a row with the same rules as the windows adding an item: the title and description
+# must be filled in and the date of manufacture must not be after the date added to the collection. The type and both
+# dates must also be present
+# It returns the record to import and an empty list, or None and the list of problems with the row
+def to_record(row: dict) -> Tuple[Optional[dict], List[str]]:
+    if "error" in row:
+        return None, [row["error"]]
+
+    errors = []
+    values = {field: str(row.get(field) or "").strip() for field in FIELDS}
+    if not values["title"]:
+        errors.append("Item title is missing.")
+    if not values["description"]:
+        errors.append("Item description is missing.")
+    if not values["item_type"]:
+        errors.append("Item type is missing.")
+    doa = parse_date(values["doa"])
+    dom = parse_date(values["dom"])
+    if doa is None:
+        errors.append(f"Date Added to Collection {values['doa']!r} is not a date.")
+    if dom is None:
+        errors.append(f"Date of Manufacture {values['dom']!r} is not a date.")
+    if doa is not None and dom is not None and dom > doa:
+        errors.append("Date of Manufacture must not be after Date Added to Collection.")
+    if errors:
+        return None, errors
+
+    return {"title": values["title"], "item_type": values["item_type"], "doa": doa, "dom": dom,
+            "description": values["description"]}, []
+
+
+# The import_file function adds the items in the file to the collection and saves the collection once at the end
+# The rows are read and checked one at a time and added to the collection in batches of batch_size, every batch taking
+# a block of ids at once. Types which are not in the TYPE_LIST yet are added to it
+# Invalid rows are reported to errors. Unless skip_invalid is set, a single invalid row stops the import, and the items
+# and types already added are taken out again before anything is saved
+# Returns the number of items imported and the number of invalid rows
+def import_file(path: str, fmt: str = None, batch_size: int = 10000, skip_invalid: bool = False,
+                errors: TextIO = sys.stderr) -> Tuple[int, int]:
+    fmt = fmt or file_format(path)
+    known_types = set(Item.TYPE_LIST)
+    type_count = len(Item.TYPE_LIST)
+    next_id = Item.NEXT_ID
+    imported = 0
+    invalid = 0
+
+    def add(batch: List[dict]) -> int:
+        first_id = Item.reserve_ids(len(batch))
+        for offset, record in enumerate(batch):
+            record["_Item__id"] = first_id + offset
+        return Item.import_records(batch)
+
+    with open(path, newline="" if fmt == "csv" else None, encoding="utf-8-sig") as infile:
+        batch = []
+        for line_number, row in read_rows(infile, fmt):
+            record, problems = to_record(row)
+            if record is None:
+                invalid += 1
+                for problem in problems:
+                    errors.write(f"{path}:{line_number}: {problem}\n")
+                continue
+            if record["item_type"] not in known_types:
+                known_types.add(record["item_type"])
+                Item.TYPE_LIST.append(record["item_type"])
+            batch.append(record)
+            if len(batch) >= batch_size:
+                imported += add(batch)
+                batch = []
+        if batch:
+            imported += add(batch)
+
+    if invalid and not skip_invalid:
+        with Item.COLLECTION.lock.write():
+            if imported:
+                del Item.ITEM_LIST[-imported:]
+            del Item.TYPE_LIST[type_count:]
+            Item.NEXT_ID = next_id
+        raise BulkImportError(f"{invalid} invalid rows in {path}, nothing was imported")
+
+    if len(Item.TYPE_LIST) > type_count:
+        Item.save_types()
+    Item.save_to_file()
+    return imported, invalid
+
+
+# The to_row function returns an item as it is exported to a JSON Lines file
+def to_row(item: Item) -> dict:
+    return {"id": item.id, "title": item.title, "item_type": item.item_type, "doa": item.doa.isoformat(),
+            "dom": item.dom.isoformat(), "description": item.description}
+
+
+# The export_file function writes the given items, by default the whole collection, to the file and returns how many
+# were written
+def export_file(path: str, fmt: str = None, items: Iterable[Item] = None) -> int:
+    fmt = fmt or file_format(path)
+    items = Item.ITEM_LIST if items is None else items
+    count = 0
+    with open(path + ".tmp", "w", newline="" if fmt == "csv" else None, encoding="utf-8") as outfile:
+        if fmt == "csv":
+            writer = csv.writer(outfile)
+            writer.writerow(("id",) + FIELDS)
+            for item in items:
+                writer.writerow((item.id, item.title, item.item_type, item.doa.isoformat(), item.dom.isoformat(),
+                                 item.description))
+                count += 1
+        else:
+            for item in items:
+                outfile.write(json.dumps(to_row(item), ensure_ascii=False))
+                outfile.write("\n")
+                count += 1
+    # The file is only swapped in once it is complete, like the collection files
+    os.replace(path + ".tmp", path)
+    return count
+
+
+# The main function runs the command line tool and returns its exit status
+# The collection is opened the same way as the GUI opens it, with the journal and the binary snapshot enabled
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ItemCollection.bulk",
+                                     description="Import or export the items of the collection in bulk.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="add the items in a CSV or JSON Lines file to the collection")
+    import_parser.add_argument("path")
+    import_parser.add_argument("--format", choices=("csv", "jsonl"))
+    import_parser.add_argument("--batch-size", type=int, default=10000)
+    import_parser.add_argument("--skip-invalid", action="store_true",
+                               help="import the valid rows even when some rows are invalid")
+    export_parser = commands.add_parser("export", help="write the items in the collection to a CSV or JSON Lines file")
+    export_parser.add_argument("path")
+    export_parser.add_argument("--format", choices=("csv", "jsonl"))
+    args = parser.parse_args(argv)
+
+    Item.enable_journal()
+    Item.enable_snapshot()
+    Item.load_types()
+    Item.load_from_file()
+
+    start = time.perf_counter()
+    try:
+        if args.command == "import":
+            count, invalid = import_file(args.path, args.format, args.batch_size, args.skip_invalid)
+            verb = "Imported"
+            if invalid:
+                print(f"Skipped {invalid} invalid rows")
+        else:
+            count = export_file(args.path, args.format)
+            verb = "Exported"
+    except (OSError, ValueError, BulkImportError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - start
+    print(f"{verb} {count} items in {elapsed:.2f} s ({count / elapsed if elapsed else 0:,.0f} rows/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+# The cache file contains the CollectionCache class which decides when the collection has to be read from disk again
+
+
+# The CollectionCache class remembers the signature of the saved collection (for the json files their modification time
+# and size) which matches the items held in memory
+# Loading the collection again is only needed when the signature on disk no longer matches, which means that the files
+# were changed outside of this program. Changes made by this program keep the items in memory up to date themselves
+# The generation counts the changes made to the items in memory, whether loaded from disk or made by this program, so
+# that anything built from the items can tell whether it is out of date
+# The hits and misses count how many loads were skipped and how many had to read the collection from disk
+class CollectionCache:
+    def __init__(self):
+        self.signature = None
+        self.generation: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+
+    # The is_valid method tells whether the items in memory match the collection saved with the given signature and
+    # counts the check as a hit or a miss
+    def is_valid(self, signature) -> bool:
+        if self.matches(signature):
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    # The matches method tells the same as is_valid without counting the check, for callers which only look at whether
+    # the items are up to date and do not load them
+    def matches(self, signature) -> bool:
+        return signature is not None and signature == self.signature
+
+    # The loaded method is called once the collection has been read from disk
+    def loaded(self, signature) -> None:
+        self.signature = signature
+        self.generation += 1
+
+    # The changed method is called when this program changes the items and saves the change to disk
+    # The new signature is only trusted if the items were up to date before the change, otherwise a change made outside
+    # of this program would be hidden
+    def changed(self, signature_before, signature_after) -> None:
+        if signature_before is None or signature_before != self.signature:
+            self.signature = None
+        else:
+            self.signature = signature_after
+        self.generation += 1
+
+    # The invalidate method forces the next load to read the collection from disk
+    def invalidate(self) -> None:
+        self.signature = None
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "generation": self.generation}
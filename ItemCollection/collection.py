@@ -0,0 +1,532 @@
+# The collection file contains the Collection class which holds one collection of items with everything belonging to it:
+# the items and their indexes, the types, the name of the collector and the storage it is saved in
+# The Item class works on a default collection (Item.COLLECTION) through its static methods, which is all the program
+# itself needs. Further collections are made with Collection() and are independent of each other
+
+import atexit
+import datetime
+import gc
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from ItemCollection import instrumentation
+from ItemCollection.cache import CollectionCache
+from ItemCollection.events import TYPES_CHANGED, Event, EventBus
+from ItemCollection.indexes import DateIndex, SearchIndex, TypeIndex
+from ItemCollection.item_list import ItemList
+from ItemCollection.rwlock import RWLock
+from ItemCollection.save_worker import SaveWorker
+from ItemCollection.shards import ShardTracker
+from ItemCollection.statistics import Statistics, differences
+from ItemCollection.storage import JsonStorage, SqliteStorage, Storage
+
+
+# The Collection class holds the items of a collection
+# The items contains the list of all the items in the collection, indexed by id so that lookups do not scan it
+# The items also keep the type_index up to date, which holds the ids and the number of the items of every type, and
+# the search_index, which holds the words in the titles and descriptions of the items, and the doa_index and
+# dom_index, which keep the items sorted by their dates, and the statistics, which count the items by type, by month
+# added and by decade manufactured
+# The types contains the categories which the items can be assorted in
+# The name contains the name/username of the record collector
+# All the loading and saving goes through the storage, which by default keeps the collection in the json files in the
+# data folder (see config). The cache keeps track of whether the items in memory are still the ones saved in the
+# storage, so the collection is only read again when it was changed outside of the program. When the saver is enabled,
+# the saving is done on a background thread instead of on the thread making the changes
+# Every change to the items and the types is emitted on the events bus (see events.py), which the windows subscribe to
+# so that they only update the rows and types affected by the change
+# The collection can be used from several threads at once. Every method reading the items holds the read lock, which
+# any number of threads can hold at the same time, and every method changing them holds the write lock, which keeps
+# out every other thread (see rwlock.py). Changing a field of an item also takes the write lock of its collection
+# The events are emitted while the write lock is held, so the subscribers can read the collection but must not wait for
+# another thread which reads it
+class Collection:
+    def __init__(self, storage: Storage = None):
+        from ItemCollection import Item
+        self.item_class = Item
+        self.lock: RWLock = RWLock()
+        self.events: EventBus = EventBus()
+        self.type_index: TypeIndex = TypeIndex()
+        self.search_index: SearchIndex = SearchIndex()
+        self.doa_index: DateIndex = DateIndex("doa")
+        self.dom_index: DateIndex = DateIndex("dom")
+        self.statistics: Statistics = Statistics()
+        self.items: ItemList = ItemList(indexes=[self.type_index, self.search_index, self.doa_index, self.dom_index,
+                                                 self.statistics], events=self.events)
+        self.types: List[str] = []
+        self.name: str = None
+        self.storage: Storage = storage if storage is not None else JsonStorage()
+        self.cache: CollectionCache = CollectionCache()
+        self.saver: SaveWorker = None
+        self.next_id: int = 1
+
+    # The create method creates an item in this collection and returns it
+    def create(self, title: str, item_type: str, doa: datetime.date, dom: datetime.date, description: str,
+               item_id: int = None):
+        return self.item_class(title, item_type, doa, dom, description, item_id, collection=self)
+
+    # The add method puts an item made by the Item class into the collection, giving it the next id when it has none
+    def add(self, item) -> None:
+        with self.lock.write():
+            self.next_id = max(self.next_id, item.id + 1)
+            item._collection = self
+            self.items.append(item)
+
+    # The changed method is called by an item of the collection after one of its fields was changed, with the write
+    # lock held, so that the indexes can move it
+    def changed(self, item, field: str, old_value) -> None:
+        self.items.changed(item, field, old_value)
+
+    # The reserve_ids method hands out a block of count consecutive ids at once and returns the first of them, so that
+    # items created in bulk do not have to take the next id one at a time
+    def reserve_ids(self, count: int) -> int:
+        with self.lock.write():
+            first = self.next_id
+            self.next_id += count
+            return first
+
+    # The get_by_id method allows the user to recall an item from the collection using the id
+    # This will be used when editing a specific item in the collection
+    # The lookup is a single read of the id index, which a change on another thread cannot leave half done, so it does
+    # without the read lock, which would take ten times as long as the lookup itself
+    def get_by_id(self, item_id: int):
+        return self.items.by_id(item_id)
+
+    # The by_type method returns the items of the given type, in the order they were added, using the type_index
+    # instead of going through all the items. offset and limit return a single page of them
+    def by_type(self, item_type: str, offset: int = 0, limit: int = None) -> List:
+        with self.lock.read():
+            return [self.items.ids[item_id] for item_id in self.type_index.ids(item_type, offset, limit)]
+
+    # The search method returns the items whose title or description contain every word of the query, or words
+    # starting with them, best match first, using the search_index instead of going through all the items
+    def search(self, query: str, limit: int = None) -> List:
+        with self.lock.read():
+            return [self.items.ids[item_id] for item_id in self.search_index.search(query, limit)]
+
+    # The query method returns the items matching all the given conditions
+    # doa and dom are (start, end) date ranges, both included, where a start or end of None leaves that side open, so
+    # that the items manufactured in the 1980s and added this year are found with
+    # query(dom=(date(1980, 1, 1), date(1989, 12, 31)), doa=(date(date.today().year, 1, 1), None))
+    # The matching items are counted in each index, which only takes a binary search or a lookup, and the index with the
+    # fewest matches is the one gone through, in its order, checking the other conditions on each of its items
+    # The candidates are copied while holding the read lock, so that no other thread can change them halfway. The copy
+    # only copies references, the ids of the type index, the entries of a date index or, without any condition, the
+    # list of the items, which took about 13 ms for a million of them. The items are then looked up and checked one at
+    # a time as they are asked for, so that a caller stopping early only pays for the items it took. Items deleted since
+    # are left out, and items edited since are checked with their new values
+    def query(self, doa: Tuple[Optional[datetime.date], Optional[datetime.date]] = None,
+              dom: Tuple[Optional[datetime.date], Optional[datetime.date]] = None,
+              item_type: str = None) -> Iterator:
+        with self.lock.read():
+            candidates = []
+            if doa is not None:
+                candidates.append((self.doa_index.count(*doa), lambda: self.doa_index.ids(*doa)))
+            if dom is not None:
+                candidates.append((self.dom_index.count(*dom), lambda: self.dom_index.ids(*dom)))
+            if item_type is not None:
+                candidates.append((self.type_index.count(item_type), lambda: iter(self.type_index.ids(item_type))))
+            if candidates:
+                ids = min(candidates, key=lambda candidate: candidate[0])[1]()
+            else:
+                items = list(self.items)
+                ids = (x.id for x in items)
+        return self.__matching(ids, Collection.__ordinal_range(doa), Collection.__ordinal_range(dom), item_type)
+
+    def __matching(self, ids: Iterator[int], doa_range: Tuple[int, int], dom_range: Tuple[int, int],
+                   item_type: Optional[str]) -> Iterator:
+        by_id = self.items.ids
+        for item_id in ids:
+            x = by_id.get(item_id)
+            if (x is not None and doa_range[0] <= x._doa <= doa_range[1] and dom_range[0] <= x._dom <= dom_range[1]
+                    and (item_type is None or x._item_type == item_type)):
+                yield x
+
+    @staticmethod
+    def __ordinal_range(dates: Optional[Tuple[Optional[datetime.date], Optional[datetime.date]]]) -> Tuple[int, int]:
+        start, end = dates if dates is not None else (None, None)
+        return (start.toordinal() if start is not None else datetime.date.min.toordinal(),
+                end.toordinal() if end is not None else datetime.date.max.toordinal())
+
+    # The count_by_type method returns the number of items of the given type
+    def count_by_type(self, item_type: str) -> int:
+        with self.lock.read():
+            return self.type_index.count(item_type)
+
+    # The summary method returns the statistics of the collection, the number of items and the number of items by type,
+    # by month added and by decade manufactured, which are kept up to date with every change instead of being counted
+    # (see statistics.py). The dictionary returned must not be changed
+    def summary(self) -> dict:
+        with self.lock.read():
+            return self.statistics.summary()
+
+    # The check_statistics method counts the statistics again from all the items and returns a line for every count
+    # which differs from the one kept up to date, or an empty list if they all match
+    def check_statistics(self) -> List[str]:
+        with self.lock.read():
+            return differences(self.statistics.summary(), Statistics.compute(self.items).summary())
+
+    # The load_types method reads the item types from the storage, by default the type.json file.
+    # The initial file has 4 categories written to the file.
+    # The user has the ability to add more types from the program. These will be added in the json file and loaded with
+    # each program run
+    def load_types(self) -> None:
+        with self.lock.write():
+            self.types.clear()
+            for x in self.storage.load_types():
+                self.types.append(x)
+            self.events.emit(Event(TYPES_CHANGED, self.types))
+
+    # The save_types method saves the types to the storage after the user adds a new type
+    def save_types(self) -> None:
+        with self.lock.write():
+            self.storage.save_types(self.types)
+            self.events.emit(Event(TYPES_CHANGED, self.types))
+
+    # The enable_journal method switches the json storage to journal-backed persistence. The other storages save every
+    # change in place and ignore it, as they do enable_snapshot, while they refuse enable_store and enable_sharding
+    # The changes the journal holds back are written by its timer through flush, so that the cache knows the journal was
+    # written by this program, and the journal is flushed when the program exits so that no pending change is lost
+    def enable_journal(self, **kwargs) -> None:
+        kwargs.setdefault("on_delay", self.flush)
+        self.storage.enable_journal(**kwargs)
+        atexit.register(self.flush)
+
+    # The enable_snapshot method switches the json storage to saving the items in the compact binary snapshot, which is
+    # picked up automatically when the collection is loaded. items.json is kept as the interchange format, written with
+    # export_json
+    def enable_snapshot(self) -> None:
+        self.storage.enable_snapshot()
+
+    # The enable_store method switches the json storage to saving the items in the item store, which holds the same
+    # records as the snapshot together with indexes, so that scripts can look items up in it with open_store (see
+    # store.py) without loading the collection. It is picked up automatically when the collection is loaded
+    def enable_store(self) -> None:
+        self.storage.enable_store()
+
+    # The enable_sharding method switches the json storage to keeping the items in shards of shard_size ids each, which
+    # are read in parallel by up to workers processes (by default one for every core) and written again only when
+    # they were changed. A collection saved in a single file is read as it is and split into shards when next saved
+    def enable_sharding(self, shard_size: int = 100000, workers: int = None) -> None:
+        tracker = ShardTracker(shard_size)
+        self.storage.enable_sharding(tracker, workers)
+        with self.lock.write():
+            self.items.indexes.append(tracker)
+
+    # The export_json method saves all the items in the collection to a json file, by default the items.json file in
+    # the folder of the collection (see export_path in storage.py)
+    def export_json(self, path: str = None) -> None:
+        with self.lock.read():
+            JsonStorage.export_json(path if path is not None else self.storage.export_path(), self.items)
+
+    # The use_directory method switches the collection to the json files in another folder
+    # It should be called before enable_journal and enable_snapshot, which apply to the storage in use
+    def use_directory(self, directory: str) -> None:
+        self.storage = JsonStorage(directory)
+        self.cache.invalidate()
+
+    # The use_sqlite method switches the collection to a SQLite database, by default collection.db in the data folder
+    # The first time the database is used, the collection saved in the current storage is migrated into it
+    def use_sqlite(self, path: str = None) -> None:
+        storage = SqliteStorage(path)
+        if storage.is_empty():
+            self.migrate_to(storage)
+        self.storage = storage
+        self.cache.invalidate()
+
+    # The migrate_to method copies the items, the types and the name saved in the current storage to another storage
+    # The changes left in a journal are part of the saved collection even when the journal was not enabled, so it is
+    # enabled to read them, since otherwise they would be left out of the copy without a word
+    def migrate_to(self, storage: Storage) -> None:
+        if self.storage.has_unread_journal():
+            self.enable_journal()
+            self.cache.invalidate()
+        self.load_from_file()
+        with self.lock.read():
+            storage.save_items(self.items)
+        storage.save_types(self.storage.load_types())
+        name = self.storage.load_name()
+        if name is not None:
+            storage.save_name(name)
+
+    # The enable_background_saving method hands all the saving over to a SaveWorker, so that saving never holds up the
+    # thread making the changes. Changes made within delay seconds of each other are written together
+    # on_saved is called after every write and on_failed with the exception when a write fails, both on the background
+    # thread. Everything still queued is written when the program exits
+    def enable_background_saving(self, delay: float = 0.2, on_saved: Callable[[], None] = None,
+                                 on_failed: Callable[[Exception], None] = None) -> None:
+        self.saver = SaveWorker(self.__write_batch, delay, on_saved, on_failed)
+        atexit.register(self.flush)
+
+    # The save_change method persists a single change ("add", "edit" or "delete") made to the given item
+    # Depending on the storage the change is appended to a journal, saved as a single row or saved with the whole
+    # collection
+    # With background saving a copy of the item is queued instead, so that later changes to the item are not mixed in
+    def save_change(self, op: str, item) -> None:
+        if self.saver is not None:
+            with self.lock.read():
+                copy = item.copy()
+            self.saver.save_change(op, copy)
+            return
+
+        self.__save(lambda: self.__write_change(op, item))
+
+    # The save_changes method persists a batch of changes made with the same operation to the given items at once, with
+    # a single journal write or database transaction
+    def save_changes(self, op: str, items: List) -> None:
+        if not items:
+            return
+        if self.saver is not None:
+            with self.lock.read():
+                copies = [item.copy() for item in items]
+            for copy in copies:
+                self.saver.save_change(op, copy)
+            return
+
+        self.__save(lambda: self.__write_changes([(op, item) for item in items]))
+
+    # The delete_many method deletes the items with the given ids in a single pass over the collection, saves the
+    # deletions at once and returns the deleted items. Ids of items which are not in the collection are ignored
+    def delete_many(self, item_ids) -> List:
+        with self.lock.write():
+            removed = self.items.remove_ids(item_ids)
+            for item in removed:
+                item._collection = None
+        self.save_changes("delete", removed)
+        return removed
+
+    # The set_field method sets one field ("title", "item_type", "doa", "dom" or "description") of the items with the
+    # given ids to value, for example to give many items a new type, saves the edits at once and returns the edited
+    # items. The items are found through the id index, so only the edited items are looked at
+    def set_field(self, item_ids, field: str, value) -> List:
+        if field not in self.item_class.FIELDS:
+            raise ValueError(f"{field} is not a field of an item")
+        with self.lock.write():
+            items = [x for x in (self.items.by_id(item_id) for item_id in item_ids) if x is not None]
+            with self.events.batch():
+                for item in items:
+                    setattr(item, field, value)
+        self.save_changes("edit", items)
+        return items
+
+    # The flush method writes any changes which are still queued or which the storage is still holding back
+    def flush(self) -> None:
+        if self.saver is not None:
+            self.saver.flush()
+        self.__save(self.storage.flush)
+
+    # The save_to_file method saves all the items in the collection to the storage, by default the item.json file
+    def save_to_file(self) -> None:
+        if self.saver is not None:
+            self.saver.save_all()
+            return
+
+        self.__save(self.__write_all)
+
+    # The copy_all method returns copies of all the items in the collection, taken while holding the read lock so that
+    # a save on another thread never mixes the collection from before and after a change. The copies are not part of
+    # the collection
+    def copy_all(self) -> List:
+        with self.lock.read():
+            return [x.copy() for x in self.items]
+
+    # The __write_batch method is run by the SaveWorker on the background thread to write the queued changes
+    # A full save writes copies of the items taken at the time of writing, which also include every queued change, and
+    # the statistics taken at the same time
+    def __write_batch(self, changes: List[Tuple[str, object]], save_all: bool) -> None:
+        def write() -> None:
+            if not save_all:
+                self.storage.save_changes(changes)
+            if save_all or self.storage.needs_full_save():
+                self.storage.begin_save()
+                with self.lock.read():
+                    items = [x.copy() for x in self.items]
+                    summary = self.statistics.summary()
+                self.storage.save_items(items)
+                self.storage.save_statistics(summary)
+            self.storage.flush()
+
+        self.__save(write)
+
+    # The __write_all method saves the whole collection to the storage, together with its statistics
+    def __write_all(self) -> None:
+        with self.lock.read():
+            self.storage.begin_save()
+            self.storage.save_items(self.items)
+            self.storage.save_statistics(self.statistics.summary())
+
+    # The __write_changes method saves a batch of changes to the storage, followed by the whole collection when the
+    # storage asks for it
+    def __write_changes(self, changes: List[Tuple[str, object]]) -> None:
+        self.storage.save_changes(changes)
+        if self.storage.needs_full_save():
+            self.__write_all()
+
+    # The __write_change method saves a single change to the storage, followed by the whole collection when the storage
+    # asks for it
+    def __write_change(self, op: str, item) -> None:
+        self.storage.save_change(op, item)
+        if self.storage.needs_full_save():
+            self.__write_all()
+
+    # The __save method runs a save and lets the cache know that the files on disk were changed by this program, so that
+    # the next load does not read them again
+    def __save(self, save: Callable[[], None]) -> None:
+        with instrumentation.phase("save"):
+            signature_before = self.storage.signature()
+            save()
+            self.cache.changed(signature_before, self.storage.signature())
+
+    # The __from_record method creates an item from a record read from items.json, the snapshot or the journal and adds
+    # it to the collection
+    def __from_record(self, record: dict):
+        item = self.__make_item(record)
+        self.items.append(item)
+        return item
+
+    # The __make_item method creates an item of the collection from a record, without adding it to the collection
+    # The id stored in the record is kept so that ids stay stable across reloads and the changes in the journal refer to
+    # the same items
+    def __make_item(self, record: dict):
+        item_id = record.get("_Item__id")
+        if item_id is None:
+            item_id = self.next_id
+        self.next_id = max(self.next_id, item_id + 1)
+
+        item = self.item_class.from_record(record, item_id)
+        item._collection = self
+        return item
+
+    # The __replay_changes method applies the changes held by the storage, such as the ones in the journal, on top of
+    # the items loaded from it
+    # Replaying is idempotent: an added or edited item replaces any item with the same id and deleting a missing item
+    # does nothing, so the changes left over by a compaction that was interrupted can be safely replayed again
+    # The changes are first folded into the last one made to every id, and are then applied in a single pass: edited
+    # items are replaced at their place, found through a map of the places built once, the deleted items are removed
+    # from the list at once and the added items are put at the end. An item deleted and added again is also moved to the
+    # end, as it would be if the changes were applied one at a time
+    def __replay_changes(self) -> None:
+        changes: Dict[int, Tuple[str, dict, bool]] = {}
+        for op, record in self.storage.load_changes():
+            item_id = record["_Item__id"]
+            # The ids of the items deleted again are not handed out anew either
+            self.next_id = max(self.next_id, item_id + 1)
+            previous = changes.get(item_id)
+            if op == "delete" or (previous is not None and previous[0] == "delete"):
+                changes.pop(item_id, None)
+            changes[item_id] = (op, record, op == "delete" or (previous is not None and previous[2]))
+        if not changes:
+            return
+
+        replaced, removed, added = [], [], []
+        for item_id, (op, record, moved) in changes.items():
+            existing = self.items.by_id(item_id)
+            if op == "delete" or moved:
+                if existing is not None:
+                    removed.append(item_id)
+                if op != "delete":
+                    added.append(record)
+            elif existing is not None:
+                replaced.append(record)
+            else:
+                added.append(record)
+
+        if replaced:
+            positions = {x.id: position for position, x in enumerate(self.items)}
+            for record in replaced:
+                self.items[positions[record["_Item__id"]]] = self.__make_item(record)
+        self.items.remove_ids(removed)
+        for record in added:
+            self.__from_record(record)
+
+    # The load_from_file method retrieves all the items from the storage, by default the item.json if this file is
+    # present
+    # If the files have not been changed since they were last read or written by the program, the items in memory are
+    # already up to date and nothing is read
+    def load_from_file(self) -> None:
+        # While background saves are still being written the items in memory are newer than the files, so they are kept
+        if self.saver is not None and self.saver.busy():
+            return
+        if self.cache.is_valid(self.storage.signature()):
+            instrumentation.count("load.cached", skipped=1)
+            return
+
+        # Loading creates a great many objects none of which can be garbage, so the garbage collector is paused to keep
+        # it from going through the whole growing collection over and over
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with instrumentation.phase("load") as run, self.lock.write(), self.events.batch():
+                for _ in self.__load_batches(1000):
+                    pass
+                run["items"] = len(self.items)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    # The iter_from_file method loads the items from the storage in batches, yielding each batch of new items as soon as
+    # it has been read so that callers can start showing them before the whole file has been parsed
+    # The write lock is held until the last batch has been taken, so that no other thread sees a collection only half
+    # loaded, or adds an item whose id a later batch would load again. Other threads therefore wait for the whole load,
+    # and a caller stopping before the last batch must close the generator, for example with contextlib.closing, to let
+    # them go on. The subscribers of the events are told about the whole load with a single RESET event once it finishes
+    # When the journal is enabled the changes recorded since the last snapshot are replayed after the last batch, so
+    # callers showing the batches as they arrive should refresh once the loading has finished
+    def iter_from_file(self, batch_size: int = 1000) -> Iterator[List]:
+        with self.lock.write(), self.events.batch():
+            yield from self.__load_batches(batch_size)
+
+    # The __load_batches method reads the items from the storage, yielding them in batches, and must be gone through
+    # while holding the write lock
+    # The records are read one at a time, so only the items themselves are kept in memory
+    # When the statistics saved with the items are those of the items read, they are taken up instead of counting the
+    # items again, before the changes are replayed on top of them
+    def __load_batches(self, batch_size: int) -> Iterator[List]:
+        self.items.clear()
+        self.next_id = 1
+        statistics = self.storage.load_statistics(include_changes=False)
+
+        # With instrumentation on, the time spent reading and parsing the records is recorded as "load.read", so that
+        # the rest of the "load" time is the time spent building the items
+        batch = []
+        for record in instrumentation.timed_iter("load.read", self.storage.load_items()):
+            batch.append(self.__from_record(record))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+        if statistics is not None:
+            self.statistics.restore(statistics)
+
+        with instrumentation.phase("load.replay"):
+            self.__replay_changes()
+        self.cache.loaded(self.storage.signature())
+
+    # The import_records method adds the items described by the records (dictionaries with the same keys as to_record,
+    # where the dates can also be date objects) to the collection and returns how many were added
+    # Nothing is saved, so that a bulk import can write the whole collection once at the end with save_to_file
+    def import_records(self, records: Iterable[dict]) -> int:
+        count = 0
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with self.lock.write(), self.events.batch():
+                for record in records:
+                    self.__from_record(record)
+                    count += 1
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return count
+
+    # The load_name method retrieves the record collectors name from the storage, by default the name.json, if it
+    # exists
+    # This name is used for GUI purposes by displaying it on all the windows
+    def load_name(self) -> None:
+        name = self.storage.load_name()
+        if name is not None:
+            self.name = name
+
+    # The save_name method saves the record collectors name to the storage the first time the program is run
+    def save_name(self) -> None:
+        self.storage.save_name(self.name)
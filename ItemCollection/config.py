@@ -0,0 +1,31 @@
+# The config file contains the functions which tell the ItemCollection package where the collection files are kept
+# The package does not depend on the folder the program is started from: by default the files are kept in the
+# UserFiles folder next to the package, and the RETROCOLLECTION_DATA environment variable points it at another folder
+# Optional settings, such as turning on the instrumentation, are read from the settings.json file in the data folder
+
+import json
+import os
+
+DATA_ENV: str = "RETROCOLLECTION_DATA"
+PACKAGE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+
+# The data_dir function returns the folder holding the collection files
+def data_dir() -> str:
+    return os.environ.get(DATA_ENV) or os.path.join(os.path.dirname(PACKAGE_DIR), "UserFiles")
+
+
+# The data_path function returns the path of a file in the data folder
+def data_path(name: str) -> str:
+    return os.path.join(data_dir(), name)
+
+
+# The setting function returns the named setting from settings.json in the data folder, or default if the file or the
+# setting is missing
+def setting(name: str, default=None):
+    try:
+        with open(data_path("settings.json")) as infile:
+            settings = json.load(infile)
+    except (OSError, ValueError):
+        return default
+    return settings.get(name, default) if isinstance(settings, dict) else default
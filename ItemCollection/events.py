@@ -0,0 +1,92 @@
+# The events file contains the EventBus which tells the windows, or anything else subscribed to it, about every change
+# made to the collection, so that they can update only what the change affects instead of showing everything again
+
+from contextlib import contextmanager
+from typing import Callable, FrozenSet, Iterator, List, Optional
+
+ADDED: str = "added"
+UPDATED: str = "updated"
+REMOVED: str = "removed"
+TYPES_CHANGED: str = "types-changed"
+RESET: str = "reset"
+
+
+# The Event class describes one change to the collection
+# kind is one of ADDED, UPDATED, REMOVED, TYPES_CHANGED or RESET
+# items are the items added, updated or removed, or for TYPES_CHANGED all the types as they now are
+# positions are the places of the items in the ITEM_LIST: for ADDED the place of each item once it was added, in the
+# order they were added, for REMOVED the places the items had before they were removed, in increasing order. UPDATED
+# events have no positions
+# fields are the names of the fields changed by an UPDATED event
+# A RESET event means that the whole collection was replaced, for example by loading it again, and carries nothing
+class Event:
+    def __init__(self, kind: str, items: List = (), positions: List[int] = (), fields: FrozenSet[str] = frozenset()):
+        self.kind: str = kind
+        self.items: List = list(items)
+        self.positions: List[int] = list(positions)
+        self.fields: FrozenSet[str] = fields
+
+    def __repr__(self) -> str:
+        return f"Event({self.kind!r}, {len(self.items)} items, fields={sorted(self.fields)})"
+
+
+# The EventBus class passes every event to all the subscribed callbacks, in the order they subscribed
+# Inside a batch the events are held back and passed on when the outermost batch ends. Items added one after the other
+# are passed on as a single ADDED event and consecutive UPDATED events as a single UPDATED event, which holds an item
+# changed in several fields one after the other only once. A batch which replaced the whole collection, or made more
+# than BATCH_LIMIT separate changes, is passed on as a single RESET event instead, since showing everything again is
+# then quicker than going through the changes one by one
+class EventBus:
+    BATCH_LIMIT: int = 1000
+
+    def __init__(self):
+        self.subscribers: List[Callable[[Event], None]] = []
+        self._batching: int = 0
+        self._pending: Optional[List[Event]] = []
+
+    # The subscribe method adds a callback which is called with every event and returns it
+    def subscribe(self, callback: Callable[[Event], None]) -> Callable[[Event], None]:
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[Event], None]) -> None:
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    # The emit method passes the event to the subscribers, or holds it back until the end of the batch
+    # The pending events become None once the batch is to end with a single RESET event
+    def emit(self, event: Event) -> None:
+        if not self._batching:
+            self.__deliver(event)
+            return
+        if self._pending is None:
+            return
+        last = self._pending[-1] if self._pending else None
+        if (last is not None and last.kind == event.kind == ADDED and last.positions and event.positions
+                and last.positions[-1] + 1 == event.positions[0]):
+            last.items.extend(event.items)
+            last.positions.extend(event.positions)
+        elif last is not None and last.kind == event.kind == UPDATED:
+            last.items.extend(x for x in event.items if x is not last.items[-1])
+            last.fields = last.fields | event.fields
+        elif event.kind == RESET or len(self._pending) >= EventBus.BATCH_LIMIT:
+            self._pending = None
+        else:
+            self._pending.append(event)
+
+    # The batch method holds back the events emitted inside a with statement until it ends
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self._batching += 1
+        try:
+            yield
+        finally:
+            self._batching -= 1
+            if not self._batching:
+                pending, self._pending = self._pending, []
+                for event in pending if pending is not None else [Event(RESET)]:
+                    self.__deliver(event)
+
+    def __deliver(self, event: Event) -> None:
+        for callback in list(self.subscribers):
+            callback(event)
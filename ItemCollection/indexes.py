@@ -0,0 +1,268 @@
+# The indexes file contains the secondary indexes which the ItemList keeps up to date as items are added, edited and
+# deleted
+
+import bisect
+import datetime
+import heapq
+import itertools
+import math
+import re
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_WORD = re.compile(r"\w+")
+
+
+# The TypeIndex class keeps, for every item type, the ids of the items of that type in the order they were added
+# The ids are kept as the keys of a dictionary, which remembers their order while still allowing an id to be removed
+# without scanning the others, so finding the items of a type costs only as much as the number of items found
+class TypeIndex:
+    def __init__(self):
+        self.types: Dict[str, Dict[int, None]] = {}
+
+    def add(self, item) -> None:
+        self.types.setdefault(item.item_type, {})[item.id] = None
+
+    def remove(self, item) -> None:
+        self.__discard(item.item_type, item.id)
+
+    def update(self, item, field: str, old_value) -> None:
+        if field != "item_type":
+            return
+        self.__discard(old_value, item.id)
+        self.add(item)
+
+    def clear(self) -> None:
+        self.types.clear()
+
+    def __discard(self, item_type: str, item_id: int) -> None:
+        ids = self.types.get(item_type)
+        if ids is None:
+            return
+        ids.pop(item_id, None)
+        if not ids:
+            del self.types[item_type]
+
+    # The ids method returns the ids of the items of the given type, or only limit of them starting from offset, which
+    # only goes through the ids up to the last one returned
+    def ids(self, item_type: str, offset: int = 0, limit: int = None) -> List[int]:
+        ids = self.types.get(item_type, ())
+        if offset == 0 and limit is None:
+            return list(ids)
+        return list(itertools.islice(ids, offset, None if limit is None else offset + limit))
+
+    # The count method returns the number of items of the given type
+    def count(self, item_type: str) -> int:
+        return len(self.types.get(item_type, ()))
+
+    # The counts method returns the number of items of every type which has at least one item
+    def counts(self) -> Dict[str, int]:
+        return {item_type: len(ids) for item_type, ids in self.types.items()}
+
+
+# The tokenize function splits a text into lower case words
+def tokenize(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+# The SearchIndex class is an inverted index from every word in the titles and descriptions to the items containing it
+# For every word it keeps the ids of the items containing it together with a weight, the number of times the word
+# appears in the item with title words counting TITLE_WEIGHT times, so that items can be ranked without being read
+# The words are also kept in a sorted list, which is only built when the first search needs it, so that all the words
+# starting with a prefix are found by binary search
+# Added items are only put aside until the next search, so that loading a collection does not pay for indexing words
+# which might never be searched. Since searches can run on several threads at once, the items put aside are indexed
+# by one thread at a time
+class SearchIndex:
+    FIELDS: Tuple = ("title", "description")
+    TITLE_WEIGHT: int = 2
+    BULK_SIZE: int = 100
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.documents: int = 0
+        self._words: Optional[List[str]] = None
+        self._pending: Dict[int, object] = {}
+        self._pending_lock = threading.Lock()
+
+    @staticmethod
+    def __weights(field: str, text: str) -> Dict[str, int]:
+        weight = SearchIndex.TITLE_WEIGHT if field == "title" else 1
+        weights: Dict[str, int] = {}
+        for word in tokenize(text):
+            weights[word] = weights.get(word, 0) + weight
+        return weights
+
+    def __add_words(self, item_id: int, weights: Dict[str, int]) -> None:
+        for word, weight in weights.items():
+            ids = self.postings.get(word)
+            if ids is None:
+                ids = self.postings[word] = {}
+                if self._words is not None:
+                    bisect.insort(self._words, word)
+            ids[item_id] = ids.get(item_id, 0) + weight
+
+    def __remove_words(self, item_id: int, weights: Dict[str, int]) -> None:
+        for word, weight in weights.items():
+            ids = self.postings.get(word)
+            if ids is None or item_id not in ids:
+                continue
+            ids[item_id] -= weight
+            if ids[item_id] <= 0:
+                del ids[item_id]
+            if not ids:
+                del self.postings[word]
+                if self._words is not None:
+                    del self._words[bisect.bisect_left(self._words, word)]
+
+    def add(self, item) -> None:
+        self._pending[item.id] = item
+
+    def remove(self, item) -> None:
+        if self._pending.pop(item.id, None) is not None:
+            return
+        self.documents -= 1
+        for field in SearchIndex.FIELDS:
+            self.__remove_words(item.id, SearchIndex.__weights(field, getattr(item, field)))
+
+    def update(self, item, field: str, old_value) -> None:
+        if field not in SearchIndex.FIELDS or item.id in self._pending:
+            return
+        self.__remove_words(item.id, SearchIndex.__weights(field, old_value))
+        self.__add_words(item.id, SearchIndex.__weights(field, getattr(item, field)))
+
+    def clear(self) -> None:
+        self.postings.clear()
+        self.documents = 0
+        self._words = None
+        self._pending.clear()
+
+    # The __index_pending method indexes the words of the items added since the last search
+    # When many items were added the sorted list of words is built again from scratch instead of inserting every new
+    # word into it
+    def __index_pending(self) -> None:
+        if not self._pending:
+            return
+        with self._pending_lock:
+            if len(self._pending) > SearchIndex.BULK_SIZE:
+                self._words = None
+            for item_id, item in self._pending.items():
+                self.documents += 1
+                for field in SearchIndex.FIELDS:
+                    self.__add_words(item_id, SearchIndex.__weights(field, getattr(item, field)))
+            self._pending.clear()
+
+    # The __expand method returns the words which start with the given prefix
+    def __expand(self, prefix: str) -> List[str]:
+        if self._words is None:
+            self._words = sorted(self.postings)
+        start = bisect.bisect_left(self._words, prefix)
+        end = bisect.bisect_left(self._words, prefix + "\uffff", start)
+        return self._words[start:end]
+
+    # The search method returns the ids of the items containing every word of the query, best match first
+    # Every word of the query also matches the words it is the beginning of, so "comm" finds "commodore"
+    # Each matching word adds its weight in the item multiplied by how rare the word is (its inverse document frequency)
+    # to the score of the item. The query words matching the fewest items are looked at first so that the candidates
+    # shrink as fast as possible
+    def search(self, query: str, limit: int = None) -> List[int]:
+        self.__index_pending()
+        terms = []
+        for prefix in set(tokenize(query)):
+            words = self.__expand(prefix)
+            if not words:
+                return []
+            terms.append(words)
+        if not terms:
+            return []
+        terms.sort(key=lambda words: sum(len(self.postings[word]) for word in words))
+
+        scores: Optional[Dict[int, float]] = None
+        for words in terms:
+            term_scores: Dict[int, float] = {}
+            for word in words:
+                ids = self.postings[word]
+                rarity = math.log(1 + self.documents / len(ids))
+                for item_id, weight in ids.items():
+                    if scores is None or item_id in scores:
+                        term_scores[item_id] = term_scores.get(item_id, 0.0) + weight * rarity
+            if scores is not None:
+                term_scores = {item_id: score + scores[item_id] for item_id, score in term_scores.items()}
+            scores = term_scores
+            if not scores:
+                return []
+
+        if limit is not None:
+            return heapq.nsmallest(limit, scores, key=lambda item_id: (-scores[item_id], item_id))
+        return sorted(scores, key=lambda item_id: (-scores[item_id], item_id))
+
+
+# The DateIndex class keeps the items sorted by one of their dates ("doa" or "dom") so that the items falling between
+# two dates are found by binary search
+# Each entry is a single integer made of the date ordinal followed by the item id (ordinal * 2 ** 32 + id), so that the
+# entries sort by date and then by id
+# Added items are only put aside until the next query, which sorts them into the entries all at once, so that loading a
+# collection does not pay for keeping the entries sorted. Edited and deleted items are moved or removed by binary search
+# Like the SearchIndex, the items put aside are sorted in by one querying thread at a time
+class DateIndex:
+    ID_BITS: int = 32
+
+    def __init__(self, field: str):
+        self.field: str = field
+        self._entries: List[int] = []
+        self._pending: Dict[int, object] = {}
+        self._pending_lock = threading.Lock()
+
+    @staticmethod
+    def __entry(date: datetime.date, item_id: int) -> int:
+        return (date.toordinal() << DateIndex.ID_BITS) | item_id
+
+    def __discard(self, entry: int) -> None:
+        position = bisect.bisect_left(self._entries, entry)
+        if position < len(self._entries) and self._entries[position] == entry:
+            del self._entries[position]
+
+    def add(self, item) -> None:
+        self._pending[item.id] = item
+
+    def remove(self, item) -> None:
+        if self._pending.pop(item.id, None) is None:
+            self.__discard(DateIndex.__entry(getattr(item, self.field), item.id))
+
+    def update(self, item, field: str, old_value) -> None:
+        if field != self.field or item.id in self._pending:
+            return
+        self.__discard(DateIndex.__entry(old_value, item.id))
+        bisect.insort(self._entries, DateIndex.__entry(getattr(item, self.field), item.id))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+
+    def __bounds(self, start: Optional[datetime.date], end: Optional[datetime.date]) -> Tuple[int, int]:
+        if self._pending:
+            with self._pending_lock:
+                # Another thread may have sorted them in while this one was waiting
+                if self._pending:
+                    self._entries.extend(DateIndex.__entry(getattr(item, self.field), item_id)
+                                         for item_id, item in self._pending.items())
+                    self._entries.sort()
+                    self._pending.clear()
+        low = 0 if start is None else bisect.bisect_left(self._entries, DateIndex.__entry(start, 0))
+        high = len(self._entries) if end is None else \
+            bisect.bisect_left(self._entries, (end.toordinal() + 1) << DateIndex.ID_BITS, low)
+        return low, high
+
+    # The count method returns the number of items whose date falls between start and end, both included
+    # A missing start or end leaves that side of the range open
+    def count(self, start: Optional[datetime.date], end: Optional[datetime.date]) -> int:
+        low, high = self.__bounds(start, end)
+        return high - low
+
+    # The ids method returns the ids of the items whose date falls between start and end, in date order
+    # The entries in the range are copied at once, which only copies the references to them, and the ids are taken out
+    # of them one at a time as they are asked for, so that they can still be gone through once the index has changed
+    def ids(self, start: Optional[datetime.date], end: Optional[datetime.date]) -> Iterator[int]:
+        low, high = self.__bounds(start, end)
+        mask = (1 << DateIndex.ID_BITS) - 1
+        return (entry & mask for entry in self._entries[low:high])
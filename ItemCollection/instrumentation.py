@@ -0,0 +1,192 @@
+# The instrumentation file contains the timings and counters recorded around loading, saving and refreshing the tables
+# Instrumentation is off unless the RETROCOLLECTION_INSTRUMENT environment variable is set to 1, or "instrumentation"
+# is set to true in the settings.json file of the data folder. While it is off, every phase costs a single check
+# While it is on, every phase is written to instrumentation.log in the data folder, which is rotated once it reaches
+# LOG_SIZE bytes, and the cumulative stats are kept in memory, to be read with stats() or written with dump_stats()
+# The cumulative stats are also written to the log when the program exits
+# Setting RETROCOLLECTION_PROFILE to the name of a phase (for example "load") also profiles every run of that phase with
+# cProfile, writing the profile to profile-<phase>-<time>.prof in the data folder
+
+import atexit
+import cProfile
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional
+from ItemCollection.config import data_path, setting
+
+INSTRUMENT_ENV: str = "RETROCOLLECTION_INSTRUMENT"
+PROFILE_ENV: str = "RETROCOLLECTION_PROFILE"
+LOG_SIZE: int = 1 << 20
+LOG_BACKUPS: int = 3
+
+_enabled: Optional[bool] = None
+_logger: Optional[logging.Logger] = None
+_stats: Dict[str, Dict[str, float]] = {}
+_lock = threading.Lock()
+
+
+# The enabled function tells whether instrumentation is on, reading the environment and the settings only once
+def enabled() -> bool:
+    if _enabled is None:
+        enable(os.environ.get(INSTRUMENT_ENV) == "1" or bool(setting("instrumentation", False)))
+    return _enabled
+
+
+# The enable function turns instrumentation on or off for the rest of the run, whatever the environment and settings say
+def enable(on: bool = True) -> None:
+    global _enabled
+    if on and not _enabled:
+        atexit.register(_dump_at_exit)
+    _enabled = on
+
+
+def _dump_at_exit() -> None:
+    if _enabled and _stats:
+        dump_stats()
+
+
+def _log() -> logging.Logger:
+    global _logger
+    if _logger is None:
+        _logger = logging.getLogger("ItemCollection.instrumentation")
+        _logger.setLevel(logging.INFO)
+        _logger.propagate = False
+        try:
+            handler = logging.handlers.RotatingFileHandler(data_path("instrumentation.log"), maxBytes=LOG_SIZE,
+                                                           backupCount=LOG_BACKUPS)
+        except OSError:
+            handler = logging.NullHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        _logger.addHandler(handler)
+    return _logger
+
+
+# The record function adds one run of a phase to the cumulative stats and to the log
+# The counters, such as the number of items or bytes, are added up over all the runs of the phase
+# Phases are also recorded by the background save worker, so the stats are only changed while holding the lock
+def record(name: str, seconds: float, **counters: float) -> None:
+    with _lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = {"runs": 0, "seconds": 0.0, "max_seconds": 0.0}
+        stats["runs"] += 1
+        stats["seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+        for counter, value in counters.items():
+            stats[counter] = stats.get(counter, 0) + value
+    details = " ".join(f"{counter}={value}" for counter, value in counters.items())
+    _log().info(f"{name} {seconds * 1000:.2f}ms {details}".rstrip())
+
+
+# The count function adds to the counters of a phase without timing anything, for example the bytes read by a storage
+def count(name: str, **counters: float) -> None:
+    if enabled():
+        record(name, 0.0, **counters)
+
+
+# The Phase class times the block of a with statement as a run of the named phase
+# The counters passed to it, or set on it inside the block, are recorded with the run
+class Phase:
+    def __init__(self, name: str, counters: Dict[str, float]):
+        self.name: str = name
+        self.counters: Dict[str, float] = counters
+        self._start: float = 0.0
+        self._profile: Optional[cProfile.Profile] = None
+
+    def __setitem__(self, counter: str, value: float) -> None:
+        self.counters[counter] = value
+
+    def __enter__(self) -> "Phase":
+        if os.environ.get(PROFILE_ENV) == self.name:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        seconds = time.perf_counter() - self._start
+        if exc_info[0] is not None:
+            self.counters["errors"] = 1
+        if self._profile is not None:
+            self._profile.disable()
+            path = data_path(f"profile-{self.name}-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+            self._profile.dump_stats(path)
+            _log().info(f"{self.name} profile written to {path}")
+        record(self.name, seconds, **self.counters)
+
+
+# The NullPhase class stands in for a Phase while instrumentation is off and does nothing
+class NullPhase:
+    def __setitem__(self, counter: str, value: float) -> None:
+        pass
+
+    def __enter__(self) -> "NullPhase":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_PHASE = NullPhase()
+
+
+# The phase function returns the context manager timing a run of the named phase, used as
+#   with instrumentation.phase("load") as run:
+#       ...
+#       run["items"] = len(items)
+def phase(name: str, **counters: float):
+    if not enabled():
+        return _NULL_PHASE
+    return Phase(name, counters)
+
+
+# The timed_iter function passes on the values of an iterable while timing how long producing them took, which is
+# recorded as a run of the named phase once the iterable is used up
+# It is used to tell the time spent reading and parsing the files apart from the time spent building the items
+def timed_iter(name: str, values: Iterable) -> Iterator:
+    if not enabled():
+        return iter(values)
+    return _timed_iter(name, iter(values))
+
+
+def _timed_iter(name: str, iterator: Iterator) -> Iterator:
+    seconds = 0.0
+    produced = 0
+    while True:
+        start = time.perf_counter()
+        try:
+            value = next(iterator)
+        except StopIteration:
+            break
+        finally:
+            seconds += time.perf_counter() - start
+        produced += 1
+        yield value
+    record(name, seconds, values=produced)
+
+
+# The stats function returns the cumulative stats of every phase recorded so far
+def stats() -> Dict[str, Dict[str, float]]:
+    with _lock:
+        return {name: dict(values) for name, values in _stats.items()}
+
+
+# The dump_stats function writes the cumulative stats to the log, and as json to the given file when there is one
+def dump_stats(path: str = None) -> str:
+    current = stats()
+    text = json.dumps(current, indent=2, sort_keys=True)
+    _log().info(f"stats {json.dumps(current, sort_keys=True)}")
+    if path is not None:
+        with open(path, "w") as outfile:
+            outfile.write(text)
+    return text
+
+
+# The reset function forgets the stats recorded so far
+def reset() -> None:
+    with _lock:
+        _stats.clear()
@@ -0,0 +1,131 @@
+# The item list file contains the ItemList class which holds the items of the collection
+
+from typing import Dict, Iterable, List
+from ItemCollection.events import ADDED, REMOVED, RESET, UPDATED, Event, EventBus
+
+
+# The ItemList class is a list of items which also keeps a dictionary from the item id to the item
+# Every method that adds or removes items keeps the dictionary up to date, so that the windows can keep popping items
+# from the list directly while looking up an item by its id never has to scan the list
+# The list also keeps its secondary indexes up to date. An index is any object with the methods add(item),
+# remove(item), update(item, field, old_value) and clear(), which are called whenever an item is added to the list,
+# removed from it or has one of its fields changed
+# The version counts these changes, so that a copy of the items taken while they were being changed can be detected
+# Every change is also emitted as an event on the events bus, when there is one, together with the places of the items
+# added or removed, so that the tables showing the list can insert or remove just those rows
+class ItemList(list):
+    def __init__(self, items: Iterable = (), indexes: List = None, events: EventBus = None):
+        super().__init__()
+        self.ids: Dict[int, object] = {}
+        self.indexes: List = indexes if indexes is not None else []
+        self.events: EventBus = events
+        self.version: int = 0
+        self.extend(items)
+
+    # The by_id method returns the item with the given id or None if there is no such item
+    def by_id(self, item_id: int):
+        return self.ids.get(item_id)
+
+    # The changed method is called by an item when one of its fields is changed, so that the indexes can move it
+    # Items which are not in the list are not indexed and are ignored
+    def changed(self, item, field: str, old_value) -> None:
+        if self.ids.get(item.id) is not item:
+            return
+        self.version += 1
+        for index in self.indexes:
+            index.update(item, field, old_value)
+        self.__emit(UPDATED, [item], fields=frozenset((field,)))
+
+    # The remove_ids method removes all the items with the given ids in a single pass over the list and returns them
+    # Removing them one at a time would move the rest of the list along once for every item removed
+    def remove_ids(self, item_ids) -> List:
+        item_ids = set(item_ids)
+        positions = [position for position, x in enumerate(self) if x.id in item_ids]
+        if not positions:
+            return []
+        removed = [self[position] for position in positions]
+        super().__setitem__(slice(None), [x for x in self if x.id not in item_ids])
+        for item in removed:
+            self.__removed(item)
+        self.__emit(REMOVED, removed, positions)
+        return removed
+
+    # The __emit method emits an event about a change to the list, unless nobody is listening
+    def __emit(self, kind: str, items: List = (), positions: List[int] = (), fields=frozenset()) -> None:
+        if self.events is not None and self.events.subscribers:
+            self.events.emit(Event(kind, items, positions, fields))
+
+    def __added(self, item) -> None:
+        self.version += 1
+        self.ids[item.id] = item
+        for index in self.indexes:
+            index.add(item)
+
+    def __removed(self, item) -> None:
+        if self.ids.get(item.id) is not item:
+            return
+        self.version += 1
+        del self.ids[item.id]
+        for index in self.indexes:
+            index.remove(item)
+
+    def append(self, item) -> None:
+        super().append(item)
+        self.__added(item)
+        self.__emit(ADDED, [item], [len(self) - 1])
+
+    def extend(self, items: Iterable) -> None:
+        for item in items:
+            self.append(item)
+
+    def __iadd__(self, items: Iterable):
+        self.extend(items)
+        return self
+
+    def insert(self, index: int, item) -> None:
+        position = min(max(index if index >= 0 else len(self) + index, 0), len(self))
+        super().insert(position, item)
+        self.__added(item)
+        self.__emit(ADDED, [item], [position])
+
+    def pop(self, index: int = -1):
+        position = index if index >= 0 else len(self) + index
+        item = super().pop(index)
+        self.__removed(item)
+        self.__emit(REMOVED, [item], [position])
+        return item
+
+    def remove(self, item) -> None:
+        position = self.index(item)
+        super().pop(position)
+        self.__removed(item)
+        self.__emit(REMOVED, [item], [position])
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+        self.ids.clear()
+        for index in self.indexes:
+            index.clear()
+        self.__emit(RESET)
+
+    def __setitem__(self, index, value) -> None:
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        added = list(value) if isinstance(index, slice) else [value]
+        super().__setitem__(index, added if isinstance(index, slice) else value)
+        for item in removed:
+            self.__removed(item)
+        for item in added:
+            self.__added(item)
+        self.__emit(RESET)
+
+    def __delitem__(self, index) -> None:
+        if isinstance(index, slice):
+            positions = sorted(range(*index.indices(len(self))))
+        else:
+            positions = [index if index >= 0 else len(self) + index]
+        removed = [self[position] for position in positions]
+        super().__delitem__(index)
+        for item in removed:
+            self.__removed(item)
+        self.__emit(REMOVED, removed, positions)
@@ -0,0 +1,116 @@
+# The journal file contains the Journal class which records single changes to the collection
+# jsonpickle is only imported by the methods using it, since importing it takes longer than importing the rest of
+# the package, which would slow down the start of every script using the collection
+
+import os
+import threading
+from typing import Callable, Iterator, List, Optional, Tuple
+from ItemCollection import instrumentation
+
+
+# The Journal class is an append-only log of the changes made to the collection since the last snapshot was saved
+# Each change is stored as one json line holding the operation ("add", "edit" or "delete") and the item record
+# Changes are buffered and written together (group commit) as soon as group_size changes are pending, or otherwise by a
+# timer group_delay seconds after the first pending change, so a burst of edits costs a single write and fsync and a
+# single edit is on disk within group_delay seconds even when no other change follows
+# The timer calls on_delay on its own thread, by default flush. The collection passes its own flush instead, so that it
+# knows the journal was written by this program and does not read it again
+# The pending changes are guarded by a lock, since the timer writes them on another thread
+# Once compact_after changes have been written the owner is expected to fold the journal back into a snapshot
+class Journal:
+    def __init__(self, path: str, group_size: int = 32, group_delay: float = 0.5, compact_after: int = 1000,
+                 on_delay: Callable[[], None] = None):
+        self.path: str = path
+        self.group_size: int = group_size
+        self.group_delay: float = group_delay
+        self.compact_after: int = compact_after
+        self.on_delay: Callable[[], None] = on_delay if on_delay is not None else self.flush
+        self._pending: List[str] = []
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._written: int = self.__count_records()
+
+    # The __count_records method counts the changes already on disk so that compaction also takes into account the
+    # changes written by previous runs of the program
+    def __count_records(self) -> int:
+        if not os.path.isfile(self.path):
+            return 0
+        with open(self.path) as infile:
+            return sum(1 for line in infile if line.strip())
+
+    # The append method adds a change to the pending group and writes the group once it is full. The first change of a
+    # group starts the timer which writes the group once it is old enough
+    def append(self, op: str, record: dict) -> None:
+        import jsonpickle
+        line = jsonpickle.encode({"op": op, "item": record}, unpicklable=False)
+        with self._lock:
+            self._pending.append(line)
+            if len(self._pending) >= self.group_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.group_delay, self.on_delay)
+                self._timer.daemon = True
+                self._timer.start()
+
+    # The extend method adds a batch of changes and writes them, together with any pending changes, with a single write
+    # and fsync
+    def extend(self, changes: List[Tuple[str, dict]]) -> None:
+        import jsonpickle
+        lines = [jsonpickle.encode({"op": op, "item": record}, unpicklable=False) for op, record in changes]
+        with self._lock:
+            self._pending.extend(lines)
+            self.flush()
+
+    # The __stop_timer method stops the timer of the pending group, once the group is written or dropped
+    def __stop_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    # The flush method writes all the pending changes with a single write and fsync
+    def flush(self) -> None:
+        with self._lock:
+            self.__stop_timer()
+            if not self._pending:
+                return
+
+            data = "\n".join(self._pending) + "\n"
+            with instrumentation.phase("save.journal", changes=len(self._pending), bytes_written=len(data)):
+                with open(self.path, "a") as outfile:
+                    outfile.write(data)
+                    outfile.flush()
+                    os.fsync(outfile.fileno())
+            self._written += len(self._pending)
+            self._pending.clear()
+
+    # The needs_compaction method tells the owner when the journal has grown enough to be folded into a snapshot
+    def needs_compaction(self) -> bool:
+        return self._written + len(self._pending) >= self.compact_after
+
+    # The replay method returns the changes written to the journal in the order they were made
+    # A half written last line, left behind if the program is killed in the middle of a write, is ignored
+    def replay(self) -> Iterator[Tuple[str, dict]]:
+        import jsonpickle
+        self.flush()
+        if not os.path.isfile(self.path):
+            return
+
+        with open(self.path) as infile:
+            for line in infile:
+                if not line.strip():
+                    continue
+                try:
+                    change = jsonpickle.decode(line)
+                except ValueError:
+                    break
+                yield change["op"], change["item"]
+
+    # The truncate method empties the journal once its changes have been folded into a snapshot
+    def truncate(self) -> None:
+        with self._lock:
+            self.__stop_timer()
+            self._pending.clear()
+            with open(self.path, "w") as outfile:
+                outfile.flush()
+                os.fsync(outfile.fileno())
+            self._written = 0
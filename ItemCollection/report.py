@@ -0,0 +1,59 @@
+# The report file prints the statistics of the collection in the data folder (see statistics.py)
+#
+#   python -m ItemCollection.report [--check]
+#
+# The statistics saved with the collection are printed when they are still those of the saved items, so the collection
+# is only loaded when they are not. With --check the collection is always loaded, and both the statistics kept while
+# loading it and the saved ones are compared with the ones counted again from all the items. The exit status is 1 when
+# any of them differ
+
+import argparse
+import sys
+from typing import Dict, List
+from ItemCollection import Item
+from ItemCollection.statistics import Statistics, differences
+
+
+# The report function returns the summary as text, one table after the other
+def report(summary: Dict) -> str:
+    lines = [f"{summary['items']:,} items"]
+    for title, table in (("Type", "by_type"), ("Month added", "by_month"), ("Decade made", "by_decade")):
+        lines.append("")
+        lines.append(title)
+        for key, count in summary[table].items():
+            lines.append(f"  {key:<30} {count:>9,}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ItemCollection.report",
+                                     description="Show the statistics of the collection.")
+    parser.add_argument("--check", action="store_true",
+                        help="load the collection and compare the statistics with the ones counted from all the items")
+    args = parser.parse_args(argv)
+
+    Item.enable_journal()
+    Item.enable_snapshot()
+    saved = Item.STORAGE.load_statistics()
+    if saved is not None and not args.check:
+        print(report(saved))
+        return 0
+
+    Item.load_from_file()
+    print(report(Item.summary()))
+    if not args.check:
+        return 0
+
+    # Both the statistics kept up to date while loading and the ones saved with the collection, if they are still
+    # those of the saved items, have to match the ones counted again from all the items
+    mismatches = Item.check_statistics()
+    if saved is not None:
+        mismatches += [f"saved {line}" for line in differences(saved, Statistics.compute(Item.ITEM_LIST).summary())]
+    for line in mismatches:
+        print(line, file=sys.stderr)
+    print("The statistics differ from a full count" if mismatches else "The statistics match a full count")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
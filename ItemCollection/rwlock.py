@@ -0,0 +1,99 @@
+# The rwlock file contains the RWLock class which lets many threads read a collection at the same time while only one
+# thread at a time changes it
+
+import threading
+
+
+# The RWLock class is a reader-writer lock
+# Any number of threads can hold the read lock at the same time, while the write lock is only held by one thread and
+# only while no thread holds the read lock. A thread waiting for the write lock keeps new readers out, so a steady
+# stream of readers never keeps a writer waiting forever
+# Both locks can be taken again by the thread already holding them, and the thread holding the write lock can also take
+# the read lock, so that methods holding a lock can call each other. A thread holding only the read lock cannot take the
+# write lock, since two threads doing so at the same time would wait for each other forever, and gets a RuntimeError
+# The locks are taken with the with statement, as in "with lock.read():" and "with lock.write():"
+class RWLock:
+    def __init__(self):
+        self._mutex = threading.Lock()
+        self._condition = threading.Condition(self._mutex)
+        self._readers: int = 0
+        self._writer: int = None
+        self._writer_depth: int = 0
+        self._waiting_writers: int = 0
+        self._local = threading.local()
+        self._read = _ReadLock(self)
+        self._write = _WriteLock(self)
+
+    def read(self) -> "_ReadLock":
+        return self._read
+
+    def write(self) -> "_WriteLock":
+        return self._write
+
+    # Reads are far more common than writes, so taking the read lock when no writer holds or waits for the lock only
+    # takes the mutex once, without going through the condition
+    def acquire_read(self) -> None:
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        self._mutex.acquire()
+        if not depth and (self._writer is not None or self._waiting_writers) and self._writer != threading.get_ident():
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+        self._readers += 1
+        self._mutex.release()
+        local.depth = depth + 1
+
+    def release_read(self) -> None:
+        self._local.depth -= 1
+        with self._mutex:
+            self._readers -= 1
+            if not self._readers and self._waiting_writers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if getattr(self._local, "depth", 0):
+                raise RuntimeError("The read lock cannot be turned into the write lock")
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        with self._condition:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._condition.notify_all()
+
+
+# The _ReadLock and _WriteLock classes take and release one side of an RWLock in a with statement
+# They are made once for every lock, since making a context manager for every read would cost more than the read
+class _ReadLock:
+    def __init__(self, lock: RWLock):
+        self.lock: RWLock = lock
+
+    def __enter__(self) -> None:
+        self.lock.acquire_read()
+
+    def __exit__(self, *exc_info) -> None:
+        self.lock.release_read()
+
+
+class _WriteLock:
+    def __init__(self, lock: RWLock):
+        self.lock: RWLock = lock
+
+    def __enter__(self) -> None:
+        self.lock.acquire_write()
+
+    def __exit__(self, *exc_info) -> None:
+        self.lock.release_write()
@@ -0,0 +1,94 @@
+# The save worker file contains the SaveWorker class which saves the collection on a background thread
+
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+
+# The SaveWorker class takes the saving of the collection off the thread which changes it, such as the GUI thread
+# Single changes and full saves are queued and a background thread writes them. Once a save has been asked for, the
+# thread waits delay seconds so that a burst of changes is written in one go, and several full saves asked for in the
+# meantime are written only once, since the last one contains all the others
+# The writing itself is done by the write function, called with the list of (operation, item) changes and whether the
+# whole collection has to be saved. Afterwards on_saved is called, or on_failed with the exception if writing failed,
+# both on the background thread
+class SaveWorker:
+    def __init__(self, write: Callable[[List[Tuple[str, object]], bool], None], delay: float = 0.2,
+                 on_saved: Callable[[], None] = None, on_failed: Callable[[Exception], None] = None):
+        self.write = write
+        self.delay: float = delay
+        self.on_saved: Optional[Callable[[], None]] = on_saved
+        self.on_failed: Optional[Callable[[Exception], None]] = on_failed
+        self._condition = threading.Condition()
+        self._changes: List[Tuple[str, object]] = []
+        self._save_all: bool = False
+        self._writing: bool = False
+        self._flushing: int = 0
+        self._stopped: bool = False
+        self._thread = threading.Thread(target=self.__run, name="SaveWorker", daemon=True)
+        self._thread.start()
+
+    # The save_change method queues a single change ("add", "edit" or "delete")
+    # The item should be a copy taken when the change was made, so that later changes do not leak into this one
+    def save_change(self, op: str, item) -> None:
+        with self._condition:
+            self._changes.append((op, item))
+            self._condition.notify_all()
+
+    # The save_all method queues a save of the whole collection, which also covers all the changes queued before it
+    def save_all(self) -> None:
+        with self._condition:
+            self._changes.clear()
+            self._save_all = True
+            self._condition.notify_all()
+
+    # The busy method tells whether there are saves which have not been written yet
+    def busy(self) -> bool:
+        with self._condition:
+            return self._writing or self._save_all or bool(self._changes)
+
+    # The flush method waits until everything queued so far has been written
+    def flush(self) -> None:
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._writing or self._save_all or self._changes:
+                    self._condition.wait()
+            finally:
+                self._flushing -= 1
+
+    # The stop method writes everything still queued and then stops the background thread
+    def stop(self) -> None:
+        self.flush()
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def __run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and not self._save_all and not self._changes:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                # Changes keep being queued during the delay, unless someone is waiting for them in flush
+                deadline = time.monotonic() + self.delay
+                while not self._flushing and not self._stopped and time.monotonic() < deadline:
+                    self._condition.wait(deadline - time.monotonic())
+                changes, self._changes = self._changes, []
+                save_all, self._save_all = self._save_all, False
+                self._writing = True
+
+            try:
+                self.write(changes, save_all)
+                if self.on_saved is not None:
+                    self.on_saved()
+            except Exception as error:
+                if self.on_failed is not None:
+                    self.on_failed(error)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
@@ -0,0 +1,327 @@
+# The server file contains a small HTTP server which lets several programs, such as the desks of a shop, read and change
+# the same collection at the same time, sending the items as JSON
+#
+# Usage:
+#   python -m ItemCollection.server [--host 127.0.0.1] [--port 8765] [--delay 0.005]
+#
+# Endpoints:
+#   GET    /items?type=Console&offset=0&limit=100   a page of the items, optionally only the items of one type
+#   GET    /items/<id>                              a single item
+#   GET    /types                                   the item types
+#   GET    /statistics                              the number of items by type, month added and decade made
+#   POST   /items                                   adds an item and returns it with its new id
+#   PUT    /items/<id>                              changes the fields given of an item (PATCH does the same)
+#   DELETE /items/<id>                              deletes an item
+#   POST   /items/bulk                              {"create": [...], "update": [...], "delete": [...]} all at once
+#
+# Items are sent as the rows exported by the bulk tool ({"id", "title", "item_type", "doa", "dom", "description"}, with
+# the dates as YYYY-MM-DD) and checked with the same rules. Errors are answered with {"errors": [...]}
+#
+# The server runs on a single asyncio event loop, using only the standard library. Reads are answered straight from the
+# items in memory, so any number of clients are served at once without waiting for each other. Writes are put in a
+# queue and applied one batch at a time by a single writer task. Once a batch is applied the writer waits, without
+# holding up the reads, for the background SaveWorker to save it, and only then answers the requests in the batch, so
+# an answered write is never lost. The writes which arrive while a batch is being saved make up the next batch, so under
+# load many writes are saved together in a single journal write
+
+import argparse
+import asyncio
+import json
+import sys
+from http import HTTPStatus
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from ItemCollection import Item
+from ItemCollection.bulk import to_record, to_row
+
+MAX_BODY: int = 16 << 20
+MAX_LIMIT: int = 1000
+
+
+# The HttpError class is raised by the endpoints to answer with an error status and a list of problems
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, *errors: str):
+        super().__init__(status, errors)
+        self.status: HTTPStatus = status
+        self.errors: List[str] = list(errors) or [status.phrase]
+
+
+# The CollectionServer class answers the HTTP requests for the collection held by the Item class
+# The collection has to be loaded, and background saving enabled with its on_failed method, before it is started
+class CollectionServer:
+    def __init__(self):
+        self._writes: Optional[asyncio.Queue] = None
+        self._save_error: Optional[Exception] = None
+
+    # The on_failed method is called by the SaveWorker when a save fails, so that the writes in it are answered with an
+    # error
+    def on_failed(self, error: Exception) -> None:
+        self._save_error = error
+
+    # The start method starts listening on the given address and the writer task, and returns the asyncio server
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        if Item.SAVER is None:
+            raise RuntimeError("Background saving has to be enabled before the server is started")
+        self._writes = asyncio.Queue()
+        asyncio.get_running_loop().create_task(self.__writer())
+        return await asyncio.start_server(self.handle, host, port)
+
+    # The handle method answers the requests sent over one connection, keeping it open between requests unless the
+    # client asks otherwise
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                    headers = dict((name.strip().lower(), value.strip())
+                                   for name, value in (line.split(":", 1) for line in lines[1:] if line))
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError(f"negative Content-Length {length}")
+                except ValueError:
+                    await self.__respond(writer, HTTPStatus.BAD_REQUEST, {"errors": ["Malformed request"]}, True)
+                    return
+                if length > MAX_BODY:
+                    await self.__respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                         {"errors": ["Request body too large"]}, True)
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except HttpError as error:
+                    status, payload = error.status, {"errors": error.errors}
+                close = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+                await self.__respond(writer, status, payload, close)
+                if close:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def __respond(writer: asyncio.StreamWriter, status: HTTPStatus, payload, close: bool) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n" + ("Connection: close\r\n" if close else "") + "\r\n")
+        writer.write(head.encode("latin-1") + data)
+        await writer.drain()
+
+    # The dispatch method passes the request on to its endpoint and returns the status and the JSON to answer with
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[HTTPStatus, object]:
+        url = urlsplit(target)
+        parts = [part for part in url.path.split("/") if part]
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        if parts == ["types"] and method == "GET":
+            return HTTPStatus.OK, list(Item.TYPE_LIST)
+        if parts == ["statistics"] and method == "GET":
+            return HTTPStatus.OK, Item.summary()
+        if parts == ["items"] and method == "GET":
+            return HTTPStatus.OK, self.list_items(query)
+        if parts == ["items"] and method == "POST":
+            return await self.write(lambda: self.create_item(self.__json(body)))
+        if parts == ["items", "bulk"] and method == "POST":
+            return await self.write(lambda: self.bulk(self.__json(body)))
+        if len(parts) == 2 and parts[0] == "items" and parts[1] != "bulk":
+            item_id = self.__id(parts[1])
+            if method == "GET":
+                return HTTPStatus.OK, to_row(self.__item(item_id))
+            if method in ("PUT", "PATCH"):
+                return await self.write(lambda: self.update_item(item_id, self.__json(body)))
+            if method == "DELETE":
+                return await self.write(lambda: self.delete_item(item_id))
+        if parts and parts[0] in ("items", "types", "statistics"):
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+        raise HttpError(HTTPStatus.NOT_FOUND)
+
+    @staticmethod
+    def __json(body: bytes):
+        try:
+            return json.loads(body.decode("utf-8"))
+        except ValueError as error:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Body is not valid JSON ({error})")
+
+    @staticmethod
+    def __id(text) -> int:
+        try:
+            return int(text)
+        except (TypeError, ValueError):
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"{text!r} is not an item id")
+
+    @staticmethod
+    def __item(item_id: int) -> Item:
+        item = Item.get_by_id(item_id)
+        if item is None:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"There is no item with id {item_id}")
+        return item
+
+    # The list_items method returns a page of the items, of the type given or of every type, together with the total
+    # number of items of that type
+    @staticmethod
+    def list_items(query: dict) -> dict:
+        try:
+            offset = max(int(query.get("offset", 0)), 0)
+            limit = min(max(int(query.get("limit", 100)), 0), MAX_LIMIT)
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "offset and limit must be whole numbers")
+        item_type = query.get("type")
+        if item_type is None:
+            items = Item.ITEM_LIST[offset:offset + limit]
+            total = len(Item.ITEM_LIST)
+        else:
+            items = Item.by_type(item_type, offset, limit)
+            total = Item.count_by_type(item_type)
+        return {"total": total, "offset": offset, "items": [to_row(x) for x in items]}
+
+    # The write method queues a change for the writer task and waits until it has been applied and saved
+    # The change is a function applying it to the collection and returning the status and the JSON to answer with
+    async def write(self, change: Callable[[], Tuple[HTTPStatus, object]]) -> Tuple[HTTPStatus, object]:
+        future = asyncio.get_running_loop().create_future()
+        await self._writes.put((change, future))
+        return await future
+
+    # The __writer method applies the queued changes a batch at a time, waits for each batch to be saved and answers
+    # the requests in it
+    async def __writer(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._writes.get()]
+            while not self._writes.empty():
+                batch.append(self._writes.get_nowait())
+
+            results = []
+            for change, future in batch:
+                try:
+                    results.append((future, change()))
+                except HttpError as error:
+                    results.append((future, error))
+                except Exception as error:
+                    results.append((future, HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, str(error))))
+
+            self._save_error = None
+            await loop.run_in_executor(None, Item.SAVER.flush)
+            for future, result in results:
+                if future.done():
+                    continue
+                if self._save_error is not None and not isinstance(result, HttpError):
+                    result = HttpError(HTTPStatus.SERVICE_UNAVAILABLE,
+                                       f"The change was made but could not be saved: {self._save_error}")
+                if isinstance(result, HttpError):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    # The __checked method checks a row with the rules of the bulk tool and returns the record for it
+    @staticmethod
+    def __checked(row) -> dict:
+        if not isinstance(row, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "An item must be a JSON object")
+        record, errors = to_record(row)
+        if record is None:
+            raise HttpError(HTTPStatus.BAD_REQUEST, *errors)
+        return record
+
+    # The __add_type method adds the type of a record to the TYPE_LIST if it is new
+    @staticmethod
+    def __add_type(item_type: str) -> None:
+        if item_type not in Item.TYPE_LIST:
+            Item.TYPE_LIST.append(item_type)
+            Item.save_types()
+
+    @staticmethod
+    def __create(record: dict) -> Item:
+        CollectionServer.__add_type(record["item_type"])
+        item = Item(record["title"], record["item_type"], record["doa"], record["dom"], record["description"])
+        Item.save_change("add", item)
+        return item
+
+    # The __changed_record method returns the record of an item with the fields given in row changed, checked
+    @staticmethod
+    def __changed_record(item: Item, row) -> dict:
+        if not isinstance(row, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "The changes must be a JSON object")
+        unknown = set(row) - set(Item.FIELDS) - {"id"}
+        if unknown:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown fields: {', '.join(sorted(unknown))}")
+        return CollectionServer.__checked({**to_row(item), **row})
+
+    @staticmethod
+    def __update(item: Item, record: dict) -> Item:
+        CollectionServer.__add_type(record["item_type"])
+        for field in Item.FIELDS:
+            setattr(item, field, record[field])
+        Item.save_change("edit", item)
+        return item
+
+    def create_item(self, row) -> Tuple[HTTPStatus, object]:
+        return HTTPStatus.CREATED, to_row(self.__create(self.__checked(row)))
+
+    def update_item(self, item_id: int, row) -> Tuple[HTTPStatus, object]:
+        item = self.__item(item_id)
+        return HTTPStatus.OK, to_row(self.__update(item, self.__changed_record(item, row)))
+
+    def delete_item(self, item_id: int) -> Tuple[HTTPStatus, object]:
+        Item.delete_many([self.__item(item_id).id])
+        return HTTPStatus.OK, {"deleted": [item_id]}
+
+    # The bulk method checks every change in the request before making any of them, so that a request with an invalid
+    # change changes nothing. The deletions are made in a single pass over the collection
+    def bulk(self, request) -> Tuple[HTTPStatus, object]:
+        if not isinstance(request, dict) or set(request) - {"create", "update", "delete"}:
+            raise HttpError(HTTPStatus.BAD_REQUEST,
+                            'The body must be {"create": [...], "update": [...], "delete": [...]}')
+        creates = [self.__checked(row) for row in request.get("create", [])]
+        updates = []
+        for row in request.get("update", []):
+            item = self.__item(self.__id(row.get("id") if isinstance(row, dict) else None))
+            updates.append((item, self.__changed_record(item, row)))
+        deletes = [self.__item(self.__id(item_id)).id for item_id in request.get("delete", [])]
+
+        created = [to_row(self.__create(record)) for record in creates]
+        updated = [to_row(self.__update(item, record)) for item, record in updates]
+        deleted = [x.id for x in Item.delete_many(deletes)]
+        return HTTPStatus.OK, {"created": created, "updated": updated, "deleted": deleted}
+
+
+async def serve(server: CollectionServer, host: str, port: int) -> None:
+    listener = await server.start(host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+# The main function opens the collection the same way as the GUI opens it, with the journal and the binary snapshot
+# enabled, and serves it until the program is stopped
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m ItemCollection.server",
+                                     description="Serve the collection over HTTP as JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.005,
+                        help="seconds the saver waits for more writes before saving (default: 0.005)")
+    args = parser.parse_args(argv)
+
+    server = CollectionServer()
+    Item.enable_journal()
+    Item.enable_snapshot()
+    Item.load_types()
+    Item.load_from_file()
+    Item.enable_background_saving(args.delay, on_failed=server.on_failed)
+
+    print(f"Serving {len(Item.ITEM_LIST)} items on http://{args.host}:{args.port}")
+    sys.stdout.flush()
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# The shards file contains the classes which keep the collection split over several snapshot files (shards), so that
+# the shards can be read in parallel and only the shards which were changed are written again
+#
+# Items are put in shards by id: shard n holds the items with ids from n * shard_size up to (n + 1) * shard_size - 1,
+# so an item never moves from one shard to another. The shards are binary snapshots (see snapshot.py) kept in the
+# items.shards folder together with manifest.json, which lists the shard files making up the collection and is written
+# last, so a save interrupted halfway never leaves a manifest pointing at shards which do not exist
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set
+from ItemCollection.snapshot import iter_snapshot, write_snapshot
+
+MANIFEST_VERSION: int = 1
+
+
+# The ShardTracker class is an index of the ItemList which remembers which shards were changed since they were written
+# Until the shards on disk are known to match the items in memory, every shard counts as changed (all_dirty)
+class ShardTracker:
+    def __init__(self, shard_size: int):
+        self.shard_size: int = shard_size
+        self.dirty: Set[int] = set()
+        self.all_dirty: bool = True
+
+    def shard(self, item_id: int) -> int:
+        return item_id // self.shard_size
+
+    def add(self, item) -> None:
+        self.dirty.add(self.shard(item.id))
+
+    def remove(self, item) -> None:
+        self.dirty.add(self.shard(item.id))
+
+    def update(self, item, field: str, old_value) -> None:
+        self.dirty.add(self.shard(item.id))
+
+    def clear(self) -> None:
+        self.dirty.clear()
+        self.all_dirty = True
+
+    # The clean method is called once the shards on disk match the items in memory
+    def clean(self) -> None:
+        self.dirty.clear()
+        self.all_dirty = False
+
+    # The take method returns the changed shards, or None if every shard counts as changed, and starts counting the
+    # changes afresh. Changes made from this moment on are kept for the next save
+    def take(self) -> Optional[Set[int]]:
+        dirty = None if self.all_dirty else self.dirty
+        self.dirty = set()
+        self.all_dirty = False
+        return dirty
+
+    # The give_back method puts back the changed shards taken for a save which failed
+    def give_back(self, dirty: Optional[Set[int]]) -> None:
+        if dirty is None:
+            self.all_dirty = True
+        else:
+            self.dirty |= dirty
+
+
+# The read_shard function returns all the records in a shard. It runs in the worker processes, so it has to be a
+# function at the top of the module
+def read_shard(path: str) -> List[dict]:
+    return list(iter_snapshot(path))
+
+
+# The ShardSet class reads and writes the shards in a folder
+class ShardSet:
+    def __init__(self, directory: str, tracker: ShardTracker, workers: int = None):
+        self.directory: str = directory
+        self.tracker: ShardTracker = tracker
+        self.workers: int = workers if workers is not None else (os.cpu_count() or 1)
+
+    def path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    @property
+    def manifest_path(self) -> str:
+        return self.path("manifest.json")
+
+    # The manifest method returns the shard number and file name of every shard, or None if no shards were saved
+    def manifest(self) -> Optional[Dict[int, str]]:
+        try:
+            with open(self.manifest_path) as infile:
+                manifest = json.load(infile)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("shard_size") != self.tracker.shard_size:
+            return None
+        return {int(shard): file_name for shard, file_name in manifest["shards"].items()}
+
+    # The load_items method yields the records of all the shards, shard after shard
+    # When there are several shards and more than one core, the shards are read and decoded in worker processes at the
+    # same time and the records are passed back to be built into items here. Once all the records have been read the
+    # tracker is told that the shards match the items
+    def load_items(self) -> Iterator[dict]:
+        manifest = self.manifest() or {}
+        paths = [self.path(manifest[shard]) for shard in sorted(manifest)]
+        if len(paths) > 1 and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(paths))) as executor:
+                for records in executor.map(read_shard, paths):
+                    yield from records
+        else:
+            for path in paths:
+                yield from iter_snapshot(path)
+        self.tracker.clean()
+
+    # The save_items method writes the shards holding the changed items, or every shard when dirty is None, followed
+    # by the manifest, and returns the number of bytes written. Shards which no longer hold any item are removed
+    def save_items(self, items: List, dirty: Optional[Set[int]]) -> int:
+        os.makedirs(self.directory, exist_ok=True)
+        shards: Dict[int, List] = {}
+        for item in items:
+            shards.setdefault(self.tracker.shard(item.id), []).append(item)
+        old_manifest = self.manifest() or {}
+
+        written = 0
+        for shard, shard_items in shards.items():
+            if dirty is None or shard in dirty or shard not in old_manifest:
+                shard_path = self.path(f"items-{shard}.snapshot")
+                write_snapshot(shard_path, shard_items)
+                written += os.path.getsize(shard_path)
+
+        manifest = {"version": MANIFEST_VERSION, "shard_size": self.tracker.shard_size,
+                    "shards": {str(shard): f"items-{shard}.snapshot" for shard in sorted(shards)}}
+        with open(self.manifest_path + ".tmp", "w") as outfile:
+            json.dump(manifest, outfile)
+        os.replace(self.manifest_path + ".tmp", self.manifest_path)
+
+        for shard, file_name in old_manifest.items():
+            if shard not in shards:
+                os.remove(self.path(file_name))
+        return written
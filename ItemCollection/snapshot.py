@@ -0,0 +1,76 @@
+# The snapshot file contains the functions which save and read the collection in a compact binary format
+# The binary snapshot is much quicker to read than items.json since nothing has to be parsed: every field is stored
+# with its length in front of it and the dates are stored as ordinal numbers
+#
+# Layout (all numbers little endian):
+#   header   "RCOL", version (2 bytes), number of types (2 bytes), number of items (4 bytes)
+#   types    for every type: length (2 bytes) followed by the type in utf-8
+#   items    for every item: id (4 bytes), doa ordinal (4 bytes), dom ordinal (4 bytes), type number (2 bytes),
+#            title length (4 bytes), description length (4 bytes), followed by the title and the description in utf-8
+
+import os
+import struct
+from typing import Dict, Iterator, List
+
+MAGIC = b"RCOL"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHI")
+_TYPE = struct.Struct("<H")
+_ITEM = struct.Struct("<IIIHII")
+
+
+# The write_snapshot function saves the items to the file at path
+# The file is written to a temporary file first and then swapped in, so that a crash never leaves half a snapshot behind
+def write_snapshot(path: str, items: List) -> None:
+    types: Dict[str, int] = {}
+    for item in items:
+        types.setdefault(item.item_type, len(types))
+
+    parts = [_HEADER.pack(MAGIC, VERSION, len(types), len(items))]
+    for item_type in types:
+        encoded = item_type.encode("utf-8")
+        parts.append(_TYPE.pack(len(encoded)))
+        parts.append(encoded)
+    for item in items:
+        title = item.title.encode("utf-8")
+        description = item.description.encode("utf-8")
+        parts.append(_ITEM.pack(item.id, item.doa.toordinal(), item.dom.toordinal(), types[item.item_type],
+                                len(title), len(description)))
+        parts.append(title)
+        parts.append(description)
+
+    with open(path + ".tmp", "wb") as outfile:
+        outfile.write(b"".join(parts))
+    os.replace(path + ".tmp", path)
+
+
+# The iter_snapshot function yields the records saved in the file at path, with the dates left as ordinal numbers
+def iter_snapshot(path: str) -> Iterator[dict]:
+    with open(path, "rb") as infile:
+        data = infile.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a collection snapshot")
+    magic, version, type_count, item_count = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a collection snapshot")
+    if version != VERSION:
+        raise ValueError(f"{path} is a version {version} snapshot, only version {VERSION} can be read")
+
+    offset = _HEADER.size
+    types = []
+    for _ in range(type_count):
+        (length,) = _TYPE.unpack_from(data, offset)
+        offset += _TYPE.size
+        types.append(data[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    for _ in range(item_count):
+        item_id, doa, dom, item_type, title_length, description_length = _ITEM.unpack_from(data, offset)
+        offset += _ITEM.size
+        title = data[offset:offset + title_length].decode("utf-8")
+        offset += title_length
+        description = data[offset:offset + description_length].decode("utf-8")
+        offset += description_length
+        yield {"_Item__id": item_id, "title": title, "item_type": types[item_type], "doa": doa, "dom": dom,
+               "description": description}
@@ -0,0 +1,159 @@
+# The statistics file contains the Statistics class which keeps the summaries of a collection up to date: the number of
+# items of every type, the number of items added in every month and the number of items manufactured in every decade
+# Asking for them never goes through the items, so the statistics of a collection of any size are shown at once
+# The report file prints them from the command line
+
+import datetime
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List
+
+
+# The Statistics class is an index of the ItemList which counts the items by type, by month added and by decade
+# manufactured, and keeps the counts up to date as items are edited and deleted, so that asking for them never goes
+# through the items
+# Added items are only put aside until the counts are next asked for, and are then counted all at once, which is several
+# times quicker than counting them one at a time and keeps loading a collection from paying for counts which might never
+# be asked for. When the statistics saved with a collection are those of the items loaded, they are taken up with
+# restore instead of counting the items again. Since the counts can be asked for on several threads at once, the items
+# put aside are counted by one thread at a time
+# The items keep their dates as ordinal numbers, and the month and decade of every ordinal seen are kept, so that a date
+# only has to be made for the first item of every day. The summary of the counts is kept until the next change
+class Statistics:
+    def __init__(self):
+        self.items: int = 0
+        self.types: Dict[str, int] = {}
+        self.months: Dict[str, int] = {}
+        self.decades: Dict[str, int] = {}
+        self._summary: Dict = None
+        self._months: Dict[int, str] = {}
+        self._decades: Dict[int, str] = {}
+        self._pending: Dict[int, object] = {}
+        self._pending_lock = threading.Lock()
+
+    @staticmethod
+    def __count(counts: Dict, key, step: int) -> None:
+        count = counts.get(key, 0) + step
+        if count:
+            counts[key] = count
+        else:
+            del counts[key]
+
+    # The __month method returns the month ("YYYY-MM") of the day with the given ordinal
+    def __month(self, ordinal: int) -> str:
+        month = self._months.get(ordinal)
+        if month is None:
+            date = datetime.date.fromordinal(ordinal)
+            month = self._months[ordinal] = f"{date.year:04d}-{date.month:02d}"
+        return month
+
+    # The __decade method returns the decade ("1980s") of the day with the given ordinal
+    def __decade(self, ordinal: int) -> str:
+        decade = self._decades.get(ordinal)
+        if decade is None:
+            decade = self._decades[ordinal] = f"{datetime.date.fromordinal(ordinal).year // 10 * 10}s"
+        return decade
+
+    def add(self, item) -> None:
+        self._pending[item.id] = item
+        self._summary = None
+
+    def remove(self, item) -> None:
+        if self._pending.pop(item.id, None) is None:
+            self.items -= 1
+            Statistics.__count(self.types, item.item_type, -1)
+            Statistics.__count(self.months, self.__month(item._doa), -1)
+            Statistics.__count(self.decades, self.__decade(item._dom), -1)
+        self._summary = None
+
+    # Items put aside are counted with the values they have when they are counted, so their edits are left alone
+    # The old value of a date is given as a date, while the items hold the ordinal number of their dates
+    def update(self, item, field: str, old_value) -> None:
+        if item.id in self._pending:
+            return
+        if field == "item_type":
+            Statistics.__count(self.types, old_value, -1)
+            Statistics.__count(self.types, item.item_type, 1)
+        elif field == "doa":
+            Statistics.__count(self.months, self.__month(old_value.toordinal()), -1)
+            Statistics.__count(self.months, self.__month(item._doa), 1)
+        elif field == "dom":
+            Statistics.__count(self.decades, self.__decade(old_value.toordinal()), -1)
+            Statistics.__count(self.decades, self.__decade(item._dom), 1)
+        else:
+            return
+        self._summary = None
+
+    def clear(self) -> None:
+        self.items = 0
+        self.types.clear()
+        self.months.clear()
+        self.decades.clear()
+        self._pending.clear()
+        self._summary = None
+
+    # The restore method replaces the counts with the ones in a summary, saved together with the items which were added
+    # since the counts were last cleared, so that those items are not counted again
+    def restore(self, summary: Dict) -> None:
+        self.clear()
+        self.items = summary["items"]
+        self.types.update(summary["by_type"])
+        self.months.update(summary["by_month"])
+        self.decades.update(summary["by_decade"])
+
+    # The __count_pending method counts the items put aside. Every field is counted over all of them at once, and the
+    # dates are only turned into months and decades once for every day
+    def __count_pending(self) -> None:
+        with self._pending_lock:
+            # Another thread may have counted them while this one was waiting
+            if not self._pending:
+                return
+            items = self._pending.values()
+            self.items += len(items)
+            for item_type, count in Counter(x._item_type for x in items).items():
+                self.types[item_type] = self.types.get(item_type, 0) + count
+            for ordinal, count in Counter(x._doa for x in items).items():
+                month = self.__month(ordinal)
+                self.months[month] = self.months.get(month, 0) + count
+            for ordinal, count in Counter(x._dom for x in items).items():
+                decade = self.__decade(ordinal)
+                self.decades[decade] = self.decades.get(decade, 0) + count
+            self._pending = {}
+
+    # The summary method returns the counts as a dictionary which can be saved as json: the number of items, and the
+    # number of items by type, by month added ("YYYY-MM") and by decade manufactured ("1980s"), each sorted by its keys
+    # The dictionary is shared by every caller until the next change, so it must not be changed
+    def summary(self) -> Dict:
+        if self._pending:
+            self.__count_pending()
+        summary = self._summary
+        if summary is None:
+            summary = self._summary = {
+                "items": self.items,
+                "by_type": dict(sorted(self.types.items())),
+                "by_month": dict(sorted(self.months.items())),
+                "by_decade": dict(sorted(self.decades.items())),
+            }
+        return summary
+
+    # The compute method counts the statistics of the given items from scratch
+    @staticmethod
+    def compute(items: Iterable) -> "Statistics":
+        statistics = Statistics()
+        for item in items:
+            statistics.add(item)
+        return statistics
+
+
+# The differences function returns a line for every count which differs between two summaries, or an empty list if
+# they are the same
+def differences(summary: Dict, expected: Dict) -> List[str]:
+    lines = []
+    if summary["items"] != expected["items"]:
+        lines.append(f"items: {summary['items']} instead of {expected['items']}")
+    for table in ("by_type", "by_month", "by_decade"):
+        counts, expected_counts = summary[table], expected[table]
+        for key in sorted(set(counts) | set(expected_counts)):
+            if counts.get(key, 0) != expected_counts.get(key, 0):
+                lines.append(f"{table} {key}: {counts.get(key, 0)} instead of {expected_counts.get(key, 0)}")
+    return lines
@@ -0,0 +1,512 @@
+# The storage file contains the classes which read and write the collection to disk
+# The Item class goes through a Storage for all its persistence, so the collection can be kept either in the json files
+# in the data folder, by default UserFiles (JsonStorage) or in a SQLite database (SqliteStorage)
+# jsonpickle is only imported by the methods using it, since importing it takes longer than importing the rest of
+# the package, which would slow down the start of every script using the collection
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterator, List, Optional, Set, Tuple
+from ItemCollection import instrumentation
+from ItemCollection.config import data_dir, data_path
+from ItemCollection.journal import Journal
+from ItemCollection.shards import ShardSet, ShardTracker
+from ItemCollection.snapshot import iter_snapshot, write_snapshot
+from ItemCollection.store import iter_store, write_store
+from ItemCollection.stream import iter_records
+
+
+# The UnsupportedError is raised when a storage is asked to keep the items in a form which it does not have, such as
+# the item store of JsonStorage
+class UnsupportedError(NotImplementedError):
+    pass
+
+
+# The Storage class is the interface which every storage implements
+# Items are read back as records, dictionaries holding the same keys as the items saved in items.json, with the id
+# stored under "_Item__id" and the dates as "YYYY-MM-DD" strings or as ordinal numbers
+# The items_by_type and items_between methods are filters which run over all the records by default. Storages which
+# keep indexes override them with indexed queries
+class Storage:
+    DATE_FIELDS: Tuple = ("doa", "dom")
+
+    # The load_items method returns the records of all the saved items in the order they were saved
+    def load_items(self) -> Iterator[dict]:
+        raise NotImplementedError
+
+    # The enable_journal and enable_snapshot methods choose how the changes and the items are written. A storage which
+    # saves every change in place needs neither, and ignores them, so that a script can enable them whichever storage
+    # the collection uses
+    def enable_journal(self, **kwargs) -> None:
+        pass
+
+    def enable_snapshot(self) -> None:
+        pass
+
+    # The enable_store and enable_sharding methods save the items in files which other programs read (see store.py and
+    # shards.py), so a storage which cannot write them says so instead of leaving those files out silently
+    def enable_store(self) -> None:
+        raise UnsupportedError(f"{type(self).__name__} cannot save the items in an item store")
+
+    def enable_sharding(self, tracker: ShardTracker, workers: int = None) -> None:
+        raise UnsupportedError(f"{type(self).__name__} cannot save the items in shards")
+
+    # The load_changes method returns the changes which still have to be applied on top of the loaded items as
+    # (operation, record) pairs. Storages which save every change in place have none
+    def load_changes(self) -> Iterator[Tuple[str, dict]]:
+        return iter(())
+
+    # The has_unread_journal method tells whether the storage holds changes which load_changes leaves out, since they
+    # were saved in a journal which is not enabled. Storages without a journal never do
+    def has_unread_journal(self) -> bool:
+        return False
+
+    # The export_path method returns the file the items are exported to as json when no other file is given
+    def export_path(self) -> str:
+        return data_path("items.json")
+
+    # The begin_save method is called just before the items passed to save_items are taken, so that a storage which
+    # keeps track of the changed items knows which changes those items include
+    def begin_save(self) -> None:
+        pass
+
+    # The save_items method replaces all the saved items with the given items
+    def save_items(self, items: List) -> None:
+        raise NotImplementedError
+
+    # The save_change method saves a single change ("add", "edit" or "delete") made to the given item
+    def save_change(self, op: str, item) -> None:
+        raise NotImplementedError
+
+    # The save_changes method saves a batch of (operation, item) changes. Storages which can save them all at once, in
+    # a single write or transaction, override it
+    def save_changes(self, changes: List[Tuple[str, object]]) -> None:
+        for op, item in changes:
+            self.save_change(op, item)
+
+    # The needs_full_save method tells whether the whole collection has to be saved with save_items after the changes
+    # saved so far, either because the storage cannot save single changes or because they have piled up
+    def needs_full_save(self) -> bool:
+        return False
+
+    # The save_statistics method saves the statistics of the items just saved with save_items (see statistics.py), and
+    # load_statistics returns them as long as the saved items have not changed since, or None otherwise. Storages which
+    # cannot tell whether the items changed do not keep them
+    # With include_changes False the changes saved since, which load_changes returns, are left out, so the statistics
+    # returned are those of the items returned by load_items
+    def save_statistics(self, summary: dict) -> None:
+        pass
+
+    def load_statistics(self, include_changes: bool = True) -> Optional[dict]:
+        return None
+
+    def load_types(self) -> List[str]:
+        raise NotImplementedError
+
+    def save_types(self, types: List[str]) -> None:
+        raise NotImplementedError
+
+    def load_name(self) -> Optional[str]:
+        raise NotImplementedError
+
+    def save_name(self, name: str) -> None:
+        raise NotImplementedError
+
+    # The flush method writes any change which the storage is still holding back
+    def flush(self) -> None:
+        pass
+
+    # The signature method returns a value which changes whenever the saved collection changes on disk, or None if the
+    # storage cannot tell, in which case the collection is always read again
+    def signature(self):
+        return None
+
+    def items_by_type(self, item_type: str) -> Iterator[dict]:
+        return (record for record in self.load_items() if record["item_type"] == item_type)
+
+    # The items_between method returns the records whose date field ("doa" or "dom") falls between start and end, both
+    # included. The dates of the records are compared as ordinal numbers, since they can be stored either way
+    def items_between(self, field: str, start: datetime.date, end: datetime.date) -> Iterator[dict]:
+        if field not in Storage.DATE_FIELDS:
+            raise ValueError(f"{field} is not a date field")
+        start, end = start.toordinal(), end.toordinal()
+        return (record for record in self.load_items() if start <= Storage.__to_ordinal(record[field]) <= end)
+
+    @staticmethod
+    def __to_ordinal(value) -> int:
+        if isinstance(value, int):
+            return value
+        return datetime.date.fromisoformat(value).toordinal()
+
+
+# The JsonStorage class keeps the collection in the items.json, type.json and name.json files of a folder, by default
+# the data folder from the config
+# When a journal is enabled, single changes are appended to it instead of rewriting the whole items.json file
+# When the binary snapshot is enabled the items are saved to items.snapshot instead of items.json, which is much quicker
+# to read back. items.json is then only written when the collection is exported, and is still read instead of the
+# snapshot if it is the newer of the two, so that a collection imported as json is picked up
+# When the item store is enabled the items are saved to items.store instead (see store.py), which holds the same records
+# as the snapshot together with indexes, so that scripts can look up items in it without loading the collection
+# When sharding is enabled the items are saved to the shards in the items.shards folder instead (see shards.py), and only
+# the shards holding changed items are written again. A collection saved as items.json or items.snapshot is read as it
+# is, as a single shard, and is split into shards the next time it is saved
+class JsonStorage(Storage):
+    def __init__(self, directory: str = None):
+        self.directory: str = directory if directory is not None else data_dir()
+        self.journal: Optional[Journal] = None
+        self.snapshot: bool = False
+        self.store: bool = False
+        self.shards: Optional[ShardSet] = None
+        self._dirty_shards: Optional[Set[int]] = None
+        self._dirty_taken: bool = False
+
+    def path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    # The enable_journal method switches the storage to journal-backed persistence
+    def enable_journal(self, **kwargs) -> None:
+        self.journal = Journal(self.path("items.journal"), **kwargs)
+
+    # The enable_snapshot method switches the storage to saving the items in the binary snapshot
+    def enable_snapshot(self) -> None:
+        self.snapshot = True
+
+    # The enable_store method switches the storage to saving the items in the item store
+    def enable_store(self) -> None:
+        self.store = True
+
+    # The enable_sharding method switches the storage to saving the items in shards
+    # The tracker has to be one of the indexes of the ItemList holding the items, so that it sees every change
+    def enable_sharding(self, tracker: ShardTracker, workers: int = None) -> None:
+        self.shards = ShardSet(self.path("items.shards"), tracker, workers)
+
+    # The __newest_items_file method returns the items file to load, the snapshot, the item store, items.json or the
+    # manifest of the shards, whichever was written last, or None if none has been written yet
+    def __newest_items_file(self) -> Optional[str]:
+        newest = None
+        newest_time = None
+        file_paths = [self.path("items.json"), self.path("items.snapshot"), self.path("items.store")]
+        if self.shards is not None:
+            file_paths.append(self.shards.manifest_path)
+        for file_path in file_paths:
+            if not os.path.isfile(file_path) or not os.path.getsize(file_path) > 0:
+                continue
+            modified = os.path.getmtime(file_path)
+            if newest_time is None or modified >= newest_time:
+                newest, newest_time = file_path, modified
+        return newest
+
+    # The json records are parsed one at a time from the file, so only the records in use are kept in memory
+    def load_items(self) -> Iterator[dict]:
+        items_path = self.__newest_items_file()
+        if items_path is None:
+            return iter(())
+        instrumentation.count("load.files", bytes_read=os.path.getsize(items_path))
+        if self.shards is not None and items_path == self.shards.manifest_path:
+            return self.shards.load_items()
+        if items_path.endswith(".snapshot"):
+            return iter_snapshot(items_path)
+        if items_path.endswith(".store"):
+            return iter_store(items_path)
+        return iter_records(items_path)
+
+    # The items of a folder are exported to its own items.json, which is read back when it is newer than the snapshot
+    def export_path(self) -> str:
+        return self.path("items.json")
+
+    # The export_json method saves the items in items.json, or in the given file, to be used as the interchange format
+    @staticmethod
+    def export_json(path: str, items: List) -> None:
+        import jsonpickle
+        json_object = jsonpickle.encode([item.to_record() for item in items], unpicklable=False)
+        with open(path + ".tmp", "w") as outfile:
+            outfile.write(json_object)
+        os.replace(path + ".tmp", path)
+
+    def load_changes(self) -> Iterator[Tuple[str, dict]]:
+        if self.journal is None:
+            return iter(())
+        return self.journal.replay()
+
+    def has_unread_journal(self) -> bool:
+        if self.journal is not None:
+            return False
+        try:
+            return os.path.getsize(self.path("items.journal")) > 0
+        except OSError:
+            return False
+
+    # The file is written to a temporary file first and then swapped in, so that a crash never leaves a half written
+    # snapshot behind. Once the snapshot is saved the journal is no longer needed and is emptied
+    # With shards, only the shards changed since begin_save was last called are written, or all of them if save_items
+    # is called without begin_save
+    def begin_save(self) -> None:
+        if self.shards is not None:
+            self._dirty_shards = self.shards.tracker.take()
+            self._dirty_taken = True
+
+    def save_items(self, items: List) -> None:
+        with instrumentation.phase("save.items", items=len(items)) as run:
+            if self.shards is not None:
+                dirty = self._dirty_shards if self._dirty_taken else None
+                self._dirty_shards, self._dirty_taken = None, False
+                try:
+                    run["bytes_written"] = self.shards.save_items(items, dirty)
+                except Exception:
+                    self.shards.tracker.give_back(dirty)
+                    raise
+            else:
+                if self.store:
+                    items_path = self.path("items.store")
+                    write_store(items_path, items)
+                elif self.snapshot:
+                    items_path = self.path("items.snapshot")
+                    write_snapshot(items_path, items)
+                else:
+                    items_path = self.path("items.json")
+                    JsonStorage.export_json(items_path, items)
+                if instrumentation.enabled():
+                    run["bytes_written"] = os.path.getsize(items_path)
+
+        if self.journal is not None:
+            self.journal.truncate()
+
+    # Without a journal the whole collection is saved to file as before
+    # With a journal the change is appended to it and the journal is folded into items.json once it grows too large
+    def save_change(self, op: str, item) -> None:
+        if self.journal is not None:
+            self.journal.append(op, item.to_record())
+
+    def save_changes(self, changes: List[Tuple[str, object]]) -> None:
+        if self.journal is not None:
+            self.journal.extend([(op, item.to_record()) for op, item in changes])
+
+    def needs_full_save(self) -> bool:
+        return self.journal is None or self.journal.needs_compaction()
+
+    def flush(self) -> None:
+        if self.journal is not None:
+            self.journal.flush()
+
+    # The signature is made of the modification time and size of items.json, of the snapshot, of the item store, of the
+    # manifest of the shards and of the journal
+    def signature(self):
+        files = [self.path("items.json"), self.path("items.snapshot"), self.path("items.store")]
+        if self.shards is not None:
+            files.append(self.shards.manifest_path)
+        if self.journal is not None:
+            files.append(self.path("items.journal"))
+        result = []
+        for file_path in files:
+            try:
+                stat = os.stat(file_path)
+                result.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                result.append(None)
+        return tuple(result)
+
+    # The statistics are saved in statistics.json together with the signature of the items files they were counted
+    # from, and are only returned while the signature is still the same. The signature is passed through json on both
+    # sides, so that its tuples compare equal to the lists read back
+    # They are saved right after the items, when the journal has just been emptied, so leaving out the changes saved
+    # since only takes leaving the journal, the last file of the signature, out of the comparison
+    def save_statistics(self, summary: dict) -> None:
+        statistics_path = self.path("statistics.json")
+        with open(statistics_path + ".tmp", "w") as outfile:
+            json.dump({"signature": self.signature(), "statistics": summary}, outfile)
+        os.replace(statistics_path + ".tmp", statistics_path)
+
+    def load_statistics(self, include_changes: bool = True) -> Optional[dict]:
+        try:
+            with open(self.path("statistics.json")) as infile:
+                saved = json.load(infile)
+        except (FileNotFoundError, ValueError):
+            return None
+        signature = json.loads(json.dumps(self.signature()))
+        saved_signature = saved.get("signature")
+        if not include_changes and self.journal is not None and saved_signature:
+            signature, saved_signature = signature[:-1], saved_signature[:-1]
+        if saved_signature != signature:
+            return None
+        return saved.get("statistics")
+
+    # The initial type.json file has 4 categories written to it
+    def load_types(self) -> List[str]:
+        import jsonpickle
+        with open(self.path("type.json")) as infile:
+            json_object = infile.read()
+            return list(jsonpickle.decode(json_object))
+
+    def save_types(self, types: List[str]) -> None:
+        import jsonpickle
+        json_object = jsonpickle.dumps(list(types), unpicklable=False)
+        with open(self.path("type.json"), "w") as outfile:
+            outfile.write(json_object)
+
+    def load_name(self) -> Optional[str]:
+        import jsonpickle
+        name_path = self.path("name.json")
+        if not os.path.isfile(name_path) or not os.path.getsize(name_path) > 0:
+            return None
+
+        with open(name_path) as infile:
+            json_object = infile.read()
+            return jsonpickle.decode(json_object)
+
+    def save_name(self, name: str) -> None:
+        import jsonpickle
+        json_object = jsonpickle.encode(name, unpicklable=False)
+        with open(self.path("name.json"), "w") as outfile:
+            outfile.write(json_object)
+
+
+# The SqliteStorage class keeps the collection in a SQLite database, by default collection.db in the data folder
+# The items table is indexed on id (its primary key), item_type, doa and dom, so that the type and date filters are
+# indexed queries. Every change is saved as a single row in its own transaction instead of rewriting the collection
+class SqliteStorage(Storage):
+    SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            item_type TEXT NOT NULL,
+            doa TEXT NOT NULL,
+            dom TEXT NOT NULL,
+            description TEXT NOT NULL,
+            position INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS items_item_type ON items (item_type);
+        CREATE INDEX IF NOT EXISTS items_doa ON items (doa);
+        CREATE INDEX IF NOT EXISTS items_dom ON items (dom);
+        CREATE INDEX IF NOT EXISTS items_position ON items (position);
+        CREATE TABLE IF NOT EXISTS types (
+            position INTEGER PRIMARY KEY,
+            name TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    COLUMNS: str = "id, title, item_type, doa, dom, description"
+    FETCH_SIZE: int = 1000
+
+    def __init__(self, path: str = None):
+        path = path if path is not None else data_path("collection.db")
+        self.path: str = path
+        # The connection is also used by the background save worker. SQLite only keeps single statements from
+        # different threads apart, so every use of the connection holds the lock, which keeps the statements of a
+        # transaction made on one thread from being mixed with those made on another
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.RLock()
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SqliteStorage.SCHEMA)
+
+    # The is_empty method tells whether nothing has been saved to the database yet
+    def is_empty(self) -> bool:
+        with self.lock:
+            for table in ("items", "types", "settings"):
+                if self.connection.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is not None:
+                    return False
+        return True
+
+    @staticmethod
+    def __to_record(row: Tuple) -> dict:
+        return {"_Item__id": row[0], "title": row[1], "item_type": row[2], "doa": row[3], "dom": row[4],
+                "description": row[5]}
+
+    @staticmethod
+    def __to_row(item, position: int) -> Tuple:
+        return (item.id, item.title, item.item_type, item.doa.isoformat(), item.dom.isoformat(), item.description,
+                position)
+
+    # The rows are fetched FETCH_SIZE at a time, each time holding the lock, so that other threads can use the
+    # connection while the records are being read
+    def __query(self, where: str, parameters: Tuple) -> Iterator[dict]:
+        with self.lock:
+            cursor = self.connection.execute(
+                f"SELECT {SqliteStorage.COLUMNS} FROM items {where} ORDER BY position", parameters)
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(SqliteStorage.FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield SqliteStorage.__to_record(row)
+
+    def load_items(self) -> Iterator[dict]:
+        return self.__query("", ())
+
+    def save_items(self, items: List) -> None:
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM items")
+            self.connection.executemany("INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                        (SqliteStorage.__to_row(item, position)
+                                         for position, item in enumerate(items)))
+
+    # Added items are placed after every saved item and edited items keep their place, so that the items are loaded
+    # back in the same order as they are shown
+    def save_change(self, op: str, item) -> None:
+        with self.lock, self.connection:
+            self.__write_change(op, item)
+
+    # A batch of changes is saved in a single transaction
+    def save_changes(self, changes: List[Tuple[str, object]]) -> None:
+        with self.lock, self.connection:
+            for op, item in changes:
+                self.__write_change(op, item)
+
+    def __write_change(self, op: str, item) -> None:
+        if op == "delete":
+            self.connection.execute("DELETE FROM items WHERE id = ?", (item.id,))
+            return
+
+        row = self.connection.execute("SELECT position FROM items WHERE id = ?", (item.id,)).fetchone()
+        if row is None:
+            row = self.connection.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM items").fetchone()
+        self.connection.execute("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                SqliteStorage.__to_row(item, row[0]))
+
+    def load_types(self) -> List[str]:
+        with self.lock:
+            return [row[0] for row in self.connection.execute("SELECT name FROM types ORDER BY position")]
+
+    def save_types(self, types: List[str]) -> None:
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM types")
+            self.connection.executemany("INSERT INTO types VALUES (?, ?)", enumerate(types))
+
+    def load_name(self) -> Optional[str]:
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM settings WHERE key = 'name'").fetchone()
+        return row[0] if row is not None else None
+
+    def save_name(self, name: str) -> None:
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO settings VALUES ('name', ?)", (name,))
+
+    # The items of a database are exported next to it, to a json file named after it, collection.json for collection.db
+    def export_path(self) -> str:
+        return os.path.splitext(self.path)[0] + ".json"
+
+    def items_by_type(self, item_type: str) -> Iterator[dict]:
+        return self.__query("WHERE item_type = ?", (item_type,))
+
+    # The dates are stored as "YYYY-MM-DD" text, which sorts in the same order as the dates themselves
+    def items_between(self, field: str, start: datetime.date, end: datetime.date) -> Iterator[dict]:
+        if field not in Storage.DATE_FIELDS:
+            raise ValueError(f"{field} is not a date field")
+        return self.__query(f"WHERE {field} BETWEEN ? AND ?", (start.isoformat(), end.isoformat()))
+
+    # SQLite changes the data_version whenever another connection changes the database, while the changes made through
+    # this connection leave it as it is
+    def signature(self):
+        with self.lock:
+            return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
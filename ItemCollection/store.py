@@ -0,0 +1,354 @@
+# The store file contains the item store, a binary file which is read through mmap so that single items, the items of a
+# type and the items within a range of dates can be read without loading the whole collection
+# Opening a store only reads its header and its types, however large it is. Every lookup then goes through one of the
+# indexes saved in the file, and only the pages of the file holding the index entries and the records it needs are read
+# from disk, so a script can look up a few items of a collection of millions in milliseconds and without the memory the
+# loaded collection would take
+#
+# Layout (all numbers little endian, every section starting at a multiple of 8 bytes):
+#   header    "RCST", version (2 bytes), number of types (2 bytes), number of items (4 bytes), largest id (4 bytes),
+#             followed by the offsets of the types, id index, type index, doa index and dom index sections
+#             (8 bytes each)
+#   records   for every item, in the order of the collection: id (4 bytes), doa ordinal (4 bytes), dom ordinal
+#             (4 bytes), type number (2 bytes), title length (4 bytes), description length (4 bytes), followed by the
+#             title and the description in utf-8 (the same records as in the snapshot, see snapshot.py)
+#   types     for every type: length (2 bytes) followed by the type in utf-8
+#   id index  for every id from 0 to the largest id: the offset of its record (8 bytes), or 0 if there is no such item
+#   type index  for every type: the position of its first entry and its number of entries (8 bytes each), followed by
+#             the offsets of the records of every type in the order of the collection (8 bytes each)
+#   doa index, dom index  the dates of all the items in order (4 bytes each), followed by the offsets of their records
+#             in the same order (8 bytes each)
+#
+# The indexes are arrays of fixed width numbers, so they are read directly from the mapped file without being parsed and
+# are binary searched in place. Since they are read as the numbers of the machine, stores can only be written and read
+# on little endian machines, which all the machines the program runs on are
+
+import array
+import bisect
+import datetime
+import itertools
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from ItemCollection.config import data_path
+from ItemCollection.snapshot import _ITEM
+
+MAGIC = b"RCST"
+VERSION = 1
+DATE_FIELDS: Tuple = ("doa", "dom")
+ID_BITS: int = 32
+ID_MASK: int = (1 << ID_BITS) - 1
+_HEADER = struct.Struct("<4sHHII5Q")
+_TYPE = struct.Struct("<H")
+_ID = struct.Struct("<I")
+
+
+# The _aligned function returns the number of bytes of padding needed after size bytes to reach a multiple of 8
+def _aligned(size: int) -> int:
+    return -size % 8
+
+
+# The _check_byte_order function raises a ValueError on machines whose numbers are not little endian
+def _check_byte_order() -> None:
+    if sys.byteorder != "little":
+        raise ValueError("Item stores can only be used on little endian machines")
+
+
+# The write_store function saves the items to the file at path
+# The file is written to a temporary file first and then swapped in, so that a crash never leaves half a store behind
+def write_store(path: str, items: Iterable) -> None:
+    types: Dict[str, int] = {}
+    ids = array.array("Q")
+    type_offsets: List[array.array] = []
+    # The dates are kept together with the ids as single numbers, as in the DateIndex, which sort by date and then by id
+    doa_entries = array.array("Q")
+    dom_entries = array.array("Q")
+    _check_byte_order()
+
+    with open(path + ".tmp", "wb") as outfile:
+        outfile.write(bytes(_HEADER.size + _aligned(_HEADER.size)))
+        offset = outfile.tell()
+        count = 0
+        pack = _ITEM.pack
+        for item in items:
+            item_id = item.id
+            item_type = item.item_type
+            type_number = types.get(item_type)
+            if type_number is None:
+                type_number = types[item_type] = len(types)
+                type_offsets.append(array.array("Q"))
+            title = item.title.encode("utf-8")
+            description = item.description.encode("utf-8")
+            doa = item.doa.toordinal()
+            dom = item.dom.toordinal()
+            record = pack(item_id, doa, dom, type_number, len(title), len(description)) + title + description
+            outfile.write(record)
+
+            if item_id >= len(ids):
+                ids.extend(itertools.repeat(0, item_id + 1 - len(ids)))
+            ids[item_id] = offset
+            type_offsets[type_number].append(offset)
+            doa_entries.append(doa << ID_BITS | item_id)
+            dom_entries.append(dom << ID_BITS | item_id)
+            count += 1
+            offset += len(record)
+        largest_id = len(ids) - 1 if ids else 0
+
+        def section(data: bytes) -> int:
+            start = outfile.tell()
+            outfile.write(bytes(_aligned(start)))
+            outfile.write(data)
+            return start + _aligned(start)
+
+        types_start = section(b"".join(_TYPE.pack(len(encoded)) + encoded
+                                       for encoded in (item_type.encode("utf-8") for item_type in types)))
+        id_start = section(ids.tobytes())
+        table = array.array("Q")
+        position = 0
+        for offsets in type_offsets:
+            table.extend((position, len(offsets)))
+            position += len(offsets)
+        type_start = section(table.tobytes() + b"".join(offsets.tobytes() for offsets in type_offsets))
+        date_starts = []
+        for entries in (doa_entries, dom_entries):
+            entries = sorted(entries)
+            dates = array.array("I", (entry >> ID_BITS for entry in entries))
+            offsets = array.array("Q", (ids[entry & ID_MASK] for entry in entries))
+            date_starts.append(section(dates.tobytes() + bytes(_aligned(len(dates) * 4)) + offsets.tobytes()))
+
+        outfile.seek(0)
+        outfile.write(_HEADER.pack(MAGIC, VERSION, len(types), count, largest_id, types_start, id_start, type_start,
+                                   *date_starts))
+    os.replace(path + ".tmp", path)
+
+
+# The MappedStore class reads the items saved in a store without loading them
+# The items are returned as records, like the ones read from the other files of the collection (see storage.py), with
+# the dates as ordinal numbers. Item.from_record turns them into items which are not part of any collection
+# When the path of a journal is given, the changes in it which were made after the store was saved are read when the
+# store is opened and taken into account by every lookup. Since the journal is folded into the store once it reaches a
+# thousand changes, this stays quick. The items the changes move into the results of a scan, or add to them, come after
+# the others
+# The store should be closed once it is no longer needed, or used in a with statement
+class MappedStore:
+    def __init__(self, path: str, journal_path: str = None):
+        _check_byte_order()
+        self.path: str = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not an item store")
+        self._views: List[memoryview] = []
+        try:
+            self.__read_header()
+        except Exception:
+            self.close()
+            raise
+        self.__advise("MADV_RANDOM")
+
+        self._changes: Dict[int, Optional[dict]] = {}
+        if journal_path is not None and os.path.isfile(journal_path):
+            self.__read_changes(journal_path)
+        self._count: int = self._stored + sum(
+            (record is not None) - (self._offset(item_id) != 0) for item_id, record in self._changes.items())
+
+    def __enter__(self) -> "MappedStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    # The __array method returns count fixed width numbers of the mapped file starting at offset, without copying them
+    def __array(self, offset: int, count: int, typecode: str) -> memoryview:
+        view = memoryview(self._map)[offset:offset + count * struct.calcsize(typecode)].cast(typecode)
+        self._views.append(view)
+        return view
+
+    def __read_header(self) -> None:
+        if len(self._map) < _HEADER.size:
+            raise ValueError(f"{self.path} is not an item store")
+        (magic, version, type_count, self._stored, largest_id, types_start, id_start, type_start, doa_start,
+         dom_start) = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not an item store")
+        if version != VERSION:
+            raise ValueError(f"{self.path} is a version {version} store, only version {VERSION} can be read")
+
+        self.types: List[str] = []
+        offset = types_start
+        for _ in range(type_count):
+            (length,) = _TYPE.unpack_from(self._map, offset)
+            offset += _TYPE.size
+            self.types.append(self._map[offset:offset + length].decode("utf-8"))
+            offset += length
+        self._type_numbers: Dict[str, int] = {item_type: number for number, item_type in enumerate(self.types)}
+
+        self._ids = self.__array(id_start, largest_id + 1 if self._stored else 0, "Q")
+        self._type_table = self.__array(type_start, 2 * type_count, "Q")
+        self._type_offsets = self.__array(type_start + 16 * type_count, self._stored, "Q")
+        date_size = 4 * self._stored + _aligned(4 * self._stored)
+        self._dates = {field: (self.__array(start, self._stored, "I"),
+                               self.__array(start + date_size, self._stored, "Q"))
+                       for field, start in zip(DATE_FIELDS, (doa_start, dom_start))}
+
+    # The __read_changes method reads the changes in the journal, keeping the last record of every changed item, or
+    # None for the deleted items
+    def __read_changes(self, journal_path: str) -> None:
+        from ItemCollection.journal import Journal
+        for op, record in Journal(journal_path).replay():
+            if op == "delete":
+                self._changes[record["_Item__id"]] = None
+                continue
+            record = dict(record)
+            for field in DATE_FIELDS:
+                if isinstance(record[field], str):
+                    record[field] = datetime.date.fromisoformat(record[field]).toordinal()
+            self._changes[record["_Item__id"]] = record
+
+    # The __advise method tells the operating system how the mapped file is about to be read, where it can be told
+    # Lookups read a page here and there, and reading ahead the pages around them, as is done by default, would read
+    # and keep in memory most of a large store after a few thousand lookups
+    def __advise(self, advice: str) -> None:
+        if hasattr(self._map, "madvise") and hasattr(mmap, advice):
+            self._map.madvise(getattr(mmap, advice))
+
+    # The close method unmaps the file. The records already returned can still be used
+    def close(self) -> None:
+        for view in self._views:
+            view.release()
+        self._views.clear()
+        self._map.close()
+        self._file.close()
+
+    def _offset(self, item_id: int) -> int:
+        return self._ids[item_id] if 0 <= item_id < len(self._ids) else 0
+
+    def __record(self, offset: int) -> dict:
+        item_id, doa, dom, type_number, title_length, description_length = _ITEM.unpack_from(self._map, offset)
+        start = offset + _ITEM.size
+        middle = start + title_length
+        return {"_Item__id": item_id, "title": self._map[start:middle].decode("utf-8"),
+                "item_type": self.types[type_number], "doa": doa, "dom": dom,
+                "description": self._map[middle:middle + description_length].decode("utf-8")}
+
+    # The __merge method returns the records at the given offsets together with the changes from the journal: the
+    # changed records replace the saved ones in place when they still match, and the other matching changes come last
+    def __merge(self, offsets: Iterable[int], matches) -> Iterator[dict]:
+        if not self._changes:
+            for offset in offsets:
+                yield self.__record(offset)
+            return
+
+        merged = set()
+        for offset in offsets:
+            (item_id,) = _ID.unpack_from(self._map, offset)
+            if item_id not in self._changes:
+                yield self.__record(offset)
+                continue
+            merged.add(item_id)
+            record = self._changes[item_id]
+            if record is not None and matches(record):
+                yield record
+        for item_id, record in self._changes.items():
+            if record is not None and item_id not in merged and matches(record):
+                yield record
+
+    # The get_by_id method returns the record of the item with the given id, or None if there is no such item
+    def get_by_id(self, item_id: int) -> Optional[dict]:
+        if item_id in self._changes:
+            return self._changes[item_id]
+        offset = self._offset(item_id)
+        return self.__record(offset) if offset else None
+
+    # The records method returns the records of all the items, in the order of the collection
+    # The records are read from the start of the file to the end, so the pages ahead are read in advance meanwhile
+    def records(self) -> Iterator[dict]:
+        self.__advise("MADV_SEQUENTIAL")
+        try:
+            yield from self.__merge(self.__stored_offsets(), lambda record: True)
+        finally:
+            if not self._map.closed:
+                self.__advise("MADV_RANDOM")
+
+    # The __stored_offsets method returns the offsets of all the saved records, one after the other
+    def __stored_offsets(self) -> Iterator[int]:
+        offset = _HEADER.size + _aligned(_HEADER.size)
+        for _ in range(self._stored):
+            yield offset
+            _, _, _, _, title_length, description_length = _ITEM.unpack_from(self._map, offset)
+            offset += _ITEM.size + title_length + description_length
+
+    # The __slice method returns the numbers of an array of the mapped file from start to end one at a time, since a
+    # slice of it would keep the file from being closed
+    @staticmethod
+    def __slice(numbers: memoryview, start: int, end: int) -> Iterator[int]:
+        return (numbers[position] for position in range(start, end))
+
+    # The between_ids method returns the records of the items whose ids are between first and last, both included, in
+    # the order of their ids
+    def between_ids(self, first: int, last: int) -> Iterator[dict]:
+        first = max(first, 0)
+        offsets = (offset for offset in MappedStore.__slice(self._ids, first, min(last + 1, len(self._ids))) if offset)
+        return self.__merge(offsets, lambda record: first <= record["_Item__id"] <= last)
+
+    # The count_by_type method returns the number of saved items of the given type, without the changes in the journal
+    def count_by_type(self, item_type: str) -> int:
+        number = self._type_numbers.get(item_type)
+        return self._type_table[2 * number + 1] if number is not None else 0
+
+    # The by_type method returns the records of the items of the given type in the order of the collection. offset and
+    # limit return a single page of them
+    def by_type(self, item_type: str, offset: int = 0, limit: int = None) -> Iterator[dict]:
+        number = self._type_numbers.get(item_type)
+        first, count = 0, 0
+        if number is not None:
+            first, count = self._type_table[2 * number], self._type_table[2 * number + 1]
+        matches = lambda record: record["item_type"] == item_type
+        # Without changes the page is found directly in the type index
+        if not self._changes:
+            start = first + min(offset, count)
+            end = first + (count if limit is None else min(count, offset + limit))
+            return self.__merge(MappedStore.__slice(self._type_offsets, start, end), matches)
+        records = self.__merge(MappedStore.__slice(self._type_offsets, first, first + count), matches)
+        return itertools.islice(records, offset, offset + limit if limit is not None else None)
+
+    # The between method returns the records of the items whose date field ("doa" or "dom") falls between start and
+    # end, both included, in the order of the dates. A start or end of None leaves that side open
+    def between(self, field: str, start: Optional[datetime.date], end: Optional[datetime.date]) -> Iterator[dict]:
+        if field not in DATE_FIELDS:
+            raise ValueError(f"{field} is not a date field")
+        first_day = start.toordinal() if start is not None else 0
+        last_day = end.toordinal() if end is not None else datetime.date.max.toordinal()
+        dates, offsets = self._dates[field]
+        low = bisect.bisect_left(dates, first_day)
+        high = bisect.bisect_right(dates, last_day)
+        return self.__merge(MappedStore.__slice(offsets, low, high),
+                            lambda record: first_day <= record[field] <= last_day)
+
+
+# The open_store function opens the store of the collection in the given folder, by default the data folder, together
+# with the changes in its journal
+# A ValueError is raised when the collection was saved to another items file after the store, which is then out of date
+def open_store(directory: str = None) -> MappedStore:
+    def path(file_name: str) -> str:
+        return os.path.join(directory, file_name) if directory is not None else data_path(file_name)
+
+    store_path = path("items.store")
+    for other in ("items.json", "items.snapshot", os.path.join("items.shards", "manifest.json")):
+        if os.path.isfile(path(other)) and os.path.getmtime(path(other)) > os.path.getmtime(store_path):
+            raise ValueError(f"{store_path} is older than {path(other)}")
+    return MappedStore(store_path, path("items.journal"))
+
+
+# The iter_store function yields the records saved in the store at path in the order of the collection, which is how
+# the collection loads a store
+def iter_store(path: str) -> Iterator[dict]:
+    with MappedStore(path) as store:
+        yield from store.records()
@@ -0,0 +1,76 @@
+# The stream file contains the functions used to read the records in a json file one at a time
+
+import json
+from typing import Iterator
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+# The _Reader class holds the part of the file read so far which has not been decoded yet
+# More of the file is only read when the next record does not fit in what is already held
+class _Reader:
+    def __init__(self, infile, chunk_size: int):
+        self.infile = infile
+        self.chunk_size: int = chunk_size
+        self.buffer: str = ""
+        self.pos: int = 0
+        self.eof: bool = False
+
+    # The read_more method drops the part of the buffer which has been decoded and adds the next chunk of the file
+    def read_more(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.infile.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    # The next_char method skips any whitespace and returns the next character without consuming it
+    # An empty string is returned at the end of the file
+    def next_char(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return ""
+
+    # The decode method decodes the json value starting at the current position, reading more of the file if the
+    # value is cut off at the end of the buffer
+    def decode(self):
+        self.next_char()
+        while True:
+            try:
+                value, self.pos = _DECODER.raw_decode(self.buffer, self.pos)
+                return value
+            except json.JSONDecodeError:
+                if not self.read_more():
+                    raise
+
+
+# The iter_records function yields the values of the top level json array stored in the file at path one by one
+# Only about one chunk of the file is held in memory at a time, instead of the whole file and the whole decoded list
+def iter_records(path: str, chunk_size: int = 1 << 16) -> Iterator:
+    with open(path) as infile:
+        reader = _Reader(infile, chunk_size)
+        if reader.next_char() != "[":
+            raise ValueError(f"{path} does not contain a json list")
+        reader.pos += 1
+
+        if reader.next_char() == "]":
+            return
+
+        while True:
+            yield reader.decode()
+
+            char = reader.next_char()
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"{path} is not a valid json list")
+            reader.pos += 1
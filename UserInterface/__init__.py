@@ -0,0 +1,3 @@
+# The UserInterface package holds the .ui files designed in Qt Designer and the Python modules compiled from them
+# (<name>_ui.py), which build the windows much faster than reading the .ui files at runtime
+# After changing a .ui file the modules are compiled again with: python -m UserInterface.compile
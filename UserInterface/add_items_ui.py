@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'add_items.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.7
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(700, 700)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(700, 700))
+        MainWindow.setMaximumSize(QtCore.QSize(700, 700))
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.centralwidget.setMinimumSize(QtCore.QSize(700, 700))
+        self.centralwidget.setMaximumSize(QtCore.QSize(700, 700))
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayoutWidget = QtWidgets.QWidget(self.centralwidget)
+        self.verticalLayoutWidget.setGeometry(QtCore.QRect(0, 0, 730, 701))
+        self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
+        self.verticalLayout.setContentsMargins(15, 15, 15, 15)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.lbl_name = QtWidgets.QLabel(self.verticalLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lbl_name.sizePolicy().hasHeightForWidth())
+        self.lbl_name.setSizePolicy(sizePolicy)
+        self.lbl_name.setMinimumSize(QtCore.QSize(670, 30))
+        self.lbl_name.setMaximumSize(QtCore.QSize(670, 30))
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(63, 52, 14))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(142, 122, 230))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(63, 52, 14))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(142, 122, 230))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(127, 127, 127))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(127, 127, 127))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Text, brush)
+        self.lbl_name.setPalette(palette)
+        font = QtGui.QFont()
+        font.setFamily("Big Caslon")
+        font.setPointSize(25)
+        font.setStrikeOut(False)
+        self.lbl_name.setFont(font)
+        self.lbl_name.setAlignment(QtCore.Qt.AlignCenter)
+        self.lbl_name.setObjectName("lbl_name")
+        self.verticalLayout.addWidget(self.lbl_name)
+        self.lbl_retro = QtWidgets.QLabel(self.verticalLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lbl_retro.sizePolicy().hasHeightForWidth())
+        self.lbl_retro.setSizePolicy(sizePolicy)
+        self.lbl_retro.setMinimumSize(QtCore.QSize(670, 25))
+        self.lbl_retro.setMaximumSize(QtCore.QSize(670, 25))
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(48, 41, 11))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(48, 41, 11))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(127, 127, 127))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, brush)
+        self.lbl_retro.setPalette(palette)
+        font = QtGui.QFont()
+        font.setFamily("Big Caslon")
+        font.setPointSize(20)
+        self.lbl_retro.setFont(font)
+        self.lbl_retro.setAlignment(QtCore.Qt.AlignCenter)
+        self.lbl_retro.setObjectName("lbl_retro")
+        self.verticalLayout.addWidget(self.lbl_retro)
+        self.groupBox = QtWidgets.QGroupBox(self.verticalLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy)
+        self.groupBox.setMinimumSize(QtCore.QSize(700, 0))
+        self.groupBox.setMaximumSize(QtCore.QSize(700, 700))
+        self.groupBox.setObjectName("groupBox")
+        self.gridLayoutWidget = QtWidgets.QWidget(self.groupBox)
+        self.gridLayoutWidget.setGeometry(QtCore.QRect(22, 20, 659, 82))
+        self.gridLayoutWidget.setObjectName("gridLayoutWidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridLayoutWidget)
+        self.gridLayout.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.gridLayout.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout.setObjectName("gridLayout")
+        self.label = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMinimumSize(QtCore.QSize(125, 20))
+        self.label.setMaximumSize(QtCore.QSize(125, 20))
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+        self.txt_title = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txt_title.sizePolicy().hasHeightForWidth())
+        self.txt_title.setSizePolicy(sizePolicy)
+        self.txt_title.setMinimumSize(QtCore.QSize(520, 20))
+        self.txt_title.setMaximumSize(QtCore.QSize(520, 20))
+        self.txt_title.setObjectName("txt_title")
+        self.gridLayout.addWidget(self.txt_title, 0, 1, 1, 1)
+        self.txt_description = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txt_description.sizePolicy().hasHeightForWidth())
+        self.txt_description.setSizePolicy(sizePolicy)
+        self.txt_description.setMinimumSize(QtCore.QSize(520, 20))
+        self.txt_description.setMaximumSize(QtCore.QSize(520, 20))
+        self.txt_description.setObjectName("txt_description")
+        self.gridLayout.addWidget(self.txt_description, 4, 1, 1, 1)
+        self.label_2 = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy)
+        self.label_2.setMinimumSize(QtCore.QSize(125, 20))
+        self.label_2.setMaximumSize(QtCore.QSize(125, 20))
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+        self.cmb_type = QtWidgets.QComboBox(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cmb_type.sizePolicy().hasHeightForWidth())
+        self.cmb_type.setSizePolicy(sizePolicy)
+        self.cmb_type.setMinimumSize(QtCore.QSize(520, 20))
+        self.cmb_type.setMaximumSize(QtCore.QSize(520, 40))
+        self.cmb_type.setObjectName("cmb_type")
+        self.gridLayout.addWidget(self.cmb_type, 1, 1, 1, 1)
+        self.label_5 = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy)
+        self.label_5.setMinimumSize(QtCore.QSize(125, 20))
+        self.label_5.setMaximumSize(QtCore.QSize(125, 20))
+        self.label_5.setObjectName("label_5")
+        self.gridLayout.addWidget(self.label_5, 4, 0, 1, 1)
+        self.gridLayoutWidget_2 = QtWidgets.QWidget(self.groupBox)
+        self.gridLayoutWidget_2.setGeometry(QtCore.QRect(20, 110, 661, 251))
+        self.gridLayoutWidget_2.setObjectName("gridLayoutWidget_2")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.gridLayoutWidget_2)
+        self.gridLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.btn_add = QtWidgets.QPushButton(self.gridLayoutWidget_2)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_add.setFont(font)
+        self.btn_add.setObjectName("btn_add")
+        self.gridLayout_2.addWidget(self.btn_add, 2, 0, 1, 1)
+        self.label_4 = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.label_4.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.label_4.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.label_4.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout_2.addWidget(self.label_4, 0, 1, 1, 1)
+        self.label_3 = QtWidgets.QLabel(self.gridLayoutWidget_2)
+        self.label_3.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.label_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.label_3.setAlignment(QtCore.Qt.AlignCenter)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout_2.addWidget(self.label_3, 0, 0, 1, 1)
+        self.cal_doa = QtWidgets.QCalendarWidget(self.gridLayoutWidget_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cal_doa.sizePolicy().hasHeightForWidth())
+        self.cal_doa.setSizePolicy(sizePolicy)
+        self.cal_doa.setMinimumSize(QtCore.QSize(300, 180))
+        self.cal_doa.setMaximumSize(QtCore.QSize(300, 180))
+        self.cal_doa.setFirstDayOfWeek(QtCore.Qt.Monday)
+        self.cal_doa.setGridVisible(False)
+        self.cal_doa.setObjectName("cal_doa")
+        self.gridLayout_2.addWidget(self.cal_doa, 1, 0, 1, 1)
+        self.cal_dom = QtWidgets.QCalendarWidget(self.gridLayoutWidget_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cal_dom.sizePolicy().hasHeightForWidth())
+        self.cal_dom.setSizePolicy(sizePolicy)
+        self.cal_dom.setMinimumSize(QtCore.QSize(300, 180))
+        self.cal_dom.setMaximumSize(QtCore.QSize(300, 180))
+        self.cal_dom.setFirstDayOfWeek(QtCore.Qt.Monday)
+        self.cal_dom.setObjectName("cal_dom")
+        self.gridLayout_2.addWidget(self.cal_dom, 1, 1, 1, 1)
+        self.btn_clear = QtWidgets.QPushButton(self.gridLayoutWidget_2)
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_clear.setFont(font)
+        self.btn_clear.setObjectName("btn_clear")
+        self.gridLayout_2.addWidget(self.btn_clear, 2, 1, 1, 1)
+        self.groupBox_2 = QtWidgets.QGroupBox(self.groupBox)
+        self.groupBox_2.setGeometry(QtCore.QRect(0, 360, 670, 300))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupBox_2.sizePolicy().hasHeightForWidth())
+        self.groupBox_2.setSizePolicy(sizePolicy)
+        self.groupBox_2.setMinimumSize(QtCore.QSize(670, 0))
+        self.groupBox_2.setMaximumSize(QtCore.QSize(670, 16777215))
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.verticalLayoutWidget_2 = QtWidgets.QWidget(self.groupBox_2)
+        self.verticalLayoutWidget_2.setGeometry(QtCore.QRect(10, 20, 672, 234))
+        self.verticalLayoutWidget_2.setObjectName("verticalLayoutWidget_2")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.verticalLayoutWidget_2)
+        self.verticalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.verticalLayout_2.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.tbl_items = QtWidgets.QTableView(self.verticalLayoutWidget_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tbl_items.sizePolicy().hasHeightForWidth())
+        self.tbl_items.setSizePolicy(sizePolicy)
+        self.tbl_items.setMinimumSize(QtCore.QSize(650, 180))
+        self.tbl_items.setMaximumSize(QtCore.QSize(650, 180))
+        self.tbl_items.setObjectName("tbl_items")
+        self.verticalLayout_2.addWidget(self.tbl_items)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.horizontalLayout_3.setSpacing(0)
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        spacerItem = QtWidgets.QSpacerItem(400, 30, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem)
+        self.btn_delete = QtWidgets.QPushButton(self.verticalLayoutWidget_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btn_delete.sizePolicy().hasHeightForWidth())
+        self.btn_delete.setSizePolicy(sizePolicy)
+        self.btn_delete.setMinimumSize(QtCore.QSize(200, 30))
+        self.btn_delete.setMaximumSize(QtCore.QSize(200, 30))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_delete.setFont(font)
+        self.btn_delete.setObjectName("btn_delete")
+        self.horizontalLayout_3.addWidget(self.btn_delete)
+        self.horizontalLayout_3.setStretch(0, 1)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_3)
+        self.verticalLayout.addWidget(self.groupBox)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        MainWindow.setTabOrder(self.txt_title, self.cmb_type)
+        MainWindow.setTabOrder(self.cmb_type, self.txt_description)
+        MainWindow.setTabOrder(self.txt_description, self.cal_doa)
+        MainWindow.setTabOrder(self.cal_doa, self.cal_dom)
+        MainWindow.setTabOrder(self.cal_dom, self.btn_add)
+        MainWindow.setTabOrder(self.btn_add, self.btn_clear)
+        MainWindow.setTabOrder(self.btn_clear, self.tbl_items)
+        MainWindow.setTabOrder(self.tbl_items, self.btn_delete)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Add Item"))
+        self.lbl_name.setText(_translate("MainWindow", "Name"))
+        self.lbl_retro.setText(_translate("MainWindow", "Retro Collection"))
+        self.groupBox.setTitle(_translate("MainWindow", "Add Item To Your Retro Collection"))
+        self.label.setText(_translate("MainWindow", "Title"))
+        self.label_2.setText(_translate("MainWindow", "Type"))
+        self.label_5.setText(_translate("MainWindow", "Description"))
+        self.btn_add.setText(_translate("MainWindow", "Add"))
+        self.label_4.setText(_translate("MainWindow", "Date Manufactured"))
+        self.label_3.setText(_translate("MainWindow", "Date Added"))
+        self.btn_clear.setText(_translate("MainWindow", "Clear"))
+        self.groupBox_2.setTitle(_translate("MainWindow", "Your Retro Collection"))
+        self.btn_delete.setText(_translate("MainWindow", "Delete"))
+
+
+UI_HASH = "ff1bcb3e9f10c26a9a674ec11269a4531c86bedf"
@@ -0,0 +1,41 @@
+# The compile file compiles every .ui file in the UserInterface folder into a Python module with the same name followed
+# by _ui, for example main_menu.ui into main_menu_ui.py
+# Every compiled module remembers the hash of the .ui file it was compiled from in UI_HASH, so that the windows can tell
+# when a .ui file was changed without being compiled again and read the .ui file instead
+
+import glob
+import hashlib
+import os
+from typing import List
+from PyQt5 import uic
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# The ui_hash function returns the hash of the .ui file at path
+def ui_hash(path: str) -> str:
+    with open(path, "rb") as infile:
+        return hashlib.sha1(infile.read()).hexdigest()
+
+
+# The compile_all function compiles all the .ui files and returns the paths of the modules written
+def compile_all() -> List[str]:
+    written = []
+    for ui_file in sorted(glob.glob(os.path.join(UI_DIR, "*.ui"))):
+        module_path = ui_file[:-len(".ui")] + "_ui.py"
+        # The .ui file is opened by its name alone, which the compiler writes at the top of the module
+        current_dir = os.getcwd()
+        os.chdir(UI_DIR)
+        try:
+            with open(os.path.basename(ui_file)) as infile, open(module_path, "w") as outfile:
+                uic.compileUi(infile, outfile)
+                outfile.write(f"\n\nUI_HASH = \"{ui_hash(ui_file)}\"\n")
+        finally:
+            os.chdir(current_dir)
+        written.append(module_path)
+    return written
+
+
+if __name__ == "__main__":
+    for path in compile_all():
+        print(f"Compiled {os.path.basename(path)}")
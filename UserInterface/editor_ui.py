@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'editor.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.7
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(700, 700)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(700, 700))
+        MainWindow.setMaximumSize(QtCore.QSize(700, 700))
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.centralwidget.setMinimumSize(QtCore.QSize(700, 700))
+        self.centralwidget.setMaximumSize(QtCore.QSize(700, 700))
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayoutWidget = QtWidgets.QWidget(self.centralwidget)
+        self.verticalLayoutWidget.setGeometry(QtCore.QRect(0, 0, 702, 681))
+        self.verticalLayoutWidget.setObjectName("verticalLayoutWidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.verticalLayoutWidget)
+        self.verticalLayout.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.verticalLayout.setContentsMargins(0, 0, 0, 0)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.lbl_name = QtWidgets.QLabel(self.verticalLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lbl_name.sizePolicy().hasHeightForWidth())
+        self.lbl_name.setSizePolicy(sizePolicy)
+        self.lbl_name.setMinimumSize(QtCore.QSize(700, 30))
+        self.lbl_name.setMaximumSize(QtCore.QSize(700, 30))
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(63, 52, 14))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(142, 122, 230))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(63, 52, 14))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(142, 122, 230))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.Text, brush)
+        brush = QtGui.QBrush(QtGui.QColor(127, 127, 127))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(127, 127, 127))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.Text, brush)
+        self.lbl_name.setPalette(palette)
+        font = QtGui.QFont()
+        font.setFamily("Big Caslon")
+        font.setPointSize(25)
+        font.setStrikeOut(False)
+        self.lbl_name.setFont(font)
+        self.lbl_name.setAlignment(QtCore.Qt.AlignCenter)
+        self.lbl_name.setObjectName("lbl_name")
+        self.verticalLayout.addWidget(self.lbl_name)
+        self.lbl_retro = QtWidgets.QLabel(self.verticalLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lbl_retro.sizePolicy().hasHeightForWidth())
+        self.lbl_retro.setSizePolicy(sizePolicy)
+        self.lbl_retro.setMinimumSize(QtCore.QSize(700, 25))
+        self.lbl_retro.setMaximumSize(QtCore.QSize(700, 25))
+        palette = QtGui.QPalette()
+        brush = QtGui.QBrush(QtGui.QColor(48, 41, 11))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Active, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(48, 41, 11))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Inactive, QtGui.QPalette.WindowText, brush)
+        brush = QtGui.QBrush(QtGui.QColor(127, 127, 127))
+        brush.setStyle(QtCore.Qt.SolidPattern)
+        palette.setBrush(QtGui.QPalette.Disabled, QtGui.QPalette.WindowText, brush)
+        self.lbl_retro.setPalette(palette)
+        font = QtGui.QFont()
+        font.setFamily("Big Caslon")
+        font.setPointSize(20)
+        self.lbl_retro.setFont(font)
+        self.lbl_retro.setAlignment(QtCore.Qt.AlignCenter)
+        self.lbl_retro.setObjectName("lbl_retro")
+        self.verticalLayout.addWidget(self.lbl_retro)
+        self.groupBox = QtWidgets.QGroupBox(self.verticalLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy)
+        self.groupBox.setMinimumSize(QtCore.QSize(700, 0))
+        self.groupBox.setMaximumSize(QtCore.QSize(700, 16777215))
+        self.groupBox.setObjectName("groupBox")
+        self.gridLayoutWidget = QtWidgets.QWidget(self.groupBox)
+        self.gridLayoutWidget.setGeometry(QtCore.QRect(0, 20, 685, 570))
+        self.gridLayoutWidget.setObjectName("gridLayoutWidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.gridLayoutWidget)
+        self.gridLayout.setContentsMargins(15, 15, 15, 15)
+        self.gridLayout.setObjectName("gridLayout")
+        self.txt_description = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txt_description.sizePolicy().hasHeightForWidth())
+        self.txt_description.setSizePolicy(sizePolicy)
+        self.txt_description.setMinimumSize(QtCore.QSize(520, 20))
+        self.txt_description.setMaximumSize(QtCore.QSize(520, 20))
+        self.txt_description.setObjectName("txt_description")
+        self.gridLayout.addWidget(self.txt_description, 4, 1, 1, 1)
+        self.txt_title = QtWidgets.QLineEdit(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txt_title.sizePolicy().hasHeightForWidth())
+        self.txt_title.setSizePolicy(sizePolicy)
+        self.txt_title.setMinimumSize(QtCore.QSize(520, 20))
+        self.txt_title.setMaximumSize(QtCore.QSize(520, 20))
+        self.txt_title.setObjectName("txt_title")
+        self.gridLayout.addWidget(self.txt_title, 0, 1, 1, 1)
+        self.label = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy)
+        self.label.setMinimumSize(QtCore.QSize(125, 20))
+        self.label.setMaximumSize(QtCore.QSize(125, 20))
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+        self.label_2 = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy)
+        self.label_2.setMinimumSize(QtCore.QSize(125, 20))
+        self.label_2.setMaximumSize(QtCore.QSize(125, 20))
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+        self.cmb_type = QtWidgets.QComboBox(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cmb_type.sizePolicy().hasHeightForWidth())
+        self.cmb_type.setSizePolicy(sizePolicy)
+        self.cmb_type.setMinimumSize(QtCore.QSize(520, 20))
+        self.cmb_type.setMaximumSize(QtCore.QSize(520, 40))
+        self.cmb_type.setObjectName("cmb_type")
+        self.gridLayout.addWidget(self.cmb_type, 1, 1, 1, 1)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.btn_edit = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.btn_edit.setMinimumSize(QtCore.QSize(0, 30))
+        self.btn_edit.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_edit.setFont(font)
+        self.btn_edit.setObjectName("btn_edit")
+        self.horizontalLayout_2.addWidget(self.btn_edit)
+        self.btn_clear = QtWidgets.QPushButton(self.gridLayoutWidget)
+        self.btn_clear.setMinimumSize(QtCore.QSize(0, 30))
+        self.btn_clear.setMaximumSize(QtCore.QSize(16777215, 30))
+        font = QtGui.QFont()
+        font.setBold(True)
+        font.setWeight(75)
+        self.btn_clear.setFont(font)
+        self.btn_clear.setObjectName("btn_clear")
+        self.horizontalLayout_2.addWidget(self.btn_clear)
+        self.gridLayout.addLayout(self.horizontalLayout_2, 5, 1, 1, 1)
+        self.label_3 = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_3.sizePolicy().hasHeightForWidth())
+        self.label_3.setSizePolicy(sizePolicy)
+        self.label_3.setMinimumSize(QtCore.QSize(120, 20))
+        self.label_3.setMaximumSize(QtCore.QSize(125, 20))
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+        self.label_4 = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_4.sizePolicy().hasHeightForWidth())
+        self.label_4.setSizePolicy(sizePolicy)
+        self.label_4.setMinimumSize(QtCore.QSize(125, 20))
+        self.label_4.setMaximumSize(QtCore.QSize(125, 20))
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 3, 0, 1, 1)
+        self.label_5 = QtWidgets.QLabel(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_5.sizePolicy().hasHeightForWidth())
+        self.label_5.setSizePolicy(sizePolicy)
+        self.label_5.setMinimumSize(QtCore.QSize(125, 20))
+        self.label_5.setMaximumSize(QtCore.QSize(125, 20))
+        self.label_5.setObjectName("label_5")
+        self.gridLayout.addWidget(self.label_5, 4, 0, 1, 1)
+        self.cal_doa = QtWidgets.QCalendarWidget(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cal_doa.sizePolicy().hasHeightForWidth())
+        self.cal_doa.setSizePolicy(sizePolicy)
+        self.cal_doa.setMinimumSize(QtCore.QSize(520, 200))
+        self.cal_doa.setMaximumSize(QtCore.QSize(520, 200))
+        self.cal_doa.setObjectName("cal_doa")
+        self.gridLayout.addWidget(self.cal_doa, 2, 1, 1, 1)
+        self.cal_dom = QtWidgets.QCalendarWidget(self.gridLayoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cal_dom.sizePolicy().hasHeightForWidth())
+        self.cal_dom.setSizePolicy(sizePolicy)
+        self.cal_dom.setMinimumSize(QtCore.QSize(520, 200))
+        self.cal_dom.setMaximumSize(QtCore.QSize(520, 200))
+        self.cal_dom.setObjectName("cal_dom")
+        self.gridLayout.addWidget(self.cal_dom, 3, 1, 1, 1)
+        self.verticalLayout.addWidget(self.groupBox)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        MainWindow.setTabOrder(self.txt_title, self.cmb_type)
+        MainWindow.setTabOrder(self.cmb_type, self.cal_doa)
+        MainWindow.setTabOrder(self.cal_doa, self.cal_dom)
+        MainWindow.setTabOrder(self.cal_dom, self.txt_description)
+        MainWindow.setTabOrder(self.txt_description, self.btn_edit)
+        MainWindow.setTabOrder(self.btn_edit, self.btn_clear)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Editor"))
+        self.lbl_name.setText(_translate("MainWindow", "Name"))
+        self.lbl_retro.setText(_translate("MainWindow", "Retro Collection"))
+        self.groupBox.setTitle(_translate("MainWindow", "Edit Selected Item"))
+        self.label.setText(_translate("MainWindow", "Title"))
+        self.label_2.setText(_translate("MainWindow", "Type"))
+        self.btn_edit.setText(_translate("MainWindow", "Save"))
+        self.btn_clear.setText(_translate("MainWindow", "Clear"))
+        self.label_3.setText(_translate("MainWindow", "Date Added"))
+        self.label_4.setText(_translate("MainWindow", "Date of Manufacture"))
+        self.label_5.setText(_translate("MainWindow", "Description"))
+
+
+UI_HASH = "a9b11ae6aeb3e7ad7acfa6620b61a9130bd41226"
@@ -0,0 +1,7 @@
+# The benchmarks package times the data layer and the item tables on synthetic collections of different sizes
+#
+#   python -m benchmarks.run --sizes 1000,10000,100000 --output results.json
+#   python -m benchmarks.compare before.json after.json
+#
+# The collections are made by the generate module, which always makes the same collection for the same size and seed,
+# so that the results of two commits can be compared
@@ -0,0 +1,49 @@
+# The compare file compares two benchmark results files, such as the results of two commits
+#
+#   python -m benchmarks.compare before.json after.json [--threshold 1.10]
+#
+# The median times of every operation and size found in both files are compared. An operation which became slower by
+# more than the threshold is reported as a regression, in which case the exit status is 1
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+
+def load(path: str) -> Dict[Tuple[int, str], float]:
+    with open(path) as infile:
+        report = json.load(infile)
+    return {(result["size"], result["operation"]): result["median_s"] for result in report["results"]}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare",
+                                     description="Compare two benchmark results files.")
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="ratio of the times above which an operation counts as slower (default: 1.10)")
+    args = parser.parse_args(argv)
+
+    before = load(args.before)
+    after = load(args.after)
+    regressions = 0
+    print(f"{'size':>9} {'operation':<20} {'before':>10} {'after':>10} {'ratio':>7}")
+    for key in sorted(before.keys() & after.keys()):
+        size, operation = key
+        ratio = after[key] / before[key] if before[key] else float("inf")
+        flag = ""
+        if ratio > args.threshold:
+            flag = "  slower"
+            regressions += 1
+        elif ratio < 1 / args.threshold:
+            flag = "  faster"
+        print(f"{size:>9,} {operation:<20} {before[key] * 1000:8.2f}ms {after[key] * 1000:8.2f}ms {ratio:7.2f}{flag}")
+
+    print(f"{regressions} regressions")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
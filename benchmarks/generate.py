@@ -0,0 +1,84 @@
+# The generate file makes synthetic collections for the benchmarks
+# The same count and seed always make the same collection, on any machine
+
+import datetime
+import random
+from typing import Dict, Iterator, List, Tuple
+from ItemCollection.snapshot import write_snapshot
+from ItemCollection.storage import JsonStorage
+from ItemCollection.store import write_store
+
+# The share of the collection taken by each type, roughly that of a real retro collection, where games and cartridges
+# far outnumber the machines playing them
+TYPE_WEIGHTS: Dict[str, int] = {
+    "Game": 40,
+    "Cartridge": 20,
+    "Console": 10,
+    "Computer": 10,
+    "Camera": 8,
+    "Phone": 7,
+    "Video Player": 5,
+}
+MAKERS: Tuple = ("Atari", "Commodore", "Nintendo", "Sega", "Sinclair", "Amstrad", "Sony", "Polaroid", "Nokia",
+                 "Panasonic", "NEC", "SNK", "Acorn", "Philips", "Motorola")
+WORDS: Tuple = ("Super", "Mega", "Turbo", "Classic", "Deluxe", "Mini", "Pro", "Portable", "Advance", "Color", "Master",
+                "Space", "Racer", "Quest", "Fighter", "Adventure", "Legend", "Star", "Power", "World")
+CONDITIONS: Tuple = ("boxed", "loose", "complete in box", "sealed", "working", "for parts", "refurbished", "manual only",
+                     "with cables", "scratched")
+# Items were made between FIRST_MADE and LAST_MADE and added to the collection between when they were made and
+# LAST_ADDED, which is fixed so that the collection does not depend on the day it is made
+FIRST_MADE: datetime.date = datetime.date(1975, 1, 1)
+LAST_MADE: datetime.date = datetime.date(2010, 12, 31)
+LAST_ADDED: datetime.date = datetime.date(2024, 12, 31)
+
+
+# The generate_records function yields count item records, in the same form as they are saved in items.json
+def generate_records(count: int, seed: int = 0) -> Iterator[dict]:
+    rng = random.Random(seed)
+    types: List[str] = list(TYPE_WEIGHTS)
+    weights: List[int] = list(TYPE_WEIGHTS.values())
+    first_made = FIRST_MADE.toordinal()
+    last_made = LAST_MADE.toordinal()
+    last_added = LAST_ADDED.toordinal()
+
+    for item_id in range(1, count + 1):
+        item_type = rng.choices(types, weights)[0]
+        maker = rng.choice(MAKERS)
+        title = f"{maker} {rng.choice(WORDS)} {rng.choice(WORDS)} {rng.randint(1, 999)}"
+        description = f"{maker} {item_type.lower()}, {rng.choice(CONDITIONS)}, {rng.choice(CONDITIONS)}"
+        dom = rng.randint(first_made, last_made)
+        # Most items are added within a few years of being made, a few long after
+        doa = min(last_added, dom + int(rng.expovariate(1 / 2000)))
+        yield {"_Item__id": item_id, "title": title, "item_type": item_type,
+               "doa": datetime.date.fromordinal(doa).isoformat(), "dom": datetime.date.fromordinal(dom).isoformat(),
+               "description": description}
+
+
+# The RecordItem class gives a record the attributes of an item, which is what the files are written from
+class RecordItem:
+    def __init__(self, record: dict):
+        self.record = record
+        self.id = record["_Item__id"]
+        self.title = record["title"]
+        self.item_type = record["item_type"]
+        self.doa = datetime.date.fromisoformat(record["doa"])
+        self.dom = datetime.date.fromisoformat(record["dom"])
+        self.description = record["description"]
+
+    def to_record(self) -> dict:
+        return self.record
+
+
+# The write_collection function writes a collection of count items to the directory, as items.json, items.snapshot or
+# items.store depending on fmt, together with the type.json and name.json files, without going through the Item class
+def write_collection(directory: str, count: int, seed: int = 0, fmt: str = "json") -> None:
+    items = [RecordItem(record) for record in generate_records(count, seed)]
+    storage = JsonStorage(directory)
+    if fmt == "snapshot":
+        write_snapshot(storage.path("items.snapshot"), items)
+    elif fmt == "store":
+        write_store(storage.path("items.store"), items)
+    else:
+        JsonStorage.export_json(storage.path("items.json"), items)
+    storage.save_types(list(TYPE_WEIGHTS))
+    storage.save_name("Benchmark")
@@ -0,0 +1,186 @@
+# The load test file sends a mix of requests to the HTTP server (ItemCollection/server.py) from many connections at once
+# and reports the requests per second and the latency percentiles of every kind of request
+#
+#   python -m benchmarks.load_test --spawn 100000 [--connections 32] [--duration 10] [--writes 0.1]
+#   python -m benchmarks.load_test --url http://127.0.0.1:8765
+#
+# With --spawn a server is started on a synthetic collection of that many items in a temporary folder and stopped
+# afterwards. Otherwise the server at --url is used, which is changed by the writes. Every connection keeps sending one
+# request after the other, a write with the probability given by --writes (half adding an item and half editing one)
+# and otherwise a read (looking up an item, a page of the items of one type or a page of all the items)
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+from benchmarks.generate import TYPE_WEIGHTS, write_collection
+
+
+# The Client class sends requests over a single kept-alive connection
+class Client:
+    def __init__(self, host: str, port: int):
+        self.host: str = host
+        self.port: int = port
+        self.reader = None
+        self.writer = None
+
+    async def connect(self) -> None:
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    # The request method sends a request and returns the status and the decoded JSON of the answer
+    async def request(self, method: str, path: str, body=None) -> Tuple[int, object]:
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        self.writer.write(f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(data)}\r\n"
+                          f"Content-Type: application/json\r\n\r\n".encode("latin-1") + data)
+        await self.writer.drain()
+        head = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(head[0].split(" ", 2)[1])
+        length = next(int(line.split(":", 1)[1]) for line in head[1:] if line.lower().startswith("content-length:"))
+        return status, json.loads(await self.reader.readexactly(length))
+
+
+# The percentile function returns the value below which the given fraction of the sorted values fall
+def percentile(values: List[float], fraction: float) -> float:
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+
+# The run_connection function keeps sending requests until the deadline and records the latency of each by kind
+async def run_connection(host: str, port: int, ids: List[int], writes: float, seed: int, deadline: float,
+                         latencies: Dict[str, List[float]], failures: Dict[str, int]) -> None:
+    rng = random.Random(seed)
+    types = list(TYPE_WEIGHTS)
+    client = Client(host, port)
+    await client.connect()
+    try:
+        while time.perf_counter() < deadline:
+            choice = rng.random()
+            if choice < writes / 2:
+                kind, method, path = "create", "POST", "/items"
+                body = {"title": f"Load test {rng.randrange(1 << 30)}", "item_type": rng.choice(types),
+                        "doa": "2020-01-01", "dom": "1990-01-01", "description": "Added by the load test"}
+            elif choice < writes:
+                kind, method, path = "update", "PUT", f"/items/{rng.choice(ids)}"
+                body = {"description": f"Edited by the load test {rng.randrange(1 << 30)}"}
+            elif choice < writes + (1 - writes) / 2:
+                kind, method, path, body = "get", "GET", f"/items/{rng.choice(ids)}", None
+            elif choice < writes + 3 * (1 - writes) / 4:
+                kind, method, path, body = "by_type", "GET", f"/items?type={rng.choice(types)}&limit=50", None
+            else:
+                kind, method, path, body = "list", "GET", f"/items?offset={rng.randrange(len(ids))}&limit=50", None
+
+            start = time.perf_counter()
+            status, _ = await client.request(method, path, body)
+            latencies.setdefault(kind, []).append(time.perf_counter() - start)
+            if status >= 400:
+                failures[kind] = failures.get(kind, 0) + 1
+    finally:
+        await client.close()
+
+
+# The load_test function runs the connections against the server and returns the report
+async def load_test(url: str, connections: int, duration: float, writes: float, seed: int) -> dict:
+    address = urlsplit(url)
+    host, port = address.hostname, address.port or 80
+
+    # The ids to look up and edit are taken from the first page of the items, so that they exist
+    client = Client(host, port)
+    await client.connect()
+    _, page = await client.request("GET", "/items?limit=1000")
+    await client.close()
+    ids = [row["id"] for row in page["items"]]
+    if not ids:
+        raise ValueError("The collection served is empty")
+
+    latencies: Dict[str, List[float]] = {}
+    failures: Dict[str, int] = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(run_connection(host, port, ids, writes, seed + number, start + duration, latencies, failures)
+                           for number in range(connections)))
+    elapsed = time.perf_counter() - start
+
+    results = {}
+    for kind, values in sorted(latencies.items()) + [("all", sum(latencies.values(), []))]:
+        values.sort()
+        results[kind] = {
+            "requests": len(values),
+            "requests_per_s": len(values) / elapsed,
+            "failures": sum(failures.values()) if kind == "all" else failures.get(kind, 0),
+            "mean_ms": statistics.mean(values) * 1000,
+            "p50_ms": percentile(values, 0.50) * 1000,
+            "p90_ms": percentile(values, 0.90) * 1000,
+            "p99_ms": percentile(values, 0.99) * 1000,
+            "max_ms": values[-1] * 1000,
+        }
+    return {"total_items": page["total"], "elapsed_s": elapsed, "results": results}
+
+
+# The spawn_server function starts a server on a synthetic collection of count items in the given folder and waits
+# until it is listening
+def spawn_server(directory: str, count: int, port: int, seed: int) -> subprocess.Popen:
+    write_collection(directory, count, seed, "snapshot")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, RETROCOLLECTION_DATA=directory, PYTHONPATH=root)
+    process = subprocess.Popen([sys.executable, "-m", "ItemCollection.server", "--port", str(port)], env=env,
+                               stdout=subprocess.PIPE, text=True, cwd=root)
+    line = process.stdout.readline()
+    if not line.startswith("Serving"):
+        process.kill()
+        raise RuntimeError("The server did not start")
+    return process
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test",
+                                     description="Load test the HTTP server of the collection.")
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--spawn", type=int, metavar="ITEMS",
+                        help="start a server on a synthetic collection of this many items instead of using --url")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run for (default: 10)")
+    parser.add_argument("--writes", type=float, default=0.1, help="fraction of the requests which are writes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the results as json to this file")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        process = None
+        url = args.url
+        if args.spawn is not None:
+            port = urlsplit(url).port or 8765
+            process = spawn_server(directory, args.spawn, port, args.seed)
+            url = f"http://127.0.0.1:{port}"
+        try:
+            report = asyncio.run(load_test(url, args.connections, args.duration, args.writes, args.seed))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    report["meta"] = {"python": platform.python_version(), "platform": platform.platform(),
+                      "cpu_count": os.cpu_count(), "connections": args.connections, "writes": args.writes}
+    print(f"{report['total_items']:,} items, {args.connections} connections, {report['elapsed_s']:.1f} s")
+    print(f"{'request':<10} {'count':>8} {'req/s':>9} {'fail':>5} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for kind, result in report["results"].items():
+        print(f"{kind:<10} {result['requests']:>8,} {result['requests_per_s']:>9,.0f} {result['failures']:>5} "
+              f"{result['p50_ms']:6.2f}ms {result['p90_ms']:6.2f}ms {result['p99_ms']:6.2f}ms {result['max_ms']:6.1f}ms")
+    if args.output:
+        with open(args.output, "w") as outfile:
+            json.dump(report, outfile, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+# The run file times the data layer and the item table on synthetic collections and writes the results to a json file
+#
+#   python -m benchmarks.run --sizes 1000,10000,100000,1000000 --output results.json
+#
+# Every operation is run several times on each size and the fastest and median times are kept. The table is shown on
+# the offscreen Qt platform, so no display is needed, and is left out if PyQt5 is not installed
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+from ItemCollection import Item
+from ItemCollection.store import open_store
+from benchmarks.generate import TYPE_WEIGHTS, write_collection
+
+LOOKUPS: int = 10000
+
+
+# The timed function runs the operation repeat times and returns the fastest and the median time it took
+# The setup function, when given, is run before every run without being timed
+def timed(operation: Callable[[], None], repeat: int, setup: Callable[[], None] = None) -> Dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        operation()
+        times.append(time.perf_counter() - start)
+    return {"min_s": min(times), "median_s": statistics.median(times), "runs": repeat}
+
+
+# The reload function forces the next load to read the collection from disk
+def reload() -> None:
+    Item.CACHE.invalidate()
+    Item.load_from_file()
+
+
+# The table_benchmarks function times showing the whole collection in a table, and then fetching every row into it as
+# if the user scrolled to the bottom, returning None when Qt is not available
+def table_benchmarks(repeat: int) -> Dict[str, Dict[str, float]]:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtWidgets import QApplication, QHeaderView, QTableView
+        from item_table_model import ItemTableModel
+    except ImportError:
+        return {}
+    app = QApplication.instance() or QApplication([])
+    views = []
+
+    def show_table() -> None:
+        model = ItemTableModel(Item.ITEM_LIST)
+        view = QTableView()
+        view.setModel(model)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        view.horizontalHeader().setResizeContentsPrecision(100)
+        view.resize(1000, 700)
+        view.show()
+        app.processEvents()
+        views.append(view)
+
+    def fetch_all() -> None:
+        view = views[-1]
+        model = view.model()
+        while model.canFetchMore():
+            model.fetchMore()
+        app.processEvents()
+
+    results = {"table_show": timed(show_table, repeat)}
+    results["table_fetch_all"] = timed(fetch_all, repeat, setup=show_table)
+    for view in views:
+        view.close()
+        view.deleteLater()
+    app.processEvents()
+    return results
+
+
+# The run_size function times every operation on a collection of count items and returns the results by operation
+def run_size(count: int, seed: int, repeat: int, table: bool, directory: str) -> Dict[str, Dict[str, float]]:
+    json_dir = os.path.join(directory, f"json-{count}")
+    snapshot_dir = os.path.join(directory, f"snapshot-{count}")
+    store_dir = os.path.join(directory, f"store-{count}")
+    save_dir = os.path.join(directory, f"save-{count}")
+    for path, fmt in ((json_dir, "json"), (snapshot_dir, "snapshot"), (store_dir, "store")):
+        os.makedirs(path)
+        write_collection(path, count, seed, fmt)
+    os.makedirs(save_dir)
+
+    results = {}
+    Item.use_directory(snapshot_dir)
+    results["load_snapshot"] = timed(reload, repeat)
+    Item.use_directory(store_dir)
+    results["load_store"] = timed(reload, repeat)
+    Item.use_directory(json_dir)
+    results["load_json"] = timed(reload, repeat)
+    results["load_cached"] = timed(Item.load_from_file, repeat)
+
+    Item.use_directory(save_dir)
+    results["save_json"] = timed(Item.save_to_file, repeat)
+    Item.STORAGE.enable_snapshot()
+    results["save_snapshot"] = timed(Item.save_to_file, repeat)
+
+    rng = random.Random(seed)
+    ids = [rng.randint(1, count) for _ in range(LOOKUPS)]
+    results["get_by_id_10k"] = timed(lambda: [Item.get_by_id(item_id) for item_id in ids], repeat)
+    results["by_type_all_types"] = timed(lambda: [Item.by_type(item_type) for item_type in TYPE_WEIGHTS], repeat)
+    results["scan_type_all_types"] = timed(
+        lambda: [[x for x in Item.ITEM_LIST if x.item_type == item_type] for item_type in TYPE_WEIGHTS], repeat)
+
+    results.update(store_benchmarks(store_dir, ids, repeat))
+
+    if table:
+        results.update(table_benchmarks(repeat))
+    return results
+
+
+# The store_benchmarks function times opening the item store in the folder and looking up items in it without loading
+# the collection
+def store_benchmarks(directory: str, ids: List[int], repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {"store_open": timed(lambda: open_store(directory).close(), repeat)}
+    with open_store(directory) as store:
+        results["store_get_by_id_10k"] = timed(lambda: [store.get_by_id(item_id) for item_id in ids], repeat)
+        results["store_type_pages"] = timed(
+            lambda: [list(store.by_type(item_type, 1000, 50)) for item_type in TYPE_WEIGHTS], repeat)
+        results["store_dom_one_year"] = timed(
+            lambda: list(store.between("dom", datetime.date(1985, 1, 1), datetime.date(1985, 12, 31))), repeat)
+    return results
+
+
+# The git_commit function returns the commit the benchmarks were run on, or None outside of a git checkout
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run",
+                                     description="Time the data layer on synthetic collections.")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma separated collection sizes (default: 1000,10000,100000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs of every operation, collections of over 100,000 items are run once")
+    parser.add_argument("--no-table", action="store_true", help="leave out the Qt table benchmarks")
+    parser.add_argument("--output", default="benchmark-results.json")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "seed": args.seed,
+        },
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in sizes:
+            repeat = args.repeat if count <= 100000 else 1
+            for operation, result in run_size(count, args.seed, repeat, not args.no_table, directory).items():
+                report["results"].append({"size": count, "operation": operation, **result})
+                print(f"{count:>9,} {operation:<20} {result['median_s'] * 1000:10.2f} ms")
+            sys.stdout.flush()
+
+    with open(args.output, "w") as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
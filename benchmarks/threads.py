@@ -0,0 +1,119 @@
+# The threads file measures how many reads a collection answers per second when they come from several threads at once,
+# with and without a thread making changes at the same time
+#
+#   python -m benchmarks.threads [--items 100000] [--threads 1,2,4,8] [--duration 2] [--writer]
+#
+# Every reading thread keeps looking up an item by id, a page of the items of one type or the items made in a random
+# year, one after the other. With --writer another thread keeps changing the description of a random item, which takes
+# the write lock of the collection (see ItemCollection/rwlock.py) and keeps the readers out while it does
+# The collection is built in memory from the synthetic records of generate.py, so nothing is read from or written to disk
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from typing import Dict, List
+from ItemCollection.collection import Collection
+from benchmarks.generate import FIRST_MADE, LAST_MADE, TYPE_WEIGHTS, generate_records
+
+
+# The read function keeps reading from the collection until stop is set and returns how many reads it made
+def read(collection: Collection, count: int, seed: int, stop: threading.Event) -> int:
+    rng = random.Random(seed)
+    types = list(TYPE_WEIGHTS)
+    reads = 0
+    while not stop.is_set():
+        choice = rng.random()
+        if choice < 0.5:
+            collection.get_by_id(rng.randint(1, count))
+        elif choice < 0.8:
+            collection.by_type(rng.choice(types), rng.randrange(100), 50)
+        else:
+            year = rng.randint(FIRST_MADE.year, LAST_MADE.year)
+            for _ in collection.query(dom=(datetime.date(year, 1, 1), datetime.date(year, 1, 31))):
+                pass
+        reads += 1
+    return reads
+
+
+# The write function keeps changing the description of a random item until stop is set and returns how many changes it
+# made
+def write(collection: Collection, count: int, seed: int, stop: threading.Event) -> int:
+    rng = random.Random(seed)
+    writes = 0
+    while not stop.is_set():
+        item = collection.get_by_id(rng.randint(1, count))
+        if item is not None:
+            item.description = f"Changed by the benchmark {rng.randrange(1 << 30)}"
+        writes += 1
+    return writes
+
+
+# The run_threads function runs the given number of reading threads, and the writing thread when writer is set, for
+# duration seconds and returns the reads and writes made per second
+def run_threads(collection: Collection, count: int, threads: int, duration: float, writer: bool,
+                seed: int) -> Dict[str, float]:
+    stop = threading.Event()
+    results: List[int] = [0] * threads
+    writes: List[int] = [0]
+
+    def reader(number: int) -> None:
+        results[number] = read(collection, count, seed + number, stop)
+
+    def changer() -> None:
+        writes[0] = write(collection, count, seed - 1, stop)
+
+    workers = [threading.Thread(target=reader, args=(number,)) for number in range(threads)]
+    if writer:
+        workers.append(threading.Thread(target=changer))
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    return {"reads_per_s": sum(results) / elapsed, "writes_per_s": writes[0] / elapsed}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.threads",
+                                     description="Measure the read throughput of a collection shared by threads.")
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--threads", default="1,2,4,8", help="comma separated numbers of reading threads")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds to run each number of threads for")
+    parser.add_argument("--writer", action="store_true", help="also change items from another thread")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the results as json to this file")
+    args = parser.parse_args(argv)
+
+    collection = Collection()
+    collection.import_records(generate_records(args.items, args.seed))
+
+    report = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                       "cpu_count": os.cpu_count(), "items": args.items, "writer": args.writer},
+              "results": {}}
+    print(f"{args.items:,} items, {os.cpu_count()} cores{', with a writer' if args.writer else ''}")
+    print(f"{'threads':>7} {'reads/s':>10} {'speedup':>8} {'writes/s':>9}")
+    single = None
+    for threads in (int(number) for number in args.threads.split(",")):
+        result = run_threads(collection, args.items, threads, args.duration, args.writer, args.seed)
+        single = single or result["reads_per_s"]
+        report["results"][threads] = result
+        print(f"{threads:>7} {result['reads_per_s']:>10,.0f} {result['reads_per_s'] / single:>7.2f}x "
+              f"{result['writes_per_s']:>9,.0f}")
+
+    if args.output:
+        with open(args.output, "w") as outfile:
+            json.dump(report, outfile, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+# The item table model file contains the table model shared by all the windows which show the items in a table
+
+import bisect
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from ItemCollection import Item, instrumentation
+from ItemCollection.events import ADDED, REMOVED, RESET, UPDATED, Event
+
+
+# The runs function groups increasing positions into runs of consecutive positions, given as (first, last) pairs
+def runs(positions: List[int]) -> Iterator[Tuple[int, int]]:
+    first = last = None
+    for position in positions:
+        if last is not None and position == last + 1:
+            last = position
+            continue
+        if first is not None:
+            yield first, last
+        first = last = position
+    if first is not None:
+        yield first, last
+
+
+# The SORT_KEYS are the functions giving the key which every column of the table is sorted by
+# The keys are the typed values rather than the text shown, so that the dates sort by date and not by the day of the
+# month, and the texts sort without regard to case. Every key ends with the id of the item, so that no two keys are the
+# same and the items with the same value keep the order they were added in
+SORT_KEYS: Tuple = (
+    lambda x: (x.title.casefold(), x.id),
+    lambda x: (x.item_type.casefold(), x.id),
+    lambda x: (x._doa, x.id),
+    lambda x: (x._dom, x.id),
+    lambda x: (x.description.casefold(), x.id),
+)
+SORT_FIELDS: Tuple = ("title", "item_type", "doa", "dom", "description")
+
+
+# The SortOrder class keeps a list of items sorted by one column of the table
+# It is sorted once when it is made and is then kept sorted as items are added, removed and edited, by finding their
+# place with a binary search, so that a change costs a search and a move of the list rather than sorting it again
+# The key of every item is kept from the time it was added, so that an edited item is found at its old place after its
+# fields have already changed
+class SortOrder:
+    def __init__(self, column: int, items: List):
+        self.key = SORT_KEYS[column]
+        self.field: str = SORT_FIELDS[column]
+        keys = [self.key(x) for x in items]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self.keys: List = [keys[position] for position in order]
+        self.items: List = [items[position] for position in order]
+        self.keys_by_id: Dict[int, object] = {x.id: key for x, key in zip(items, keys)}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item) -> bool:
+        return item.id in self.keys_by_id
+
+    # The add method puts an item at its place and returns the place
+    def add(self, item) -> int:
+        key = self.key(item)
+        position = bisect.bisect_left(self.keys, key)
+        self.keys.insert(position, key)
+        self.items.insert(position, item)
+        self.keys_by_id[item.id] = key
+        return position
+
+    # The remove method takes an item out and returns the place it was at, or None if it was not in the order
+    def remove(self, item) -> Optional[int]:
+        key = self.keys_by_id.pop(item.id, None)
+        if key is None:
+            return None
+        position = bisect.bisect_left(self.keys, key)
+        del self.keys[position]
+        del self.items[position]
+        return position
+
+    # The update method moves an edited item to its new place and returns its old and new places
+    def update(self, item) -> Tuple[int, int]:
+        return self.remove(item), self.add(item)
+
+    # The position method returns the place of an item in the order
+    def position(self, item) -> int:
+        return bisect.bisect_left(self.keys, self.keys_by_id[item.id])
+
+
+# The ItemTableModel class shows a list of items, by default the whole Item.ITEM_LIST, in a QTableView
+# The model reads the items straight from the list instead of copying them into table cells. The cells are only
+# formatted when the view asks for them, which is only for the rows on screen
+# Rows are handed to the view in batches (fetchMore) as the user scrolls down, so opening a window costs the same no
+# matter how many items there are in the collection
+# The model follows the changes to the collection through the Item.EVENTS, inserting, removing or repainting only the
+# rows affected by each change. When the model shows the ITEM_LIST itself the rows are found from the positions carried
+# by the events, and _size is the length of the list as far as the events received so far go. When it shows another
+# list, such as the results of a search, the removed items are taken out of it, and the added or edited items are put
+# in it or taken out of it according to the accepts function, which tells whether an item belongs in the list. Without
+# an accepts function the list never takes in new items
+# The table can be sorted by any column (sort). The order of every column is only worked out the first time the table
+# is sorted by it and is then kept, and kept up to date with the changes, in _orders, so that turning the order around
+# or sorting by a column again never sorts the items again. While the table is sorted the rows are the items of the
+# SortOrder of the column, read backwards when the order is descending
+class ItemTableModel(QAbstractTableModel):
+    HEADERS = ("Title", "Item Type", "DOA", "DOM", "Description")
+
+    def __init__(self, items: List = None, batch_size: int = 500, accepts: Callable[[Item], bool] = None):
+        super().__init__()
+        self._items: List = items if items is not None else Item.ITEM_LIST
+        self._accepts: Callable[[Item], bool] = accepts
+        self._batch_size: int = batch_size
+        self._loaded: int = min(batch_size, len(self._items))
+        self._size: int = len(self._items)
+        self._orders: Dict[int, SortOrder] = {}
+        self._sort_column: int = -1
+        self._descending: bool = False
+        # The model stops listening once Qt deletes it, for example together with the view it was given to, since a
+        # deleted model can no longer take in the changes
+        events = Item.EVENTS
+        callback = events.subscribe(self.on_event)
+        self.destroyed.connect(lambda: events.unsubscribe(callback))
+
+    # The item method returns the item shown in the given row
+    def item(self, row: int) -> Item:
+        if self._sort_column < 0:
+            return self._items[row]
+        order = self._orders[self._sort_column].items
+        return order[len(order) - 1 - row if self._descending else row]
+
+    # The ids method returns the ids of the items shown in the given rows
+    def ids(self, rows: List[int]) -> List[int]:
+        return [self.item(row).id for row in rows]
+
+    # The sort method shows the items sorted by the given column, or in the order of the list for a column of -1
+    # The order of the column is taken from _orders when the table was sorted by it before
+    # With instrumentation on, the time taken is recorded as "table.sort"
+    def sort(self, column: int, order: int = Qt.AscendingOrder) -> None:
+        with instrumentation.phase("table.sort") as run:
+            self.beginResetModel()
+            self._sort_column = column if 0 <= column < len(SORT_KEYS) else -1
+            self._descending = order == Qt.DescendingOrder
+            self._size = len(self._items)
+            # The orders are only kept up to date while the table is sorted
+            if self._sort_column < 0:
+                self._orders.clear()
+            elif self._sort_column not in self._orders:
+                self._orders[self._sort_column] = SortOrder(self._sort_column, self._items)
+                run["items"] = len(self._items)
+            self.endResetModel()
+
+    # The refresh method shows the list again after it has been changed, or shows another list of items, which takes in
+    # the items for which accepts returns True
+    # With instrumentation on, the time taken by the view to take in the new rows is recorded as "table.refresh"
+    def refresh(self, items: List = None, accepts: Callable[[Item], bool] = None) -> None:
+        with instrumentation.phase("table.refresh") as run:
+            self.beginResetModel()
+            if items is not None:
+                self._items = items
+                self._accepts = accepts
+            self._orders.clear()
+            if self._sort_column >= 0:
+                self._orders[self._sort_column] = SortOrder(self._sort_column, self._items)
+            self._loaded = min(self._batch_size, len(self._items))
+            self._size = len(self._items)
+            self.endResetModel()
+            run["rows"] = self._loaded
+            run["items"] = len(self._items)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(ItemTableModel.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+
+        x = self.item(index.row())
+        column = index.column()
+        if column == 0:
+            return x.title
+        if column == 1:
+            return x.item_type
+        if column == 2:
+            return x.doa.strftime("%d/%m/%Y")
+        if column == 3:
+            return x.dom.strftime("%d/%m/%Y")
+        return x.description
+
+    def headerData(self, section: int, orientation: int, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return ItemTableModel.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._items)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self._batch_size, len(self._items) - self._loaded)
+        if count <= 0:
+            return
+        with instrumentation.phase("table.fetch", rows=count):
+            self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+            self._loaded += count
+            self.endInsertRows()
+
+    # The on_event method updates the rows affected by a change to the collection
+    def on_event(self, event: Event) -> None:
+        if self._orders and event.kind != RESET:
+            self.__sorted_event(event)
+            return
+
+        if self._items is Item.ITEM_LIST:
+            if event.kind == RESET:
+                self.refresh()
+            elif event.kind == ADDED:
+                for first, last in runs(event.positions):
+                    self.__inserted(first, last - first + 1)
+            elif event.kind == REMOVED:
+                for first, last in reversed(list(runs(event.positions))):
+                    self.__removed(first, last - first + 1)
+            elif event.kind == UPDATED and self._loaded:
+                self.dataChanged.emit(self.index(0, 0), self.index(self._loaded - 1, self.columnCount() - 1))
+            return
+
+        # The list shown is not the ITEM_LIST, so the rows of the items are found by going through it. After a RESET the
+        # list is left to the window, which knows how it was made
+        if event.kind == ADDED:
+            for item in event.items:
+                if self._accepts is not None and self._accepts(item):
+                    self.__appended(item)
+        elif event.kind == UPDATED:
+            rows = {id(x): row for row, x in enumerate(self._items)}
+            removed = set()
+            for item in event.items:
+                row = rows.get(id(item))
+                if row is None:
+                    if self._accepts is not None and self._accepts(item):
+                        rows[id(item)] = len(self._items)
+                        self.__appended(item)
+                elif self._accepts is not None and not self._accepts(item):
+                    removed.add(row)
+                elif row < self._loaded:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+            self.__remove_rows(sorted(removed))
+        elif event.kind == REMOVED:
+            ids = set(x.id for x in event.items)
+            self.__remove_rows([row for row, x in enumerate(self._items) if x.id in ids])
+
+    # The __inserted method shows the count items inserted into the ITEM_LIST from the given position, when they fall
+    # among the rows shown. Items added after the last row are left to fetchMore, unless every item was shown, in which
+    # case up to a batch of them is shown straight away
+    def __inserted(self, position: int, count: int) -> None:
+        all_shown = self._loaded == self._size
+        self._size += count
+        if position < self._loaded:
+            shown = count
+        elif all_shown:
+            shown = min(count, self._batch_size)
+        else:
+            return
+        self.beginInsertRows(QModelIndex(), position, position + shown - 1)
+        self._loaded += shown
+        self.endInsertRows()
+
+    # The __removed method takes out the rows of the count items removed from the ITEM_LIST from the given position
+    def __removed(self, position: int, count: int) -> None:
+        self._size -= count
+        if position >= self._loaded:
+            return
+        last = min(position + count, self._loaded) - 1
+        self.beginRemoveRows(QModelIndex(), position, last)
+        self._loaded -= last - position + 1
+        self.endRemoveRows()
+
+    # The __appended method adds an item to the end of a list which is not the ITEM_LIST
+    def __appended(self, item: Item) -> None:
+        if self._loaded < len(self._items):
+            self._items.append(item)
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded)
+        self._items.append(item)
+        self._loaded += 1
+        self.endInsertRows()
+
+    # The __remove_rows method removes the given rows, in increasing order, from a list which is not the ITEM_LIST
+    def __remove_rows(self, rows: List[int]) -> None:
+        for row in reversed(rows):
+            if row >= self._loaded:
+                del self._items[row]
+                continue
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._items[row]
+            self._loaded -= 1
+            self.endRemoveRows()
+
+    # The __sorted_event method updates the rows affected by a change to the collection, and every order kept in
+    # _orders, when the table has been sorted
+    # A change moves the item within every order, with a binary search, and inserts or removes the row it is shown in
+    def __sorted_event(self, event: Event) -> None:
+        own_list = self._items is Item.ITEM_LIST
+        orders = list(self._orders.values())
+        if event.kind == ADDED:
+            for item in event.items:
+                if own_list or (self._accepts is not None and self._accepts(item)):
+                    self.__sorted_add(item, orders, own_list)
+        elif event.kind == REMOVED:
+            for item in event.items:
+                if item in orders[0]:
+                    self.__sorted_remove(item, orders, own_list)
+        elif event.kind == UPDATED:
+            for item in event.items:
+                if item not in orders[0]:
+                    if not own_list and self._accepts is not None and self._accepts(item):
+                        self.__sorted_add(item, orders, own_list)
+                    continue
+                if not own_list and self._accepts is not None and not self._accepts(item):
+                    self.__sorted_remove(item, orders, own_list)
+                    continue
+                current = self._orders[self._sort_column]
+                for order in orders:
+                    if order.field not in event.fields:
+                        continue
+                    old_position, new_position = order.update(item)
+                    if order is current and old_position != new_position:
+                        self.__hide_row(self.__row(old_position))
+                        self.__show_row(self.__row(new_position))
+                row = self.__row(current.position(item))
+                if row < self._loaded:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    # The __row method returns the row showing the given place of the current order, which holds size items
+    def __row(self, position: int, size: int = None) -> int:
+        if not self._descending:
+            return position
+        size = size if size is not None else len(self._orders[self._sort_column])
+        return size - 1 - position
+
+    # The __sorted_add method puts an item into every order, and into the list when it is not the ITEM_LIST, and shows
+    # its row
+    def __sorted_add(self, item: Item, orders: List[SortOrder], own_list: bool) -> None:
+        if not own_list:
+            self._items.append(item)
+        self._size += 1
+        for order in orders:
+            position = order.add(item)
+            if order is self._orders[self._sort_column]:
+                self.__show_row(self.__row(position))
+
+    # The __sorted_remove method takes an item out of every order, and out of the list when it is not the ITEM_LIST,
+    # and removes its row
+    def __sorted_remove(self, item: Item, orders: List[SortOrder], own_list: bool) -> None:
+        if not own_list:
+            self._items.remove(item)
+        self._size -= 1
+        for order in orders:
+            position = order.remove(item)
+            if order is self._orders[self._sort_column]:
+                self.__hide_row(self.__row(position, len(order) + 1))
+
+    # The __show_row method inserts the row of an item put at the given row, when it falls among the rows shown or every
+    # row was shown before
+    def __show_row(self, row: int) -> None:
+        if row > self._loaded or (row == self._loaded and self._loaded + 1 < self._size):
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._loaded += 1
+        self.endInsertRows()
+
+    # The __hide_row method removes the given row, when it is shown
+    def __hide_row(self, row: int) -> None:
+        if row >= self._loaded:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._loaded -= 1
+        self.endRemoveRows()
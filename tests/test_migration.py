@@ -0,0 +1,71 @@
+# The test_migration file checks that moving a collection from its json files to a SQLite database (see storage.py)
+# copies every item, including the changes which are only saved in the journal
+# Run it with python -m pytest tests
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from ItemCollection.collection import Collection
+from ItemCollection.storage import JsonStorage
+
+TYPES = ["Computer", "Camera", "Phone", "Video Player"]
+
+
+class MigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open(os.path.join(self.directory, "type.json"), "w") as outfile:
+            json.dump(TYPES, outfile)
+        self.collections = []
+
+    def tearDown(self):
+        for collection in self.collections:
+            collection.flush()
+        shutil.rmtree(self.directory)
+
+    def open(self) -> Collection:
+        collection = Collection(JsonStorage(self.directory))
+        self.collections.append(collection)
+        return collection
+
+    # The save_with_journal method saves a few items in full and then changes them through the journal only, and
+    # returns the records the collection ends up with
+    def save_with_journal(self) -> list:
+        collection = self.open()
+        collection.enable_journal()
+        collection.load_from_file()
+        items = [collection.create(f"Item {number}", TYPES[number % len(TYPES)], datetime.date(2000 + number, 1, 1),
+                                   datetime.date(1980 + number, 1, 1), "") for number in range(10)]
+        collection.save_to_file()
+
+        items[0].title = "Edited"
+        collection.save_change("edit", items[0])
+        collection.save_change("add", collection.create("Added", "Phone", datetime.date(2020, 1, 1),
+                                                        datetime.date(1999, 1, 1), ""))
+        collection.delete_many([items[1].id])
+        collection.flush()
+        self.assertGreater(os.path.getsize(os.path.join(self.directory, "items.journal")), 0)
+        return [x.to_record() for x in collection.items]
+
+    def migrated_records(self, collection: Collection) -> list:
+        collection.use_sqlite(os.path.join(self.directory, "collection.db"))
+        return list(collection.storage.load_items())
+
+    def test_migrate_with_journal_enabled(self):
+        expected = self.save_with_journal()
+        collection = self.open()
+        collection.enable_journal()
+        self.assertEqual(self.migrated_records(collection), expected)
+
+    # A collection opened without enable_journal still copies the changes left in the journal
+    def test_migrate_with_pending_journal(self):
+        expected = self.save_with_journal()
+        self.assertEqual(self.migrated_records(self.open()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# The test_statistics file checks that the statistics kept up to date by the collection (see statistics.py) always match
+# the statistics counted again from all the items, through random additions, edits and deletions, saves and reloads,
+# and that the statistics saved in statistics.json are only taken up while they are those of the items saved
+# Run it with python -m pytest tests
+
+import datetime
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from ItemCollection.collection import Collection
+from ItemCollection.statistics import Statistics
+from ItemCollection.storage import JsonStorage
+
+TYPES = ["Computer", "Camera", "Phone", "Video Player"]
+
+
+# The random_date function returns a date between 1970 and 2023, so that the items fall in many months and decades
+def random_date(rng: random.Random) -> datetime.date:
+    return datetime.date(1970, 1, 1) + datetime.timedelta(days=rng.randrange(54 * 365))
+
+
+class StatisticsTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open(os.path.join(self.directory, "type.json"), "w") as outfile:
+            json.dump(TYPES, outfile)
+        self.rng = random.Random(25)
+        self.collections = []
+
+    # The changes the journals still hold back are written before the folder is removed, so that their timers do not
+    # write them after it was
+    def tearDown(self):
+        for collection in self.collections:
+            collection.flush()
+        shutil.rmtree(self.directory)
+
+    # The open method returns the collection saved in the test folder, saved with the journal and, when snapshot is
+    # True, the binary snapshot
+    def open(self, snapshot: bool = False) -> Collection:
+        collection = Collection(JsonStorage(self.directory))
+        collection.enable_journal()
+        if snapshot:
+            collection.enable_snapshot()
+        collection.load_from_file()
+        self.collections.append(collection)
+        return collection
+
+    def assertCounted(self, collection: Collection) -> None:
+        self.assertEqual(collection.summary(), Statistics.compute(collection.items).summary())
+
+    # The change method makes a random addition, edit or deletion and saves it
+    def change(self, collection: Collection) -> None:
+        rng = self.rng
+        action = rng.random()
+        if action < 0.5 or not collection.items:
+            item = collection.create(f"Item {rng.randrange(1000)}", rng.choice(TYPES), random_date(rng),
+                                     random_date(rng), "")
+            collection.save_change("add", item)
+        elif action < 0.8:
+            item = rng.choice(collection.items)
+            field = rng.choice(["title", "item_type", "doa", "dom"])
+            value = {"title": f"Item {rng.randrange(1000)}", "item_type": rng.choice(TYPES),
+                     "doa": random_date(rng), "dom": random_date(rng)}[field]
+            setattr(item, field, value)
+            collection.save_change("edit", item)
+        else:
+            collection.delete_many([rng.choice(collection.items).id])
+
+    def run_changes(self, snapshot: bool) -> None:
+        collection = self.open(snapshot)
+        for step in range(600):
+            self.change(collection)
+            if step % 50 == 0:
+                self.assertCounted(collection)
+            if step % 150 == 149:
+                collection.save_to_file()
+            if step % 200 == 199:
+                collection.flush()
+                summary = collection.summary()
+                collection = self.open(snapshot)
+                self.assertEqual(collection.summary(), summary)
+                self.assertCounted(collection)
+        self.assertCounted(collection)
+        self.assertEqual(collection.check_statistics(), [])
+
+    def test_random_changes(self):
+        self.run_changes(snapshot=False)
+
+    def test_random_changes_with_snapshot(self):
+        self.run_changes(snapshot=True)
+
+    # The statistics saved with the items are taken up as they are when the items have not changed since, which the
+    # made up count shows
+    def test_saved_statistics_used(self):
+        collection = self.open()
+        for _ in range(100):
+            self.change(collection)
+        collection.save_to_file()
+        path = os.path.join(self.directory, "statistics.json")
+        with open(path) as infile:
+            saved = json.load(infile)
+        self.assertEqual(saved["statistics"], collection.summary())
+        saved["statistics"]["items"] += 1000
+        with open(path, "w") as outfile:
+            json.dump(saved, outfile)
+
+        self.assertEqual(self.open().summary()["items"], len(collection.items) + 1000)
+
+    # Statistics saved with items which were changed since are counted again, and written again with the next save
+    def test_stale_statistics_rebuilt(self):
+        collection = self.open()
+        for _ in range(100):
+            self.change(collection)
+        collection.save_to_file()
+        path = os.path.join(self.directory, "statistics.json")
+        shutil.copy(path, path + ".old")
+        for _ in range(100):
+            self.change(collection)
+        collection.save_to_file()
+        os.replace(path + ".old", path)
+
+        reloaded = self.open()
+        self.assertIsNone(reloaded.storage.load_statistics())
+        self.assertEqual(reloaded.summary(), collection.summary())
+        self.assertCounted(reloaded)
+
+        reloaded.save_to_file()
+        with open(path) as infile:
+            saved = json.load(infile)
+        self.assertEqual(saved["statistics"], reloaded.summary())
+        self.assertIsNotNone(reloaded.storage.load_statistics())
+
+
+if __name__ == "__main__":
+    unittest.main()
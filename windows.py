@@ -0,0 +1,803 @@
+# The windows file contains all the window classes of the front end and the main logic to run the program
+# It is only imported by app.py once the GUI is started, since importing it loads Qt
+
+import importlib
+import os
+import sys
+from typing import Dict, List
+from PyQt5 import uic
+from PyQt5.Qt import QDate
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (QAbstractItemView, QComboBox, QMainWindow, QApplication, QHeaderView, QInputDialog,
+                             QMessageBox, QTableWidgetItem)
+from ItemCollection import Item
+from ItemCollection.events import ADDED, REMOVED, RESET, TYPES_CHANGED, UPDATED, Event
+from ItemCollection.indexes import tokenize
+from item_table_model import ItemTableModel
+from UserInterface.compile import ui_hash
+
+UI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "UserInterface")
+
+
+# The ui_path function returns the path of a .ui file, so that the windows load no matter which folder the program is
+# started from
+def ui_path(name: str) -> str:
+    return os.path.join(UI_DIR, name)
+
+
+# The load_ui function builds the widgets of the window from the named .ui file and returns the object holding them
+# The module compiled from the .ui file (see UserInterface/compile.py) builds the widgets without reading any xml, so it
+# is used whenever it was compiled from the current .ui file. Otherwise the .ui file is read at runtime
+def load_ui(name: str, window: QMainWindow):
+    path = ui_path(name + ".ui")
+    try:
+        module = importlib.import_module(f"UserInterface.{name}_ui")
+        if not os.path.isfile(path) or module.UI_HASH == ui_hash(path):
+            # The compiled class is named Ui_ followed by the name of the window in Qt Designer
+            ui_class = next(value for key, value in vars(module).items() if key.startswith("Ui_"))
+            ui = ui_class()
+            ui.setupUi(window)
+            return ui
+    except (ImportError, AttributeError, StopIteration):
+        pass
+    return uic.loadUi(path, window)
+
+
+# The WindowManager class keeps a single instance of every window
+# A window is only built the first time it is shown. Afterwards the same window is refreshed, with its refresh method,
+# and shown again, which spares building all of its widgets every time a menu button is pressed. Closing a window only
+# hides it
+# The manager also holds on to the windows, which would otherwise be left to the garbage collector once the function
+# showing them returns
+class WindowManager:
+    def __init__(self):
+        self.windows: Dict[type, QMainWindow] = {}
+
+    # The show method shows the window of the given class, building it the first time and refreshing it afterwards
+    # Any arguments, such as the item to edit, are given to the window when it is built and when it is refreshed
+    def show(self, window_class: type, *args) -> QMainWindow:
+        window = self.windows.get(window_class)
+        if window is None:
+            window = self.windows[window_class] = window_class(*args)
+        else:
+            window.refresh(*args)
+        window.show()
+        window.raise_()
+        window.activateWindow()
+        return window
+
+
+WINDOWS = WindowManager()
+
+
+# The patch_types function brings the types in a combo box in line with the given types, adding the missing types at
+# their place and removing the types which are gone, while leaving the other entries, and the one selected, as they are
+# Every type is kept as the data of its entry. Entries with no data, such as "All Types", are left alone
+def patch_types(combo: QComboBox, types: List[str]) -> None:
+    for index in reversed(range(combo.count())):
+        item_type = combo.itemData(index)
+        if item_type is not None and item_type not in types:
+            combo.removeItem(index)
+    for position, item_type in enumerate(types):
+        if combo.findData(item_type) < 0:
+            combo.insertItem(position, item_type, item_type)
+
+
+# The columns of the item tables are sized to fit the first RESIZE_PRECISION rows instead of every row fetched, which
+# made opening the windows showing the items take several times longer
+RESIZE_PRECISION = 100
+
+
+# The MenuWindow class is used to display the main menu, containing 6 buttons
+# 1. Add Items
+# 2. Edit Items
+# 3. Show Items
+# 4. Add Type
+# 5. Collection Statistics
+# 6. Exit
+# The first five buttons all link to other different windows and the exit buttons quits the program
+class MenuWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.ui = load_ui("main_menu", self)
+        self.setGeometry(0, 0, 700, 700)
+        self.build_ui()
+        self._error_message = ""
+        Item.load_types()
+
+    def build_ui(self):
+        self.ui.lbl_name.setText(Item.NAME)
+        self.ui.btn_add_item.clicked.connect(add_items_window)
+        self.ui.btn_edit.clicked.connect(edit_items_window)
+        self.ui.btn_show.clicked.connect(show_items_window)
+        self.ui.btn_add_type.clicked.connect(add_type_window)
+        self.ui.btn_statistics.clicked.connect(statistics_window)
+        self.ui.btn_exit.clicked.connect(exit_app)
+
+    def refresh(self) -> None:
+        Item.load_types()
+
+
+# The AddWindow class is the view for when adding a new item to the collection
+# The user enters the necessary data as required and presses the add button to add the item to the list
+# The calendars are restricted to not allow users to select future dates
+# The user also has the ability to clear the form
+# The list of items is also shown in the same view in a table and the user has the ability to delete items.
+# In the table, the first four columns are resized to fit contents and the the description column is stretched to the
+# max possible length since this might be longer than the other fields
+class AddWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.ui = load_ui("add_items", self)
+        self.setGeometry(0, 0, 700, 700)
+        self.build_ui()
+        self._error_message = ""
+
+    def build_ui(self):
+        self.ui.lbl_name.setText(Item.NAME)
+        self.ui.btn_add.clicked.connect(self.add_items)
+        self.ui.btn_clear.clicked.connect(self.clear_items)
+        self.ui.btn_delete.clicked.connect(self.delete_items)
+        self.ui.cal_doa.setMaximumDate(QDate.currentDate())
+        self.ui.cal_dom.setMaximumDate(QDate.currentDate())
+        patch_types(self.ui.cmb_type, Item.TYPE_LIST)
+        Item.EVENTS.subscribe(self.on_event)
+
+        self.model = ItemTableModel()
+        self.ui.tbl_items.setModel(self.model)
+        self.ui.tbl_items.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.ui.tbl_items.horizontalHeader().setResizeContentsPrecision(RESIZE_PRECISION)
+        self.ui.tbl_items.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.ui.tbl_items.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.ui.tbl_items.horizontalHeader().setStretchLastSection(True)
+        # Clicking a column header sorts the table by it, and the table starts out in the order the items were added
+        self.ui.tbl_items.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.ui.tbl_items.setSortingEnabled(True)
+        my_font = QFont()
+        my_font.setBold(True)
+        self.ui.tbl_items.horizontalHeader().setFont(my_font)
+
+        self.load_items()
+
+    # Loads the items in the view table
+    # The table model reads the items straight from the ITEM_LIST, so only the rows on screen are ever formatted, and
+    # follows the changes to it, so the table only has to be shown again when the items are loaded again
+    def load_items(self) -> None:
+        Item.load_from_file()
+
+    # The on_event method adds any new types to the combo box
+    def on_event(self, event: Event) -> None:
+        if event.kind == TYPES_CHANGED:
+            patch_types(self.ui.cmb_type, event.items)
+
+    # When the window is shown again the form is emptied and the items are loaded again if the files were changed
+    def refresh(self) -> None:
+        self.clear_items()
+        self.load_items()
+
+    # This method validates the user input by ensuring that the title and description fields have been filled
+    # The validation also ensures that the date of manufacture is not after the date added to collection
+    def is_valid_input(self) -> bool:
+        is_valid = True
+        if not self.ui.txt_title.text():
+            self._error_message += "Item title is missing.\n"
+            is_valid = False
+        if not self.ui.txt_description.text():
+            self._error_message += "Item description is missing.\n"
+            is_valid = False
+        if self.ui.cal_dom.selectedDate() > self.ui.cal_doa.selectedDate():
+            self._error_message += "Date of Manufacture must not be after Date Added to Collection.\n"
+            is_valid = False
+        print(self._error_message)
+        return is_valid
+
+    def add_items(self) -> None:
+
+        # Shows any error messages to the user
+        if not self.is_valid_input():
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Critical)
+            msg.setText(self._error_message)
+            msg.setGeometry(225, 250, 300, 300)
+            msg.setWindowTitle("Error in Entry")
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            self._error_message = ""
+            return
+
+        # Adding the item entered by the user to the Item class
+        # After entering the item, it is added to the items.json file and the table shows its new row.
+        # The form is also emptied allowing to user to enter another item
+        title = self.ui.txt_title.text()
+        item_type = self.ui.cmb_type.currentText()
+        doa = self.ui.cal_doa.selectedDate().toPyDate()
+        dom = self.ui.cal_dom.selectedDate().toPyDate()
+        description = self.ui.txt_description.text()
+        item = Item(title, item_type, doa, dom, description)
+        Item.save_change("add", item)
+        self.clear_items()
+
+    # The clear_items method is used to clear the form view and reset the dates to the current date
+    # This method is run when the user presses the clear button or when the user adds a new item to the list
+    def clear_items(self) -> None:
+        self.ui.txt_title.clear()
+        self.ui.cmb_type.setCurrentIndex(0)
+        self.ui.txt_description.clear()
+        self.ui.cal_doa.setSelectedDate(QDate.currentDate())
+        self.ui.cal_dom.setSelectedDate(QDate.currentDate())
+
+    # The delete_items method is used to delete items in the table by pressing the delete button.
+    # All the selected items are deleted together and an error message is displayed if no items are selected
+    def delete_items(self) -> None:
+        rows = sorted(set(index.row() for index in
+                          self.ui.tbl_items.selectedIndexes()))
+
+        if len(rows) < 1:
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Warning)
+            msg.setGeometry(225, 250, 300, 300)
+            msg.setText("Please select an item to delete")
+            msg.setWindowTitle("No Item Selected")
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            return
+
+        ask = QMessageBox()
+        ask.setIcon(QMessageBox.Question)
+        ask.setGeometry(175, 250, 300, 300)
+        ask.setText("Are you sure you want to delete this item" if len(rows) == 1 else
+                    f"Are you sure you want to delete these {len(rows)} items")
+        ask.setWindowTitle("Deleting item")
+        ask.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        ask.activateWindow()
+        user_choice = ask.exec_()
+
+        if user_choice == QMessageBox.No:
+            return
+
+        # The selected rows are turned into the ids of the items shown in them, and all the items are deleted in a
+        # single pass over the collection and saved at once. The table takes out their rows itself
+        Item.delete_many(self.model.ids(rows))
+
+
+# The LoginWindow class allows the user to enter their name/username so that it is displayed at the top of all screens
+# Thus this class is only performed the first time that the program is run
+class LoginWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.ui = load_ui("startup", self)
+        self.setGeometry(0, 0, 700, 700)
+        self.build_ui()
+        self._error_message = ""
+
+    # The is_valid_method function confirms that user has not left the name field empty
+    def is_valid_input(self) -> bool:
+        is_valid = True
+        if not self.ui.txt_name.text():
+            self._error_message += "Name is missing.\n"
+            is_valid = False
+
+        return is_valid
+
+    def build_ui(self):
+        self.ui.btn_name.clicked.connect(self.name_save)
+
+    def refresh(self) -> None:
+        self.ui.txt_name.clear()
+
+    def name_save(self) -> None:
+        if not self.is_valid_input():
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Critical)
+            msg.setText(self._error_message)
+            msg.setGeometry(225, 250, 300, 300)
+            msg.setWindowTitle("Error in Entry")
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            self._error_message = ""
+            return
+
+        # The entered name is saved to the class variable NAME when the button is pressed.
+        # The name is then stored in the name.json file, or in whichever storage the collection is kept
+        Item.NAME = self.ui.txt_name.text()
+        Item.save_name()
+        Item.load_name()
+
+        # After storing the name the MenuWindow class is called and the user is shown the program's main menu
+        # The LoginWindow is closed at the same time
+        WINDOWS.show(MenuWindow)
+        LoginWindow.close(self)
+
+
+# The EditWindow class is the view that allows the user to choose which item to edit.
+# Users also have the option to delete items from this view
+# In this view all the items are loaded in a table and the user has two buttons
+# 1. Edit
+# 2. Delete
+class EditWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.ui = load_ui("edit_items", self)
+        self.setGeometry(0, 0, 700, 700)
+        self.build_ui()
+
+    def build_ui(self):
+        self.ui.lbl_name.setText(Item.NAME)
+        self.ui.btn_delete.clicked.connect(self.delete_items)
+        self.ui.btn_edit.clicked.connect(self.edit_items)
+        self.model = ItemTableModel()
+        self.ui.tbl_items.setModel(self.model)
+        self.ui.tbl_items.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.ui.tbl_items.horizontalHeader().setResizeContentsPrecision(RESIZE_PRECISION)
+        self.ui.tbl_items.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.ui.tbl_items.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.ui.tbl_items.horizontalHeader().setStretchLastSection(True)
+        # Clicking a column header sorts the table by it, and the table starts out in the order the items were added
+        self.ui.tbl_items.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.ui.tbl_items.setSortingEnabled(True)
+        my_font = QFont()
+        my_font.setBold(True)
+        self.ui.tbl_items.horizontalHeader().setFont(my_font)
+
+        self.load_items()
+
+    # Method to load the items
+    # The table follows the changes to the ITEM_LIST, so it only has to be shown again when the items are loaded again
+    def load_items(self) -> None:
+        Item.load_from_file()
+
+    def refresh(self) -> None:
+        self.load_items()
+
+    # Method to delete all the selected items
+    def delete_items(self) -> None:
+        rows = sorted(set(index.row() for index in
+                          self.ui.tbl_items.selectedIndexes()))
+
+        if len(rows) < 1:
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Warning)
+            msg.setGeometry(225, 250, 300, 300)
+            msg.setText("Please select an item to delete")
+            msg.setWindowTitle("No Item Selected")
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            return
+
+        ask = QMessageBox()
+        ask.setIcon(QMessageBox.Question)
+        ask.setGeometry(175, 250, 300, 300)
+        ask.setText("Are you sure you want to delete this item" if len(rows) == 1 else
+                    f"Are you sure you want to delete these {len(rows)} items")
+        ask.setWindowTitle("Deleting item")
+        ask.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        ask.activateWindow()
+        user_choice = ask.exec_()
+
+        if user_choice == QMessageBox.No:
+            return
+
+        # The selected rows are turned into the ids of the items shown in them, and all the items are deleted in a
+        # single pass over the collection and saved at once. The table takes out their rows itself
+        Item.delete_many(self.model.ids(rows))
+
+    # In the edit_items method, the item selected by the user is handed to the following view called from this function
+    # so that it can be edited there
+    # This method also displays an error message if an item has not been selected
+    def edit_items(self) -> None:
+        rows = sorted(set(index.row() for index in
+                          self.ui.tbl_items.selectedIndexes()))
+
+        if len(rows) < 1:
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Warning)
+            msg.setGeometry(225, 250, 300, 300)
+            msg.setText("Please select an item to edit")
+            msg.setWindowTitle("No Item Selected")
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            return
+
+        # When several items are selected they are all given the type chosen by the user, saved at once
+        if len(rows) > 1:
+            self.edit_many(rows)
+            return
+
+        # The Item shown in the selected row is taken from the table model.
+        # The row cannot be turned into an id by adding one since deleted items leave gaps in the ids
+        item = self.model.item(rows[0])
+
+        # The view where the user actually edits the item is called and the current view is temporarily closed
+        WINDOWS.show(EditorWindow, item)
+        EditWindow.close(self)
+
+    # The edit_many method asks the user for a new type and gives it to all the items in the given rows
+    def edit_many(self, rows: List[int]) -> None:
+        item_type, ok = QInputDialog.getItem(self, "Editing items", f"New type for the {len(rows)} selected items",
+                                             Item.TYPE_LIST, 0, False)
+        if not ok:
+            return
+        Item.set_field(self.model.ids(rows), "item_type", item_type)
+
+
+# EditorWindow is the class that loads the selected item and allows the user to edit any field and save the changes
+class EditorWindow(QMainWindow):
+    def __init__(self, item: Item):
+        super().__init__()
+        self.item: Item = item
+        self.ui = load_ui("editor", self)
+        self.build_ui()
+        self.setGeometry(0, 0, 700, 700)
+        self._error_message = ""
+
+    def build_ui(self):
+        self.ui.lbl_name.setText(Item.NAME)
+        self.ui.cal_doa.setMaximumDate(QDate.currentDate())
+        self.ui.cal_dom.setMaximumDate(QDate.currentDate())
+
+        self.ui.btn_edit.clicked.connect(self.editor)
+        self.ui.btn_clear.clicked.connect(self.clear_items)
+        patch_types(self.ui.cmb_type, Item.TYPE_LIST)
+        Item.EVENTS.subscribe(self.on_event)
+        self.refresh()
+
+    # The on_event method adds any new types to the combo box
+    def on_event(self, event: Event) -> None:
+        if event.kind == TYPES_CHANGED:
+            patch_types(self.ui.cmb_type, event.items)
+
+    # The fields are filled in by the contents of the item being edited, which is replaced by the given item if any
+    # This is done every time the window is shown, since the same window is used to edit every item
+    def refresh(self, item: Item = None) -> None:
+        if item is not None:
+            self.item = item
+        self.ui.txt_title.setText(self.item.title)
+        self.ui.cmb_type.setCurrentText(self.item.item_type)
+        self.ui.cal_doa.setSelectedDate(self.item.doa)
+        self.ui.cal_dom.setSelectedDate(self.item.dom)
+        self.ui.txt_description.setText(self.item.description)
+
+    # The program verifies the new inputs by the user to ensure that no field is left empty
+    # The validation also ensures that the date of manufacture is not after the date added to collection
+    def is_valid_input(self) -> bool:
+        is_valid = True
+        if not self.ui.txt_title.text():
+            self._error_message += "Item title is missing.\n"
+            is_valid = False
+        if not self.ui.txt_description.text():
+            self._error_message += "Item description is missing.\n"
+            is_valid = False
+        if self.ui.cal_dom.selectedDate() > self.ui.cal_doa.selectedDate():
+            self._error_message += "Date of Manufacture must not be after Date Added to Collection.\n"
+            is_valid = False
+
+        return is_valid
+
+    def editor(self) -> None:
+
+        if not self.is_valid_input():
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Critical)
+            msg.setGeometry(225, 250, 300, 300)
+            msg.setText(self._error_message)
+            msg.setWindowTitle("Error in Entry")
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            self._error_message = ""
+            return
+
+        # The contents of the item being edited are then overwritten by the new contents inputted by the user
+        # The tables are told about all the fields changed at once, so that they only show the row again once
+        # The new item item is then saved to file
+        with Item.EVENTS.batch():
+            self.item.title = self.ui.txt_title.text()
+            self.item.item_type = self.ui.cmb_type.currentText()
+            self.item.doa = self.ui.cal_doa.selectedDate().toPyDate()
+            self.item.dom = self.ui.cal_dom.selectedDate().toPyDate()
+            self.item.description = self.ui.txt_description.text()
+        Item.save_change("edit", self.item)
+        self.clear_items()
+
+        # The EditorWindow view is closed and the edit view is shown again
+        # When calling the EditWindow the items are loaded again and the changes are implemented instantly
+        EditorWindow.close(self)
+        edit_items_window()
+
+    def clear_items(self) -> None:
+        self.ui.txt_title.clear()
+        self.ui.cmb_type.setCurrentIndex(0)
+        self.ui.txt_description.clear()
+        self.ui.cal_doa.setSelectedDate(QDate.currentDate())
+        self.ui.cal_dom.setSelectedDate(QDate.currentDate())
+
+
+# The ShowWindow class allows the user to view all the items in a chosen category
+# This view contains a drop down menu that allows the user to select one of the categories and a search button which
+# when pressed performs the search
+class ShowWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.ui = load_ui("show_items", self)
+        self.setGeometry(0, 0, 700, 700)
+        self.build_ui()
+
+    def build_ui(self):
+        self.ui.lbl_name.setText(Item.NAME)
+        patch_types(self.ui.cmb_item_type, Item.TYPE_LIST)
+        self.ui.cmb_item_type.addItem("All Types", None)
+        Item.EVENTS.subscribe(self.on_event)
+        self.ui.btn_search.clicked.connect(self.load_items)
+        self.ui.txt_search.returnPressed.connect(self.load_items)
+        self.model = ItemTableModel([])
+        self.ui.tbl_items.setModel(self.model)
+        self.ui.tbl_items.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.ui.tbl_items.horizontalHeader().setResizeContentsPrecision(RESIZE_PRECISION)
+        self.ui.tbl_items.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.ui.tbl_items.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.ui.tbl_items.horizontalHeader().setStretchLastSection(True)
+        # Clicking a column header sorts the table by it, and the table starts out in the order the items were added
+        self.ui.tbl_items.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.ui.tbl_items.setSortingEnabled(True)
+        my_font = QFont()
+        my_font.setBold(True)
+        self.ui.tbl_items.horizontalHeader().setFont(my_font)
+
+        self.load_items()
+
+    # Loading all the items
+    # This method is run when the view is loaded and when the search button is pressed.
+    # Thus, by default, when initially loading the screen, the items shown will be those corresponding to the first
+    # value in the combo box
+    def load_items(self) -> None:
+        Item.load_from_file()
+        self.show_type_counts()
+        # After loading all items from file, the program only displays the items whose type matches the type selected in
+        # the combo box. These are found through the type index without going through all the items
+        # If words are entered in the search box, only the items whose title or description contain them are shown, best
+        # match first. These are found through the search index
+        # The table is also given the test which an item has to pass to be shown, so that it can take in the items added
+        # or edited later on without searching again. Such items are shown after the best matches
+        item_type = self.ui.cmb_item_type.currentData()
+        query = self.ui.txt_search.text()
+        prefixes = set(tokenize(query))
+
+        def accepts(x: Item) -> bool:
+            if item_type is not None and x.item_type != item_type:
+                return False
+            words = tokenize(x.title + " " + x.description)
+            return all(any(word.startswith(prefix) for word in words) for prefix in prefixes)
+
+        if prefixes:
+            items = [x for x in Item.search(query) if item_type is None or x.item_type == item_type]
+        elif item_type is None:
+            items = Item.ITEM_LIST
+        else:
+            items = Item.by_type(item_type)
+        self.model.refresh(items, accepts)
+
+    # The show_type_counts method shows the number of items of each type next to the type in the combo box
+    # The type itself is kept as the data of each combo box entry, with None standing for all the types
+    def show_type_counts(self) -> None:
+        for index in range(self.ui.cmb_item_type.count()):
+            item_type = self.ui.cmb_item_type.itemData(index)
+            count = len(Item.ITEM_LIST) if item_type is None else Item.count_by_type(item_type)
+            name = "All Types" if item_type is None else item_type
+            self.ui.cmb_item_type.setItemText(index, f"{name} ({count})")
+
+    # The on_event method keeps the combo box up to date with the changes to the collection. The table follows the
+    # changes itself, except when all the items were loaded again, in which case the items are searched again
+    def on_event(self, event: Event) -> None:
+        if event.kind == RESET:
+            self.load_items()
+        elif event.kind == TYPES_CHANGED:
+            patch_types(self.ui.cmb_item_type, event.items)
+            self.show_type_counts()
+        elif event.kind in (ADDED, REMOVED) or (event.kind == UPDATED and "item_type" in event.fields):
+            self.show_type_counts()
+
+    # When the window is shown again the items are loaded again if the files were changed
+    def refresh(self) -> None:
+        self.load_items()
+
+
+# The TypeWindow class allows the user to add a new type to the list
+# The view contains an add button and a clear button
+class TypeWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.ui = load_ui("add_types", self)
+        self.build_ui()
+        self.setGeometry(0, 0, 700, 700)
+        self._error_message = ""
+
+    def build_ui(self):
+        self.ui.lbl_name.setText(Item.NAME)
+        self.ui.btn_add.clicked.connect(self.add_types)
+        self.ui.btn_clear.clicked.connect(self.clear_items)
+
+    # Validation check to ensure that the type field is not left empty
+    def is_valid_input(self) -> bool:
+        is_valid = True
+        if not self.ui.txt_type.text():
+            self._error_message += "Item type is missing.\n"
+            is_valid = False
+
+        return is_valid
+
+    # Method to add a new category for the items
+    def add_types(self):
+
+        if not self.is_valid_input():
+            msg = QMessageBox()
+            msg.setIcon(QMessageBox.Critical)
+            msg.setGeometry(225, 250, 300, 300)
+            msg.setText(self._error_message)
+            msg.setWindowTitle("Error in Entry")
+            msg.setStandardButtons(QMessageBox.Ok)
+            msg.exec_()
+            self._error_message = ""
+            return
+
+        # The entered type is stored in a variable and then added to the Item class variable TYPE_LIST
+        # The file type.json is overwritten with the new contents in TYPE_LIST
+        type_add = self.ui.txt_type.text()
+        Item.TYPE_LIST.append(type_add)
+        Item.save_types()
+        self.clear_items()
+
+    # Clearing the type field
+    def clear_items(self) -> None:
+        self.ui.txt_type.clear()
+
+    def refresh(self) -> None:
+        self.clear_items()
+
+
+# The StatisticsWindow class shows the number of items in the collection, and the number of items of every type, added
+# in every month and manufactured in every decade, in three tables
+# The statistics are kept up to date by the collection as it changes (see ItemCollection/statistics.py), so showing
+# them never goes through the items. While the window is shown the tables are filled again after every change which
+# moves a count
+class StatisticsWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.ui = load_ui("statistics", self)
+        self.setGeometry(0, 0, 700, 700)
+        self.build_ui()
+
+    def build_ui(self):
+        self.ui.lbl_name.setText(Item.NAME)
+        my_font = QFont()
+        my_font.setBold(True)
+        for table, heading in ((self.ui.tbl_types, "Type"), (self.ui.tbl_months, "Month Added"),
+                               (self.ui.tbl_decades, "Decade Made")):
+            table.setColumnCount(2)
+            table.setHorizontalHeaderLabels([heading, "Items"])
+            table.verticalHeader().setVisible(False)
+            table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+            table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+            table.horizontalHeader().setFont(my_font)
+        Item.EVENTS.subscribe(self.on_event)
+        self.show_statistics()
+
+    # The show_statistics method fills the tables with the statistics of the collection
+    # When the items have not been loaded yet, the statistics saved with the collection are shown if they are still
+    # those of the saved items, so the window opens without loading the collection. Otherwise the collection is loaded,
+    # which does nothing if the items in memory are already up to date
+    def show_statistics(self) -> None:
+        summary = None
+        if not Item.CACHE.matches(Item.STORAGE.signature()) and (Item.SAVER is None or not Item.SAVER.busy()):
+            summary = Item.STORAGE.load_statistics()
+        if summary is None:
+            Item.load_from_file()
+            summary = Item.summary()
+
+        self.ui.lbl_total.setText(f"{summary['items']:,} items")
+        for table, counts in ((self.ui.tbl_types, summary["by_type"]), (self.ui.tbl_months, summary["by_month"]),
+                              (self.ui.tbl_decades, summary["by_decade"])):
+            table.setRowCount(len(counts))
+            for row, (key, count) in enumerate(counts.items()):
+                table.setItem(row, 0, QTableWidgetItem(key))
+                count_item = QTableWidgetItem(f"{count:,}")
+                count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, 1, count_item)
+
+    # The on_event method shows the statistics again after a change which moves a count, but only while the window is
+    # shown, since it is refreshed anyway when it is shown again
+    def on_event(self, event: Event) -> None:
+        if not self.isVisible() or event.kind == TYPES_CHANGED:
+            return
+        if event.kind == UPDATED and not event.fields & {"item_type", "doa", "dom"}:
+            return
+        self.show_statistics()
+
+    def refresh(self) -> None:
+        self.show_statistics()
+
+
+# The SaveNotifier class passes the results of the background saves on to the GUI thread
+# The saves are written on a background thread, which must not touch any window, so they only emit a signal and Qt
+# delivers it to the slots on the GUI thread
+class SaveNotifier(QObject):
+    saved = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.saved.connect(self.show_saved)
+        self.failed.connect(self.show_failed)
+
+    # The show_saved method shows a short message in the status bar of the window the user is working in
+    @staticmethod
+    def show_saved() -> None:
+        window = QApplication.activeWindow()
+        if isinstance(window, QMainWindow):
+            window.statusBar().showMessage("Collection saved", 2000)
+
+    # The show_failed method tells the user that their changes could not be saved
+    @staticmethod
+    def show_failed(error: str) -> None:
+        msg = QMessageBox()
+        msg.setIcon(QMessageBox.Critical)
+        msg.setText(f"The collection could not be saved:\n{error}")
+        msg.setGeometry(225, 250, 300, 300)
+        msg.setWindowTitle("Error Saving")
+        msg.setStandardButtons(QMessageBox.Ok)
+        msg.exec_()
+
+
+# Function to show the window which allows the user to add new item
+def add_items_window() -> None:
+    WINDOWS.show(AddWindow)
+
+
+# Function to show the window which allows the user to add new types
+def add_type_window() -> None:
+    WINDOWS.show(TypeWindow)
+
+
+# Function to show the window which allows the user choose which item to edit and to delete items
+def edit_items_window() -> None:
+    WINDOWS.show(EditWindow)
+
+
+# Function to show the window which allows the user to show items by category
+def show_items_window() -> None:
+    WINDOWS.show(ShowWindow)
+
+
+# Function to show the window which shows the statistics of the collection
+def statistics_window() -> None:
+    WINDOWS.show(StatisticsWindow)
+
+
+# Function to exit program when exit button is pressed in the main menu
+def exit_app() -> None:
+    Item.flush()
+    exit()
+
+
+# Main function that runs the program
+def main() -> None:
+    app = QApplication(sys.argv)
+    Item.enable_journal()
+    Item.enable_snapshot()
+
+    # Saving is done on a background thread so that the windows never wait for the disk
+    notifier = SaveNotifier()
+    Item.enable_background_saving(on_saved=notifier.saved.emit,
+                                  on_failed=lambda error: notifier.failed.emit(str(error)))
+
+    # The name is loaded from the name.json file, if the file exists and has content in it
+    # If no name is found, then this is the first time the program is run and the login window is shown
+    # The main menu view is the loaded from the LoginWindow class not the main function
+    Item.load_name()
+    if Item.NAME is None:
+        WINDOWS.show(LoginWindow)
+    else:
+        # If the name is found, it is stored in the class variable NAME and the main menu screen is the first window
+        # shown to the user
+        WINDOWS.show(MenuWindow)
+
+    sys.exit(app.exec_())